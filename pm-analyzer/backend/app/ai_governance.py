@@ -12,20 +12,47 @@ Supports FDA 21 CFR Part 11 and EU GMP Annex 11 requirements for
 computerized system validation in regulated environments.
 """
 import os
+import csv
+import atexit
 import json
+import time
+import uuid
 import hashlib
 import sqlite3
 import logging
+import threading
+from collections import OrderedDict
+from io import StringIO
+from queue import Queue, Full, Empty
 from datetime import datetime
 from typing import Optional, Dict, List, Any, Tuple
 from functools import wraps
 
+from flask import Blueprint, Response, jsonify, request
+
 logger = logging.getLogger(__name__)
 
 # AI Governance Configuration
 APPROVED_MODELS = os.environ.get('APPROVED_AI_MODELS', 'gemini-pro,gemini-1.5-pro,gemini-1.5-flash,gemini-2.0-flash,gemini-2.5-pro,gemini-2.5-flash').split(',')
 AI_GOVERNANCE_ENABLED = os.environ.get('AI_GOVERNANCE_ENABLED', 'true').lower() == 'true'
 AI_USAGE_LOG_RETENTION_DAYS = int(os.environ.get('AI_USAGE_LOG_RETENTION_DAYS', '2555'))  # ~7 years default
+AI_USAGE_LOG_ASYNC = os.environ.get('AI_USAGE_LOG_ASYNC', 'true').lower() == 'true'
+AI_USAGE_LOG_QUEUE_SIZE = int(os.environ.get('AI_USAGE_LOG_QUEUE_SIZE', '10000'))
+AI_USAGE_LOG_BATCH_SIZE = 100
+AI_USAGE_LOG_FLUSH_TIMEOUT_SECONDS = float(os.environ.get('AI_USAGE_LOG_FLUSH_TIMEOUT_SECONDS', '5'))
+
+# Prompt template history cache (template_name -> (history, timestamp))
+PROMPT_HISTORY_CACHE_TTL_SECONDS = 30
+PROMPT_HISTORY_CACHE_MAX_ENTRIES = 256
+_prompt_history_cache: 'OrderedDict[str, Tuple[Tuple[Dict, ...], float]]' = OrderedDict()
+_prompt_history_lock = threading.Lock()
+# Bumped by every invalidation; a read that overlapped one does not store its result
+_prompt_history_generation = 0
+
+# Background AI usage log writer (hashing and inserts happen off the request thread)
+_usage_queue: Optional[Queue] = None
+_usage_worker: Optional[threading.Thread] = None
+_usage_worker_lock = threading.Lock()
 
 
 def get_governance_db_path() -> str:
@@ -150,9 +177,18 @@ def _get_db():
     return db
 
 
-def compute_hash(content: str) -> str:
-    """Compute SHA-256 hash of content for integrity verification."""
-    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+def compute_hash(*parts) -> str:
+    """
+    Compute SHA-256 hash of content for integrity verification.
+
+    Accepts one or more str/bytes parts which are fed to the hasher in order,
+    so compute_hash(a, b) == compute_hash(a + b) without building the
+    concatenated string first.
+    """
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode('utf-8') if isinstance(part, str) else part)
+    return h.hexdigest()
 
 
 # =============================================================================
@@ -196,6 +232,7 @@ def create_prompt_template(
 
         template_id = cursor.lastrowid
         db.commit()
+        _invalidate_prompt_history(template_name)
 
         logger.info(f"Created prompt template: {template_name} v{new_version} by {created_by}")
 
@@ -214,6 +251,14 @@ def create_prompt_template(
         db.close()
 
 
+# approval_type -> (new template status, whether approved_by/approved_at are set)
+_STATUS_BY_APPROVAL = {
+    'approval': ('approved', True),
+    'rejection': ('draft', False),
+    'review': ('pending_approval', False),
+}
+
+
 def approve_prompt_template(
     template_id: int,
     approver_id: str,
@@ -230,41 +275,42 @@ def approve_prompt_template(
     if not AI_GOVERNANCE_ENABLED:
         return True, None
 
+    if approval_type not in _STATUS_BY_APPROVAL:
+        return False, f"Invalid approval_type: {approval_type}"
+
     db = _get_db()
     try:
         cursor = db.cursor()
 
         # Create signature hash (combines user, time, content for integrity)
         timestamp = datetime.utcnow().isoformat()
-        signature_data = f"{approver_id}:{timestamp}:{approval_type}:{template_id}"
-        signature_hash = compute_hash(signature_data + password_hash)
+        signature_hash = compute_hash(
+            approver_id, ':', timestamp, ':', approval_type, ':', str(template_id), password_hash
+        )
 
-        cursor.execute('''
-            INSERT INTO prompt_approvals
-            (template_id, approver_id, approval_type, comments, signature_hash, ip_address)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (template_id, approver_id, approval_type, comments, signature_hash, ip_address))
+        new_status, sets_approval = _STATUS_BY_APPROVAL[approval_type]
+
+        # Approval row and status change succeed or fail together
+        with db:
+            cursor.execute('''
+                INSERT INTO prompt_approvals
+                (template_id, approver_id, approval_type, comments, signature_hash, ip_address)
+                VALUES (?, ?, ?, ?, ?, ?)
+                RETURNING id
+            ''', (template_id, approver_id, approval_type, comments, signature_hash, ip_address))
+            approval_id = cursor.fetchone()['id']
 
-        # Update template status based on approval
-        if approval_type == 'approval':
             cursor.execute('''
                 UPDATE prompt_templates
-                SET status = 'approved', approved_by = ?, approved_at = CURRENT_TIMESTAMP, effective_from = CURRENT_TIMESTAMP
+                SET status = ?,
+                    approved_by = CASE WHEN ? THEN ? ELSE approved_by END,
+                    approved_at = CASE WHEN ? THEN CURRENT_TIMESTAMP ELSE approved_at END,
+                    effective_from = CASE WHEN ? THEN CURRENT_TIMESTAMP ELSE effective_from END
                 WHERE id = ?
-            ''', (approver_id, template_id))
-        elif approval_type == 'rejection':
-            cursor.execute(
-                "UPDATE prompt_templates SET status = 'draft' WHERE id = ?",
-                (template_id,)
-            )
-        elif approval_type == 'review':
-            cursor.execute(
-                "UPDATE prompt_templates SET status = 'pending_approval' WHERE id = ?",
-                (template_id,)
-            )
+            ''', (new_status, sets_approval, approver_id, sets_approval, sets_approval, template_id))
 
-        db.commit()
-        logger.info(f"Prompt template {template_id} {approval_type} by {approver_id}")
+        _invalidate_prompt_history()
+        logger.info(f"Prompt template {template_id} {approval_type} by {approver_id} (approval {approval_id})")
         return True, None
 
     except Exception as e:
@@ -298,23 +344,60 @@ def get_active_prompt_template(template_name: str) -> Optional[Dict]:
         db.close()
 
 
+def _invalidate_prompt_history(template_name: str = None):
+    """Drop cached history for one template, or for all templates if no name is given."""
+    global _prompt_history_generation
+    with _prompt_history_lock:
+        _prompt_history_generation += 1
+        if template_name is None:
+            _prompt_history_cache.clear()
+        else:
+            _prompt_history_cache.pop(template_name, None)
+
+
 def get_prompt_template_history(template_name: str) -> List[Dict]:
-    """Get full version history of a prompt template."""
+    """
+    Get full version history of a prompt template.
+
+    Results are cached for PROMPT_HISTORY_CACHE_TTL_SECONDS and invalidated
+    whenever a template is created or approved in this process. The cache is
+    per worker process: another worker may serve its cached history for up to
+    the TTL after a change made elsewhere. Callers get copies of the entries.
+    """
+    now = time.monotonic()
+    with _prompt_history_lock:
+        cached = _prompt_history_cache.get(template_name)
+        if cached and now - cached[1] < PROMPT_HISTORY_CACHE_TTL_SECONDS:
+            _prompt_history_cache.move_to_end(template_name)
+            return [dict(entry) for entry in cached[0]]
+        generation = _prompt_history_generation
+
     db = _get_db()
     try:
         cursor = db.cursor()
         cursor.execute('''
-            SELECT t.*,
-                   (SELECT COUNT(*) FROM prompt_approvals WHERE template_id = t.id) as approval_count
+            SELECT t.*, COALESCE(a.cnt, 0) as approval_count
             FROM prompt_templates t
-            WHERE template_name = ?
-            ORDER BY version DESC
+            LEFT JOIN (
+                SELECT template_id, COUNT(*) as cnt FROM prompt_approvals GROUP BY template_id
+            ) a ON a.template_id = t.id
+            WHERE t.template_name = ?
+            ORDER BY t.version DESC
         ''', (template_name,))
 
-        return [dict(row) for row in cursor.fetchall()]
+        history = tuple(dict(row) for row in cursor.fetchall())
     finally:
         db.close()
 
+    with _prompt_history_lock:
+        # Skip the store if a template changed while reading: history may be stale
+        if generation == _prompt_history_generation:
+            _prompt_history_cache[template_name] = (history, now)
+            _prompt_history_cache.move_to_end(template_name)
+            while len(_prompt_history_cache) > PROMPT_HISTORY_CACHE_MAX_ENTRIES:
+                _prompt_history_cache.popitem(last=False)
+    return [dict(entry) for entry in history]
+
 
 # =============================================================================
 # AI USAGE LOGGING
@@ -322,8 +405,130 @@ def get_prompt_template_history(template_name: str) -> List[Dict]:
 
 def generate_request_id() -> str:
     """Generate a unique request ID for AI usage tracking."""
-    import uuid
-    return str(uuid.uuid4())
+    return uuid.uuid4().hex
+
+
+def _build_usage_row(entry: Tuple) -> Tuple:
+    """Turn a raw usage entry into an ai_usage_log row (hashes + previews)."""
+    (request_id, model_id, template_name, template_version, user_id, session_id,
+     input_data, output_data, tokens_input, tokens_output, latency_ms, status,
+     error_message, context_type, context_id, ip_address, user_agent) = entry
+
+    # Compute hashes for input/output integrity
+    input_hash = compute_hash(input_data) if input_data else None
+    output_hash = compute_hash(output_data) if output_data else None
+
+    # Create preview (first 500 chars) for quick review without exposing full data
+    input_preview = input_data[:500] if input_data else None
+    output_preview = output_data[:500] if output_data else None
+
+    return (
+        request_id, model_id, template_name, template_version, user_id, session_id,
+        input_hash, input_preview, output_hash, output_preview,
+        tokens_input, tokens_output, latency_ms, status, error_message,
+        context_type, context_id, ip_address, user_agent
+    )
+
+
+_INSERT_USAGE_SQL = '''
+    INSERT INTO ai_usage_log
+    (request_id, model_id, template_name, template_version, user_id, session_id,
+     input_hash, input_preview, output_hash, output_preview,
+     tokens_input, tokens_output, latency_ms, status, error_message,
+     context_type, context_id, ip_address, user_agent)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+def _write_usage_entries(entries: List[Tuple]) -> bool:
+    """Hash and insert a batch of usage entries in a single transaction."""
+    db = _get_db()
+    try:
+        rows = [_build_usage_row(entry) for entry in entries]
+        try:
+            with db:
+                db.executemany(_INSERT_USAGE_SQL, rows)
+            return True
+        except sqlite3.Error:
+            if len(rows) == 1:
+                raise
+            # One bad row must not drop the rest of the batch
+            ok = True
+            for row in rows:
+                try:
+                    with db:
+                        db.execute(_INSERT_USAGE_SQL, row)
+                except sqlite3.Error as e:
+                    logger.error(f"Failed to log AI usage {row[0]}: {e}")
+                    ok = False
+            return ok
+
+    except Exception as e:
+        logger.error(f"Failed to log AI usage: {e}")
+        return False
+    finally:
+        db.close()
+
+
+def _usage_log_worker():
+    """Drain the usage queue, writing entries in batches."""
+    while True:
+        items = [_usage_queue.get()]
+        while len(items) < AI_USAGE_LOG_BATCH_SIZE:
+            try:
+                items.append(_usage_queue.get_nowait())
+            except Empty:
+                break
+        try:
+            entries = [item for item in items if not isinstance(item, threading.Event)]
+            if entries:
+                _write_usage_entries(entries)
+        finally:
+            # Flush markers are released only after everything queued before them is written
+            for item in items:
+                if isinstance(item, threading.Event):
+                    item.set()
+                _usage_queue.task_done()
+
+
+def _ensure_usage_worker():
+    """Start the background usage log writer on first use."""
+    global _usage_queue, _usage_worker
+    if _usage_worker is not None:
+        return
+    with _usage_worker_lock:
+        if _usage_worker is None:
+            _usage_queue = Queue(maxsize=AI_USAGE_LOG_QUEUE_SIZE)
+            _usage_worker = threading.Thread(
+                target=_usage_log_worker, name='ai-usage-log-writer', daemon=True
+            )
+            _usage_worker.start()
+            atexit.register(flush_ai_usage_log)
+
+
+def flush_ai_usage_log(timeout: float = None) -> bool:
+    """
+    Wait until the AI usage entries queued before this call have been written.
+
+    Entries logged by other threads while waiting are not waited for. Returns
+    False if they were not all written within timeout seconds
+    (AI_USAGE_LOG_FLUSH_TIMEOUT_SECONDS by default).
+    """
+    if _usage_queue is None:
+        return True
+    if timeout is None:
+        timeout = AI_USAGE_LOG_FLUSH_TIMEOUT_SECONDS
+    deadline = time.monotonic() + timeout
+    marker = threading.Event()
+    try:
+        _usage_queue.put(marker, timeout=timeout)
+    except Full:
+        logger.warning("AI usage log queue full, flush timed out")
+        return False
+    if not marker.wait(max(0.0, deadline - time.monotonic())):
+        logger.warning("AI usage log flush timed out after %.1fs", timeout)
+        return False
+    return True
 
 
 def log_ai_usage(
@@ -350,44 +555,29 @@ def log_ai_usage(
 
     This creates an immutable audit record of all AI interactions,
     supporting FDA 21 CFR Part 11 requirements for electronic records.
+
+    With AI_USAGE_LOG_ASYNC enabled the raw entry is queued and hashed and
+    persisted by a background writer; if the queue is full the entry is
+    written synchronously so no audit record is dropped.
     """
     if not AI_GOVERNANCE_ENABLED:
         return True
 
-    db = _get_db()
-    try:
-        cursor = db.cursor()
-
-        # Compute hashes for input/output integrity
-        input_hash = compute_hash(input_data) if input_data else None
-        output_hash = compute_hash(output_data) if output_data else None
+    entry = (
+        request_id, model_id, template_name, template_version, user_id, session_id,
+        input_data, output_data, tokens_input, tokens_output, latency_ms, status,
+        error_message, context_type, context_id, ip_address, user_agent
+    )
 
-        # Create preview (first 500 chars) for quick review without exposing full data
-        input_preview = input_data[:500] if input_data else None
-        output_preview = output_data[:500] if output_data else None
+    if AI_USAGE_LOG_ASYNC:
+        _ensure_usage_worker()
+        try:
+            _usage_queue.put_nowait(entry)
+            return True
+        except Full:
+            logger.warning("AI usage log queue full, writing synchronously")
 
-        cursor.execute('''
-            INSERT INTO ai_usage_log
-            (request_id, model_id, template_name, template_version, user_id, session_id,
-             input_hash, input_preview, output_hash, output_preview,
-             tokens_input, tokens_output, latency_ms, status, error_message,
-             context_type, context_id, ip_address, user_agent)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            request_id, model_id, template_name, template_version, user_id, session_id,
-            input_hash, input_preview, output_hash, output_preview,
-            tokens_input, tokens_output, latency_ms, status, error_message,
-            context_type, context_id, ip_address, user_agent
-        ))
-
-        db.commit()
-        return True
-
-    except Exception as e:
-        logger.error(f"Failed to log AI usage: {e}")
-        return False
-    finally:
-        db.close()
+    return _write_usage_entries([entry])
 
 
 def get_ai_usage_logs(
@@ -403,7 +593,12 @@ def get_ai_usage_logs(
 ) -> List[Dict]:
     """
     Retrieve AI usage logs with filtering for audit purposes.
+
+    Background writes queued before the call are flushed first, waiting at
+    most AI_USAGE_LOG_FLUSH_TIMEOUT_SECONDS, so audits see those entries.
     """
+    flush_ai_usage_log()
+
     db = _get_db()
     try:
         cursor = db.cursor()
@@ -564,8 +759,9 @@ def log_config_change(
         signature_hash = None
         if password_hash:
             timestamp = datetime.utcnow().isoformat()
-            signature_data = f"{changed_by}:{timestamp}:{config_name}:{json.dumps(config_value)}"
-            signature_hash = compute_hash(signature_data + password_hash)
+            signature_hash = compute_hash(
+                changed_by, ':', timestamp, ':', config_name, ':', json.dumps(config_value), password_hash
+            )
 
         config_value_str = json.dumps(config_value) if not isinstance(config_value, str) else config_value
 
@@ -623,8 +819,6 @@ def governed_ai_call(
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            import time
-
             # Extract model from kwargs or use default
             model_id = kwargs.get('model', 'gemini-pro')
 
@@ -703,8 +897,6 @@ def governed_ai_call(
 
 def create_governance_blueprint():
     """Create Flask blueprint for AI governance endpoints."""
-    from flask import Blueprint, jsonify, request
-
     governance_blueprint = Blueprint('ai_governance', __name__)
 
     @governance_blueprint.route('/prompts', methods=['GET'])
@@ -757,8 +949,6 @@ def create_governance_blueprint():
     @governance_blueprint.route('/usage-logs', methods=['GET'])
     def get_usage_logs():
         """Get AI usage logs for audit."""
-        from datetime import datetime
-
         start_date = request.args.get('start_date')
         end_date = request.args.get('end_date')
         user_id = request.args.get('user_id')
@@ -827,10 +1017,6 @@ def create_governance_blueprint():
     @governance_blueprint.route('/export/csv', methods=['GET'])
     def export_usage_csv():
         """Export AI usage logs as CSV for validation documentation."""
-        import csv
-        from io import StringIO
-        from flask import Response
-
         logs = get_ai_usage_logs(limit=10000)
 
         output = StringIO()
@@ -11,12 +11,40 @@ for SAP BTP deployment including:
 
 import os
 import json
+import time
+import atexit
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+from functools import wraps
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# orjson decodes VCAP/token/destination payloads faster; stdlib json is the fallback
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _JSON_DECODE_ERRORS = (orjson.JSONDecodeError, json.JSONDecodeError)
+except ImportError:
+    _json_loads = json.loads
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+
+# VCAP_* variables are fixed for the lifetime of a CF process, so parsed
+# values are cached and only re-parsed if the raw environment string changes.
+_UNSET = object()
+_vcap_cache: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+_service_config_cache: Dict[str, Any] = {}
+
+# XSUAA client-credentials tokens ((xsuaa url, client id) -> (token, expiry))
+# and fetched destinations (name -> (destination, expiry)), on time.monotonic().
+TOKEN_EXPIRY_MARGIN_SECONDS = 30
+_token_cache: Dict[Tuple[str, str], Tuple[str, float]] = {}
+_destination_cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
+
+_http_session = None
+_aiohttp_session = None
+
 
 @dataclass
 class XSUAAConfig:
@@ -51,30 +79,66 @@ class DatabaseConfig:
 
 
 def is_cf_environment() -> bool:
-    """Check if running in Cloud Foundry environment"""
+    """
+    Check if running in Cloud Foundry environment.
+
+    Not cached: two environment lookups are cheaper than a cache, and the
+    result always follows the current environment (like _parse_vcap).
+    """
     return 'VCAP_SERVICES' in os.environ or 'VCAP_APPLICATION' in os.environ
 
 
+def reset_btp_cache():
+    """Clear cached VCAP parses, service configs, tokens and destinations (e.g. in tests)."""
+    _vcap_cache.clear()
+    _service_config_cache.clear()
+    _token_cache.clear()
+    _destination_cache.clear()
+
+
+def _parse_vcap(var_name: str) -> Dict[str, Any]:
+    """Parse a VCAP_* environment variable, reusing the cached result if unchanged."""
+    raw = os.environ.get(var_name, '{}')
+    cached = _vcap_cache.get(var_name)
+    if cached is not None and cached[0] == raw:
+        return cached[1]
+
+    try:
+        parsed = _json_loads(raw)
+    except _JSON_DECODE_ERRORS:
+        logger.error(f"Failed to parse {var_name}")
+        parsed = {}
+
+    _vcap_cache[var_name] = (raw, parsed)
+    if var_name == 'VCAP_SERVICES':
+        _service_config_cache.clear()
+    return parsed
+
+
+def _memoize_service_config(func):
+    """Cache a service config derived from VCAP_SERVICES until the bindings change."""
+    @wraps(func)
+    def wrapper():
+        get_vcap_services()  # drops derived configs if VCAP_SERVICES changed
+        result = _service_config_cache.get(func.__name__, _UNSET)
+        if result is _UNSET:
+            result = func()
+            _service_config_cache[func.__name__] = result
+        return result
+    return wrapper
+
+
 def get_vcap_services() -> Dict[str, Any]:
     """Get VCAP_SERVICES environment variable as dictionary"""
-    vcap_services = os.environ.get('VCAP_SERVICES', '{}')
-    try:
-        return json.loads(vcap_services)
-    except json.JSONDecodeError:
-        logger.error("Failed to parse VCAP_SERVICES")
-        return {}
+    return _parse_vcap('VCAP_SERVICES')
 
 
 def get_vcap_application() -> Dict[str, Any]:
     """Get VCAP_APPLICATION environment variable as dictionary"""
-    vcap_app = os.environ.get('VCAP_APPLICATION', '{}')
-    try:
-        return json.loads(vcap_app)
-    except json.JSONDecodeError:
-        logger.error("Failed to parse VCAP_APPLICATION")
-        return {}
+    return _parse_vcap('VCAP_APPLICATION')
 
 
+@_memoize_service_config
 def get_xsuaa_config() -> Optional[XSUAAConfig]:
     """Extract XSUAA configuration from VCAP_SERVICES"""
     services = get_vcap_services()
@@ -98,6 +162,7 @@ def get_xsuaa_config() -> Optional[XSUAAConfig]:
     )
 
 
+@_memoize_service_config
 def get_destination_config() -> Optional[DestinationConfig]:
     """Extract Destination service configuration from VCAP_SERVICES"""
     services = get_vcap_services()
@@ -118,6 +183,7 @@ def get_destination_config() -> Optional[DestinationConfig]:
     )
 
 
+@_memoize_service_config
 def get_database_config() -> Optional[DatabaseConfig]:
     """Extract database configuration from VCAP_SERVICES"""
     services = get_vcap_services()
@@ -152,6 +218,7 @@ def get_database_config() -> Optional[DatabaseConfig]:
     return None
 
 
+@_memoize_service_config
 def get_connectivity_config() -> Dict[str, Any]:
     """Extract Connectivity service configuration"""
     services = get_vcap_services()
@@ -163,14 +230,119 @@ def get_connectivity_config() -> Dict[str, Any]:
     return conn_services[0].get('credentials', {})
 
 
+def _token_cache_key(xsuaa_config: XSUAAConfig, dest_config: DestinationConfig) -> Tuple[str, str]:
+    return (xsuaa_config.url, dest_config.clientid)
+
+
+def _get_cached_token(key: Tuple[str, str]) -> Optional[Tuple[str, float]]:
+    """Return a cached (access_token, expiry) if the token has not expired yet."""
+    cached = _token_cache.get(key)
+    if cached and cached[1] > time.monotonic():
+        return cached
+    return None
+
+
+def _store_token(key: Tuple[str, str], token_response: Dict[str, Any]) -> Tuple[str, float]:
+    """Cache an XSUAA token response and return (access_token, expiry)."""
+    expires_in = float(token_response.get('expires_in', 0))
+    expiry = time.monotonic() + max(expires_in - TOKEN_EXPIRY_MARGIN_SECONDS, 0)
+    _token_cache[key] = (token_response['access_token'], expiry)
+    return _token_cache[key]
+
+
+def _get_cached_destination(destination_name: str) -> Optional[Dict[str, Any]]:
+    cached = _destination_cache.get(destination_name)
+    if cached and cached[1] > time.monotonic():
+        return cached[0]
+    return None
+
+
+def _store_destination(destination_name: str, destination: Dict[str, Any], token_expiry: float):
+    """Cache a destination until the token used to fetch it (or its own auth tokens) expire."""
+    expiry = token_expiry
+    for auth_token in destination.get('authTokens', []):
+        if auth_token.get('expires_in'):
+            expiry = min(expiry, time.monotonic() + float(auth_token['expires_in']) - TOKEN_EXPIRY_MARGIN_SECONDS)
+    _destination_cache[destination_name] = (destination, expiry)
+
+
+def _get_http_session():
+    """Shared requests session so XSUAA and destination calls reuse connections."""
+    global _http_session
+    if _http_session is None:
+        import requests
+        _http_session = requests.Session()
+        atexit.register(_http_session.close)
+    return _http_session
+
+
+def _get_aiohttp_session():
+    """Shared aiohttp session for the running event loop."""
+    global _aiohttp_session
+    import aiohttp
+
+    loop = asyncio.get_running_loop()
+    if _aiohttp_session is None or _aiohttp_session[0].closed or _aiohttp_session[1] is not loop:
+        _aiohttp_session = (aiohttp.ClientSession(), loop)
+    return _aiohttp_session[0]
+
+
+async def close_http_sessions():
+    """Close the shared aiohttp session (call before the event loop shuts down)."""
+    global _aiohttp_session
+    if _aiohttp_session is not None and not _aiohttp_session[0].closed:
+        await _aiohttp_session[0].close()
+    _aiohttp_session = None
+
+
+async def _get_oauth_token(xsuaa_config: XSUAAConfig, dest_config: DestinationConfig) -> Optional[Tuple[str, float]]:
+    """Get a (cached) client-credentials token for the Destination service."""
+    key = _token_cache_key(xsuaa_config, dest_config)
+    cached = _get_cached_token(key)
+    if cached:
+        return cached
+
+    session = _get_aiohttp_session()
+    token_data = {
+        'grant_type': 'client_credentials',
+        'client_id': dest_config.clientid,
+        'client_secret': dest_config.clientsecret
+    }
+    async with session.post(f"{xsuaa_config.url}/oauth/token", data=token_data) as resp:
+        if resp.status != 200:
+            logger.error(f"Failed to get OAuth token: {resp.status}")
+            return None
+        return _store_token(key, await resp.json(loads=_json_loads))
+
+
+def _get_oauth_token_sync(xsuaa_config: XSUAAConfig, dest_config: DestinationConfig) -> Tuple[str, float]:
+    """Synchronous counterpart of _get_oauth_token."""
+    key = _token_cache_key(xsuaa_config, dest_config)
+    cached = _get_cached_token(key)
+    if cached:
+        return cached
+
+    token_data = {
+        'grant_type': 'client_credentials',
+        'client_id': dest_config.clientid,
+        'client_secret': dest_config.clientsecret
+    }
+    token_resp = _get_http_session().post(f"{xsuaa_config.url}/oauth/token", data=token_data, timeout=30)
+    token_resp.raise_for_status()
+    return _store_token(key, _json_loads(token_resp.content))
+
+
 async def fetch_destination(destination_name: str) -> Optional[Dict[str, Any]]:
     """
     Fetch destination configuration from SAP BTP Destination Service.
 
     This retrieves the full destination config including credentials
-    for connecting to SAP systems.
+    for connecting to SAP systems. The XSUAA token and the destination
+    are cached until the token expires.
     """
-    import aiohttp
+    cached = _get_cached_destination(destination_name)
+    if cached is not None:
+        return cached
 
     dest_config = get_destination_config()
     xsuaa_config = get_xsuaa_config()
@@ -180,32 +352,24 @@ async def fetch_destination(destination_name: str) -> Optional[Dict[str, Any]]:
         return None
 
     try:
-        # Get OAuth token from XSUAA
-        async with aiohttp.ClientSession() as session:
-            # Token request
-            token_url = f"{xsuaa_config.url}/oauth/token"
-            token_data = {
-                'grant_type': 'client_credentials',
-                'client_id': dest_config.clientid,
-                'client_secret': dest_config.clientsecret
-            }
-
-            async with session.post(token_url, data=token_data) as resp:
-                if resp.status != 200:
-                    logger.error(f"Failed to get OAuth token: {resp.status}")
-                    return None
-                token_response = await resp.json()
-                access_token = token_response['access_token']
-
-            # Fetch destination
-            dest_url = f"{dest_config.uri}/destination-configuration/v1/destinations/{destination_name}"
-            headers = {'Authorization': f'Bearer {access_token}'}
-
-            async with session.get(dest_url, headers=headers) as resp:
-                if resp.status != 200:
-                    logger.error(f"Failed to fetch destination: {resp.status}")
-                    return None
-                return await resp.json()
+        token = await _get_oauth_token(xsuaa_config, dest_config)
+        if not token:
+            return None
+        access_token, token_expiry = token
+
+        # Fetch destination
+        session = _get_aiohttp_session()
+        dest_url = f"{dest_config.uri}/destination-configuration/v1/destinations/{destination_name}"
+        headers = {'Authorization': f'Bearer {access_token}'}
+
+        async with session.get(dest_url, headers=headers) as resp:
+            if resp.status != 200:
+                logger.error(f"Failed to fetch destination: {resp.status}")
+                return None
+            destination = await resp.json(loads=_json_loads)
+
+        _store_destination(destination_name, destination, token_expiry)
+        return destination
 
     except Exception as e:
         logger.exception(f"Error fetching destination: {e}")
@@ -216,7 +380,9 @@ def get_destination_sync(destination_name: str) -> Optional[Dict[str, Any]]:
     """
     Synchronous version of fetch_destination using requests library.
     """
-    import requests
+    cached = _get_cached_destination(destination_name)
+    if cached is not None:
+        return cached
 
     dest_config = get_destination_config()
     xsuaa_config = get_xsuaa_config()
@@ -226,45 +392,49 @@ def get_destination_sync(destination_name: str) -> Optional[Dict[str, Any]]:
         return None
 
     try:
-        # Get OAuth token from XSUAA
-        token_url = f"{xsuaa_config.url}/oauth/token"
-        token_data = {
-            'grant_type': 'client_credentials',
-            'client_id': dest_config.clientid,
-            'client_secret': dest_config.clientsecret
-        }
-
-        token_resp = requests.post(token_url, data=token_data, timeout=30)
-        token_resp.raise_for_status()
-        access_token = token_resp.json()['access_token']
+        access_token, token_expiry = _get_oauth_token_sync(xsuaa_config, dest_config)
 
         # Fetch destination
         dest_url = f"{dest_config.uri}/destination-configuration/v1/destinations/{destination_name}"
         headers = {'Authorization': f'Bearer {access_token}'}
 
-        dest_resp = requests.get(dest_url, headers=headers, timeout=30)
+        dest_resp = _get_http_session().get(dest_url, headers=headers, timeout=30)
         dest_resp.raise_for_status()
 
-        return dest_resp.json()
+        destination = _json_loads(dest_resp.content)
+        _store_destination(destination_name, destination, token_expiry)
+        return destination
 
     except Exception as e:
         logger.exception(f"Error fetching destination: {e}")
         return None
 
 
-def configure_sap_from_destination(destination_name: str = 'SAP_PM_SYSTEM') -> Dict[str, str]:
+async def fetch_destinations(destination_names: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
     """
-    Configure SAP integration settings from BTP destination.
+    Fetch several destinations with one token request and concurrent GETs.
 
-    Returns environment variable dict that can be used to configure
-    the SAP integration service.
+    The XSUAA token is acquired (or taken from cache) once, then all
+    destination lookups are issued together, so N destinations cost two
+    round trips instead of N + 1.
     """
-    destination = get_destination_sync(destination_name)
+    dest_config = get_destination_config()
+    xsuaa_config = get_xsuaa_config()
 
-    if not destination:
-        logger.warning(f"Destination '{destination_name}' not found")
-        return {}
+    if dest_config and xsuaa_config and any(
+        _get_cached_destination(name) is None for name in destination_names
+    ):
+        try:
+            await _get_oauth_token(xsuaa_config, dest_config)
+        except Exception as e:
+            logger.exception(f"Error fetching OAuth token: {e}")
+
+    results = await asyncio.gather(*(fetch_destination(name) for name in destination_names))
+    return dict(zip(destination_names, results))
 
+
+def _destination_to_env(destination: Dict[str, Any]) -> Dict[str, str]:
+    """Map a destination payload to SAP integration environment variables."""
     dest_config = destination.get('destinationConfiguration', {})
     auth_tokens = destination.get('authTokens', [])
 
@@ -292,6 +462,51 @@ def configure_sap_from_destination(destination_name: str = 'SAP_PM_SYSTEM') -> D
     return env_config
 
 
+def _run_async(coro):
+    """
+    Run a coroutine on a fresh event loop (one-off startup work only).
+
+    The aiohttp session is bound to that loop and cannot outlive it, so it is
+    closed before the loop ends. Repeated synchronous lookups use the pooled
+    requests session instead.
+    """
+    async def runner():
+        try:
+            return await coro
+        finally:
+            await close_http_sessions()
+    return asyncio.run(runner())
+
+
+async def configure_sap_from_destination_async(destination_name: str = 'SAP_PM_SYSTEM') -> Dict[str, str]:
+    """Async variant of configure_sap_from_destination."""
+    destination = (await fetch_destinations([destination_name]))[destination_name]
+
+    if not destination:
+        logger.warning(f"Destination '{destination_name}' not found")
+        return {}
+
+    return _destination_to_env(destination)
+
+
+def configure_sap_from_destination(destination_name: str = 'SAP_PM_SYSTEM') -> Dict[str, str]:
+    """
+    Configure SAP integration settings from BTP destination.
+
+    Returns environment variable dict that can be used to configure
+    the SAP integration service. Uses the pooled requests session, so
+    repeated calls reuse its connections; async callers should use
+    configure_sap_from_destination_async instead.
+    """
+    destination = get_destination_sync(destination_name)
+
+    if not destination:
+        logger.warning(f"Destination '{destination_name}' not found")
+        return {}
+
+    return _destination_to_env(destination)
+
+
 def get_application_url() -> str:
     """Get the application URL from VCAP_APPLICATION"""
     vcap_app = get_vcap_application()
@@ -307,12 +522,12 @@ def get_application_name() -> str:
     return vcap_app.get('application_name', 'pm-analyzer')
 
 
-def initialize_btp_config():
+async def initialize_btp_config_async(destination_name: str = 'SAP_PM_SYSTEM'):
     """
     Initialize BTP configuration on application startup.
 
-    This should be called early in the application initialization
-    to configure services based on bound BTP services.
+    The XSUAA token request is started before anything else so it runs
+    while the bound services are inspected.
     """
     if not is_cf_environment():
         logger.info("Not running in Cloud Foundry environment")
@@ -320,16 +535,36 @@ def initialize_btp_config():
 
     logger.info("Initializing SAP BTP configuration...")
 
+    dest_config = get_destination_config()
+    xsuaa_config = get_xsuaa_config()
+    token_task = None
+    if dest_config and xsuaa_config:
+        token_task = asyncio.create_task(_get_oauth_token(xsuaa_config, dest_config))
+
     # Log bound services
-    services = get_vcap_services()
-    for service_type in services.keys():
-        logger.info(f"  Bound service: {service_type}")
+    logger.info("  Bound services: %s", list(get_vcap_services()))
+
+    if token_task is not None:
+        try:
+            await token_task
+        except Exception as e:
+            logger.exception(f"Error fetching OAuth token: {e}")
 
     # Configure SAP from destination if available
-    sap_config = configure_sap_from_destination()
-    for key, value in sap_config.items():
-        if key not in os.environ:
-            os.environ[key] = value
-            logger.info(f"  Set {key} from destination")
+    sap_config = await configure_sap_from_destination_async(destination_name)
+    missing = {key: value for key, value in sap_config.items() if key not in os.environ}
+    if missing:
+        os.environ.update(missing)
+        logger.info("  Set %s from destination", ', '.join(missing))
 
     logger.info("BTP configuration initialized")
+
+
+def initialize_btp_config():
+    """
+    Initialize BTP configuration on application startup.
+
+    This should be called early in the application initialization
+    to configure services based on bound BTP services.
+    """
+    _run_async(initialize_btp_config_async())
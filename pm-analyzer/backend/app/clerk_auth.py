@@ -20,19 +20,74 @@ Features:
 """
 
 import os
+import hmac
 import json
+import time
+import base64
+import asyncio
+import binascii
+import hashlib
 import logging
-from functools import wraps
-from typing import Optional, Dict, Any, List, Callable
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps, lru_cache
+from typing import Optional, Dict, Any, List, Callable, Tuple, FrozenSet, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+import jwt
+from jwt.algorithms import RSAAlgorithm
 from flask import request, g, jsonify, current_app
-from jose import jwt, JWTError
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# orjson decodes JWKS and Clerk API responses faster; stdlib json is the fallback
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+CLERK_HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+CLERK_HTTP_TIMEOUT = 30.0
+CLERK_MAX_PAGE_SIZE = 500  # Clerk caps /users pages at 500
+
+_fromtimestamp = datetime.fromtimestamp
+
+# JWKS cache: jwks_url -> ({kid: public key}, fetched_at on time.monotonic())
+JWKS_CACHE_TTL_SECONDS = 3600
+JWKS_MIN_REFRESH_SECONDS = 60  # limits forced refreshes for unknown kids
+_JWKS_CACHE: Dict[str, Tuple[Dict[str, Any], float]] = {}
+_jwks_session: Optional[requests.Session] = None
+
+# Verified token payloads keyed by a digest of the token (never the raw token):
+# digest -> (payload, expires_at on time.time())
+TOKEN_CACHE_TTL_SECONDS = 60
+TOKEN_CACHE_MAX_ENTRIES = 4096
+_TOKEN_CACHE: 'OrderedDict[bytes, Tuple[Dict[str, Any], float]]' = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+# ClerkUser objects built from those payloads, same key and lock:
+# digest -> (user, expires_at on time.time())
+USER_CACHE_TTL_SECONDS = 30
+_USER_CACHE: 'OrderedDict[bytes, Tuple[ClerkUser, float]]' = OrderedDict()
+
 
 # ============================================
 # Configuration
@@ -45,44 +100,73 @@ class ClerkConfig:
     publishable_key: str = ""
     api_url: str = "https://api.clerk.dev/v1"
     jwt_verification_key: str = ""
+    jwks_url: str = ""  # derived from publishable_key / api_url when not set
+    webhook_secret: str = ""  # Svix signing secret (whsec_...); unset skips verification
     enabled: bool = False
 
-    # Role configuration
-    admin_roles: List[str] = field(default_factory=lambda: ["admin", "org:admin"])
-    editor_roles: List[str] = field(default_factory=lambda: ["editor", "org:editor"])
-    auditor_roles: List[str] = field(default_factory=lambda: ["auditor", "org:auditor"])
-    viewer_roles: List[str] = field(default_factory=lambda: ["viewer", "org:viewer", "org:member"])
+    # Role configuration (frozensets for O(1) membership / intersection checks)
+    admin_roles: FrozenSet[str] = field(default_factory=lambda: frozenset({"admin", "org:admin"}))
+    editor_roles: FrozenSet[str] = field(default_factory=lambda: frozenset({"editor", "org:editor"}))
+    auditor_roles: FrozenSet[str] = field(default_factory=lambda: frozenset({"auditor", "org:auditor"}))
+    viewer_roles: FrozenSet[str] = field(default_factory=lambda: frozenset({"viewer", "org:viewer", "org:member"}))
 
     @classmethod
     def from_env(cls) -> 'ClerkConfig':
-        """Load configuration from environment variables"""
+        """
+        Load configuration from environment variables.
+
+        Only get_clerk_config calls this, once per process, so the env
+        parsing here is not on any request path.
+        """
         secret_key = os.environ.get('CLERK_SECRET_KEY', '')
 
         return cls(
             secret_key=secret_key,
             publishable_key=os.environ.get('CLERK_PUBLISHABLE_KEY', ''),
             jwt_verification_key=os.environ.get('CLERK_JWT_VERIFICATION_KEY', ''),
+            webhook_secret=os.environ.get('CLERK_WEBHOOK_SECRET', ''),
             enabled=bool(secret_key) and os.environ.get('CLERK_ENABLED', 'true').lower() == 'true'
         )
 
+    def __post_init__(self):
+        if not self.jwks_url:
+            # The JWKS URL is derived from the frontend API URL in publishable key
+            # Format: pk_test_xxx or pk_live_xxx
+            if self.publishable_key.startswith('pk_test_'):
+                self.jwks_url = "https://clerk.clerk.dev/.well-known/jwks.json"
+            else:
+                # Extract the frontend API from publishable key
+                # This is a simplified approach - in production, use the actual frontend API
+                self.jwks_url = f"{self.api_url.replace('api.', '')}/.well-known/jwks.json"
 
-# Global config instance
-_clerk_config: Optional[ClerkConfig] = None
+        # Combined groups used by is_editor / is_auditor (admins pass both)
+        self.admin_or_editor_roles = self.admin_roles | self.editor_roles
+        self.admin_or_auditor_roles = self.admin_roles | self.auditor_roles
 
 
+@lru_cache(maxsize=1)
 def get_clerk_config() -> ClerkConfig:
-    """Get or create Clerk configuration"""
-    global _clerk_config
-    if _clerk_config is None:
-        _clerk_config = ClerkConfig.from_env()
-    return _clerk_config
+    """
+    Get Clerk configuration.
+
+    Environment is read once per process (register_clerk_auth loads it at
+    app start); use get_clerk_config.cache_clear() to reload.
+    """
+    return ClerkConfig.from_env()
 
 
 # ============================================
 # User Data Models
 # ============================================
 
-@dataclass
+def _normalize_roles(roles: Any) -> List[str]:
+    """Normalize a roles claim (list, single string or empty) to a list"""
+    if isinstance(roles, list):
+        return roles
+    return [roles] if roles else []
+
+
+@dataclass(slots=True)
 class ClerkUser:
     """Represents a Clerk user"""
     id: str
@@ -97,6 +181,13 @@ class ClerkUser:
     metadata: Dict[str, Any] = field(default_factory=dict)
     created_at: Optional[datetime] = None
     last_sign_in: Optional[datetime] = None
+    _roles_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _is_admin: Optional[bool] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Role checks run on every request; keep a set alongside the list
+        self._roles_set = frozenset(self.roles)
 
     @property
     def full_name(self) -> str:
@@ -107,29 +198,36 @@ class ClerkUser:
 
     @property
     def is_admin(self) -> bool:
-        """Check if user has admin role"""
-        config = get_clerk_config()
-        return any(role in config.admin_roles for role in self.roles)
+        """Check if user has admin role (resolved once per user object)"""
+        if self._is_admin is None:
+            self._is_admin = not self._roles_set.isdisjoint(get_clerk_config().admin_roles)
+        return self._is_admin
 
     @property
     def is_editor(self) -> bool:
         """Check if user has editor role"""
-        config = get_clerk_config()
-        return self.is_admin or any(role in config.editor_roles for role in self.roles)
+        return not self._roles_set.isdisjoint(get_clerk_config().admin_or_editor_roles)
 
     @property
     def is_auditor(self) -> bool:
         """Check if user has auditor role"""
-        config = get_clerk_config()
-        return self.is_admin or any(role in config.auditor_roles for role in self.roles)
+        return not self._roles_set.isdisjoint(get_clerk_config().admin_or_auditor_roles)
 
     def has_role(self, role: str) -> bool:
         """Check if user has specific role"""
-        return role in self.roles or self.is_admin
+        return role in self._roles_set or self.is_admin
+
+    def has_any_role(self, roles: FrozenSet[str]) -> bool:
+        """Check if user has any of the given roles (admins always pass)"""
+        return not self._roles_set.isdisjoint(roles) or self.is_admin
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        return {
+        """Convert to dictionary (built once; treat the result as read-only)"""
+        if self._dict is not None:
+            return self._dict
+        config = get_clerk_config()
+        is_admin = self.is_admin
+        self._dict = {
             'id': self.id,
             'email': self.email,
             'first_name': self.first_name,
@@ -140,16 +238,88 @@ class ClerkUser:
             'roles': self.roles,
             'org_id': self.org_id,
             'org_role': self.org_role,
-            'is_admin': self.is_admin,
-            'is_editor': self.is_editor,
-            'is_auditor': self.is_auditor
+            'is_admin': is_admin,
+            'is_editor': is_admin or not self._roles_set.isdisjoint(config.editor_roles),
+            'is_auditor': is_admin or not self._roles_set.isdisjoint(config.auditor_roles)
         }
+        return self._dict
 
 
 # ============================================
 # JWT Token Verification
 # ============================================
 
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode('utf-8'), digest_size=16).digest()
+
+
+def _get_cached_payload(key: bytes) -> Optional[Dict[str, Any]]:
+    with _token_cache_lock:
+        cached = _TOKEN_CACHE.get(key)
+        if cached is None:
+            return None
+        payload, expires_at = cached
+        if expires_at <= time.time():
+            del _TOKEN_CACHE[key]
+            return None
+        _TOKEN_CACHE.move_to_end(key)
+        return payload
+
+
+def _cache_payload(key: bytes, payload: Dict[str, Any]):
+    """Cache a verified payload for at most TOKEN_CACHE_TTL_SECONDS and never past its exp."""
+    now = time.time()
+    expires_at = now + TOKEN_CACHE_TTL_SECONDS
+    exp = payload.get('exp')
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, exp)
+    if expires_at <= now:
+        return
+    with _token_cache_lock:
+        _TOKEN_CACHE[key] = (payload, expires_at)
+        _TOKEN_CACHE.move_to_end(key)
+        while len(_TOKEN_CACHE) > TOKEN_CACHE_MAX_ENTRIES:
+            _TOKEN_CACHE.popitem(last=False)
+
+
+def _get_cached_user(key: bytes) -> Optional['ClerkUser']:
+    with _token_cache_lock:
+        cached = _USER_CACHE.get(key)
+        if cached is None:
+            return None
+        user, expires_at = cached
+        if expires_at <= time.time():
+            del _USER_CACHE[key]
+            return None
+        _USER_CACHE.move_to_end(key)
+        return user
+
+
+def _cache_user(key: bytes, user: 'ClerkUser', exp: Any):
+    """Cache a user for at most USER_CACHE_TTL_SECONDS and never past the token's exp."""
+    now = time.time()
+    expires_at = now + USER_CACHE_TTL_SECONDS
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, exp)
+    if expires_at <= now:
+        return
+    with _token_cache_lock:
+        _USER_CACHE[key] = (user, expires_at)
+        _USER_CACHE.move_to_end(key)
+        while len(_USER_CACHE) > TOKEN_CACHE_MAX_ENTRIES:
+            _USER_CACHE.popitem(last=False)
+
+
+def evict_cached_user(user_id: str):
+    """Drop cached tokens and users for a user (e.g. on user.updated / user.deleted)."""
+    with _token_cache_lock:
+        keys = [key for key, (payload, _) in _TOKEN_CACHE.items() if payload.get('sub') == user_id]
+        keys += [key for key, (user, _) in _USER_CACHE.items() if user.id == user_id]
+        for key in keys:
+            _TOKEN_CACHE.pop(key, None)
+            _USER_CACHE.pop(key, None)
+
+
 def verify_clerk_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Verify a Clerk JWT token.
@@ -158,22 +328,37 @@ def verify_clerk_token(token: str) -> Optional[Dict[str, Any]]:
     1. Using the JWKS endpoint (recommended)
     2. Using a local verification key
     3. Via Clerk API (fallback)
+
+    Successfully verified payloads are cached briefly so a token reused
+    across requests is not re-verified each time.
     """
+    return _verify_clerk_token(token, _token_cache_key(token))
+
+
+def _verify_clerk_token(token: str, cache_key: bytes) -> Optional[Dict[str, Any]]:
     config = get_clerk_config()
 
     if not config.enabled:
         logger.warning("Clerk authentication is disabled")
         return None
 
+    payload = _get_cached_payload(cache_key)
+    if payload is not None:
+        return payload
+
     try:
         # Try local JWT verification first (faster)
         if config.jwt_verification_key:
-            return _verify_token_local(token, config.jwt_verification_key)
+            payload = _verify_token_local(token, config.jwt_verification_key)
+        else:
+            # Fall back to JWKS verification
+            payload = _verify_token_jwks(token)
 
-        # Fall back to JWKS verification
-        return _verify_token_jwks(token)
+        if payload:
+            _cache_payload(cache_key, payload)
+        return payload
 
-    except JWTError as e:
+    except jwt.PyJWTError as e:
         logger.warning(f"JWT verification failed: {e}")
         return None
     except Exception as e:
@@ -181,19 +366,66 @@ def verify_clerk_token(token: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+@lru_cache(maxsize=4)
+def _load_verification_key(verification_key: str):
+    """Parse the PEM verification key once instead of on every decode."""
+    return RSAAlgorithm(RSAAlgorithm.SHA256).prepare_key(verification_key)
+
+
 def _verify_token_local(token: str, verification_key: str) -> Optional[Dict[str, Any]]:
     """Verify token using local key"""
-    try:
-        # Clerk uses RS256 by default
-        payload = jwt.decode(
-            token,
-            verification_key,
-            algorithms=['RS256'],
-            options={'verify_aud': False}  # Clerk doesn't always set audience
-        )
-        return payload
-    except JWTError:
-        raise
+    # Clerk uses RS256 by default
+    return jwt.decode(
+        token,
+        _load_verification_key(verification_key),
+        algorithms=['RS256'],
+        options={'verify_aud': False}  # Clerk doesn't always set audience
+    )
+
+
+def _get_jwks_session() -> requests.Session:
+    """Shared session so JWKS refreshes reuse the TLS connection."""
+    global _jwks_session
+    if _jwks_session is None:
+        _jwks_session = requests.Session()
+        _jwks_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    return _jwks_session
+
+
+def _fetch_jwks(jwks_url: str) -> Dict[str, Any]:
+    """Fetch JWKS and index the parsed public keys by kid."""
+    response = _get_jwks_session().get(jwks_url, timeout=10)
+    response.raise_for_status()
+    keys = {}
+    for key in _json_loads(response.content).get('keys', []):
+        if not key.get('kid'):
+            continue
+        try:
+            keys[key['kid']] = jwt.PyJWK(key).key
+        except jwt.PyJWTError as e:
+            logger.warning(f"Skipping unusable JWKS key {key['kid']}: {e}")
+    _JWKS_CACHE[jwks_url] = (keys, time.monotonic())
+    return keys
+
+
+def _get_signing_key(jwks_url: str, kid: str) -> Optional[Any]:
+    """
+    Look up the public key for a kid, using the cached JWKS where possible.
+
+    An unknown kid triggers one refresh (key rotation), at most once per
+    JWKS_MIN_REFRESH_SECONDS.
+    """
+    now = time.monotonic()
+    cached = _JWKS_CACHE.get(jwks_url)
+    if cached:
+        keys, fetched_at = cached
+        age = now - fetched_at
+        if age < JWKS_CACHE_TTL_SECONDS:
+            key = keys.get(kid)
+            if key or age < JWKS_MIN_REFRESH_SECONDS:
+                return key
+
+    return _fetch_jwks(jwks_url).get(kid)
 
 
 def _verify_token_jwks(token: str) -> Optional[Dict[str, Any]]:
@@ -208,27 +440,8 @@ def _verify_token_jwks(token: str) -> Optional[Dict[str, Any]]:
         logger.warning("Token missing key ID (kid)")
         return None
 
-    # Fetch JWKS from Clerk
-    # The JWKS URL is derived from the frontend API URL in publishable key
-    # Format: pk_test_xxx or pk_live_xxx
-    if config.publishable_key.startswith('pk_test_'):
-        jwks_url = "https://clerk.clerk.dev/.well-known/jwks.json"
-    else:
-        # Extract the frontend API from publishable key
-        # This is a simplified approach - in production, use the actual frontend API
-        jwks_url = f"{config.api_url.replace('api.', '')}/.well-known/jwks.json"
-
     try:
-        response = requests.get(jwks_url, timeout=10)
-        response.raise_for_status()
-        jwks = response.json()
-
-        # Find the matching key
-        rsa_key = None
-        for key in jwks.get('keys', []):
-            if key.get('kid') == kid:
-                rsa_key = key
-                break
+        rsa_key = _get_signing_key(config.jwks_url, kid)
 
         if not rsa_key:
             logger.warning(f"No matching key found for kid: {kid}")
@@ -252,29 +465,49 @@ def _verify_token_jwks(token: str) -> Optional[Dict[str, Any]]:
 # Clerk API Client
 # ============================================
 
+# Shared Clerk API clients keyed by (api_url, secret_key) so connections
+# are pooled across ClerkClient instances (one is created per request).
+_http_clients: Dict[Tuple[str, str], httpx.Client] = {}
+
+
+def _client_kwargs(config: ClerkConfig) -> Dict[str, Any]:
+    return {
+        'base_url': config.api_url,
+        'http2': HTTP2_AVAILABLE,
+        'headers': {
+            'Authorization': f'Bearer {config.secret_key}',
+            'Content-Type': 'application/json'
+        },
+        'timeout': CLERK_HTTP_TIMEOUT,
+        'limits': CLERK_HTTP_LIMITS,
+    }
+
+
+def _get_http_client(config: ClerkConfig) -> httpx.Client:
+    key = (config.api_url, config.secret_key)
+    client = _http_clients.get(key)
+    if client is None or client.is_closed:
+        client = _http_clients[key] = httpx.Client(**_client_kwargs(config))
+    return client
+
+
 class ClerkClient:
     """Client for Clerk Backend API"""
 
     def __init__(self, config: Optional[ClerkConfig] = None):
         self.config = config or get_clerk_config()
-        self._session = requests.Session()
-        self._session.headers.update({
-            'Authorization': f'Bearer {self.config.secret_key}',
-            'Content-Type': 'application/json'
-        })
+        self._client = _get_http_client(self.config)
 
     def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Make API request to Clerk"""
-        url = f"{self.config.api_url}{endpoint}"
-
         try:
-            response = self._session.request(method, url, timeout=30, **kwargs)
+            response = self._client.request(method, endpoint, **kwargs)
             response.raise_for_status()
-            return response.json()
-        except requests.HTTPError as e:
+            return _json_loads(response.content)
+        except httpx.HTTPStatusError as e:
             logger.error(f"Clerk API error: {e.response.status_code} - {e.response.text}")
             raise
-        except requests.RequestException as e:
+        except httpx.RequestError as e:
             logger.error(f"Clerk API request failed: {e}")
             raise
 
@@ -287,6 +520,32 @@ class ClerkClient:
             logger.error(f"Failed to get user {user_id}: {e}")
             return None
 
+    def get_user_batch(self, user_ids: List[str]) -> Dict[str, Optional[ClerkUser]]:
+        """
+        Get several users concurrently.
+
+        All lookups are multiplexed over one async client (a single HTTP/2
+        connection when h2 is installed). Missing or failed users map to None.
+        """
+        async def fetch_all():
+            async with httpx.AsyncClient(**_client_kwargs(self.config)) as client:
+                return await asyncio.gather(
+                    *(client.get(f'/users/{user_id}') for user_id in user_ids),
+                    return_exceptions=True
+                )
+
+        users: Dict[str, Optional[ClerkUser]] = {}
+        for user_id, response in zip(user_ids, asyncio.run(fetch_all())):
+            if isinstance(response, Exception):
+                logger.error(f"Failed to get user {user_id}: {response}")
+                users[user_id] = None
+            elif response.status_code != 200:
+                logger.error(f"Failed to get user {user_id}: {response.status_code}")
+                users[user_id] = None
+            else:
+                users[user_id] = self._parse_user(_json_loads(response.content))
+        return users
+
     def get_user_by_email(self, email: str) -> Optional[ClerkUser]:
         """Get user by email"""
         try:
@@ -299,38 +558,95 @@ class ClerkClient:
             logger.error(f"Failed to get user by email {email}: {e}")
             return None
 
-    def list_users(self, limit: int = 100, offset: int = 0) -> List[ClerkUser]:
-        """List all users"""
-        try:
+    def iter_users(self, page_size: int = 100, offset: int = 0) -> Iterator[ClerkUser]:
+        """
+        Iterate over users page by page.
+
+        Pages are requested lazily, so callers that stop early never fetch
+        (or parse) the remaining users.
+        """
+        page_size = max(1, min(page_size, CLERK_MAX_PAGE_SIZE))
+        parse = self._parse_user
+        while True:
             data = self._request('GET', '/users', params={
-                'limit': limit,
+                'limit': page_size,
                 'offset': offset
             })
-            return [self._parse_user(u) for u in data.get('data', [])]
+            page = data.get('data', [])
+            for user_data in page:
+                yield parse(user_data)
+            if len(page) < page_size:
+                return
+            offset += page_size
+
+    def list_users(self, limit: int = 100, offset: int = 0) -> List[ClerkUser]:
+        """List all users"""
+        try:
+            return list(islice(self.iter_users(page_size=limit, offset=offset), limit))
         except Exception as e:
             logger.error(f"Failed to list users: {e}")
             return []
 
+    @staticmethod
+    def _metadata_payload(public_metadata: Optional[Dict], private_metadata: Optional[Dict]) -> Dict[str, Any]:
+        payload = {}
+        if public_metadata:
+            payload['public_metadata'] = public_metadata
+        if private_metadata:
+            payload['private_metadata'] = private_metadata
+        return payload
+
     def update_user_metadata(self, user_id: str, public_metadata: Dict = None,
                             private_metadata: Dict = None) -> bool:
         """Update user metadata"""
         try:
-            payload = {}
-            if public_metadata:
-                payload['public_metadata'] = public_metadata
-            if private_metadata:
-                payload['private_metadata'] = private_metadata
-
+            payload = self._metadata_payload(public_metadata, private_metadata)
             self._request('PATCH', f'/users/{user_id}', json=payload)
             return True
         except Exception as e:
             logger.error(f"Failed to update user metadata: {e}")
             return False
 
+    def update_user_metadata_bulk(
+        self, updates: List[Tuple[str, Optional[Dict], Optional[Dict]]]
+    ) -> Dict[str, bool]:
+        """
+        Update metadata for several users concurrently.
+
+        Takes (user_id, public_metadata, private_metadata) tuples and sends
+        the PATCH requests over one async client, like get_user_batch.
+        Returns user_id -> success.
+        """
+        async def patch_all():
+            async with httpx.AsyncClient(**_client_kwargs(self.config)) as client:
+                return await asyncio.gather(
+                    *(client.patch(f'/users/{user_id}', json=self._metadata_payload(public, private))
+                      for user_id, public, private in updates),
+                    return_exceptions=True
+                )
+
+        results: Dict[str, bool] = {}
+        for (user_id, _, _), response in zip(updates, asyncio.run(patch_all())):
+            if isinstance(response, Exception):
+                logger.error(f"Failed to update user metadata for {user_id}: {response}")
+                results[user_id] = False
+            elif response.is_error:
+                logger.error(f"Failed to update user metadata for {user_id}: {response.status_code}")
+                results[user_id] = False
+            else:
+                results[user_id] = True
+        return results
+
     def set_user_roles(self, user_id: str, roles: List[str]) -> bool:
         """Set user roles in metadata"""
         return self.update_user_metadata(user_id, public_metadata={'roles': roles})
 
+    def set_user_roles_bulk(self, roles_by_user: Dict[str, List[str]]) -> Dict[str, bool]:
+        """Set roles for several users concurrently; returns user_id -> success"""
+        return self.update_user_metadata_bulk([
+            (user_id, {'roles': roles}, None) for user_id, roles in roles_by_user.items()
+        ])
+
     def verify_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Verify a session"""
         try:
@@ -341,25 +657,28 @@ class ClerkClient:
     def _parse_user(self, data: Dict[str, Any]) -> ClerkUser:
         """Parse Clerk API response into ClerkUser"""
         # Get primary email
+        # Users rarely have more than a couple of addresses, so a plain scan
+        # with early exit beats building a lookup dict
         email_addresses = data.get('email_addresses', [])
-        primary_email = next(
-            (e['email_address'] for e in email_addresses
-             if e.get('id') == data.get('primary_email_address_id')),
-            email_addresses[0]['email_address'] if email_addresses else ''
-        )
+        primary_id = data.get('primary_email_address_id')
+        primary_email = email_addresses[0]['email_address'] if email_addresses else ''
+        for email in email_addresses:
+            if email.get('id') == primary_id:
+                primary_email = email['email_address']
+                break
 
         # Get roles from public metadata
         public_metadata = data.get('public_metadata', {})
-        roles = public_metadata.get('roles', [])
+        roles = _normalize_roles(public_metadata.get('roles'))
 
         # Parse timestamps
         created_at = None
         if data.get('created_at'):
-            created_at = datetime.fromtimestamp(data['created_at'] / 1000)
+            created_at = _fromtimestamp(data['created_at'] / 1000)
 
         last_sign_in = None
         if data.get('last_sign_in_at'):
-            last_sign_in = datetime.fromtimestamp(data['last_sign_in_at'] / 1000)
+            last_sign_in = _fromtimestamp(data['last_sign_in_at'] / 1000)
 
         return ClerkUser(
             id=data['id'],
@@ -368,7 +687,7 @@ class ClerkClient:
             last_name=data.get('last_name', ''),
             username=data.get('username', ''),
             image_url=data.get('image_url', ''),
-            roles=roles if isinstance(roles, list) else [roles] if roles else [],
+            roles=roles,
             metadata=public_metadata,
             created_at=created_at,
             last_sign_in=last_sign_in
@@ -379,9 +698,45 @@ class ClerkClient:
 # Flask Middleware & Decorators
 # ============================================
 
+def _user_from_claims(payload: Dict[str, Any]) -> ClerkUser:
+    """Build a ClerkUser from verified token claims"""
+    return ClerkUser(
+        id=payload['sub'],
+        email=payload.get('email', ''),
+        first_name=payload.get('first_name', ''),
+        last_name=payload.get('last_name', ''),
+        roles=_normalize_roles(payload.get('public_metadata', {}).get('roles')),
+        org_id=payload.get('org_id'),
+        org_role=payload.get('org_role')
+    )
+
+
 def get_current_user() -> Optional[ClerkUser]:
-    """Get the current authenticated user from Flask's g object"""
-    return getattr(g, 'current_user', None)
+    """
+    Get the current authenticated user from Flask's g object.
+
+    The middleware only stores the verified claims; the ClerkUser is built
+    on first access (or reused from an earlier request with the same token)
+    and kept on g for the rest of the request.
+    """
+    user = getattr(g, 'current_user', None)
+    if user is None:
+        claims = getattr(g, 'current_user_claims', None)
+        if claims is not None:
+            key = getattr(g, '_clerk_token_key', None)
+            user = _get_cached_user(key) if key is not None else None
+            if user is None:
+                user = _user_from_claims(claims)
+                if key is not None:
+                    _cache_user(key, user, claims.get('exp'))
+            g.current_user = user
+    return user
+
+
+def _is_authenticated() -> bool:
+    """Check for a verified user without building the ClerkUser"""
+    return (getattr(g, 'current_user_claims', None) is not None
+            or getattr(g, 'current_user', None) is not None)
 
 
 def clerk_auth_middleware():
@@ -389,8 +744,14 @@ def clerk_auth_middleware():
     Flask middleware to authenticate requests using Clerk.
 
     Call this in your Flask app's before_request or use as decorator.
-    Sets g.current_user if authentication is successful.
+    Sets g.current_user_claims to the verified token claims, or None if
+    authentication failed, and marks the request so the decorators do not
+    verify twice. The ClerkUser itself is built lazily by get_current_user.
     """
+    g.current_user = None
+    g.current_user_claims = None
+    g._clerk_auth_ran = True
+
     config = get_clerk_config()
 
     # Skip if Clerk is disabled
@@ -406,33 +767,34 @@ def clerk_auth_middleware():
     token = auth_header[7:]  # Remove 'Bearer ' prefix
 
     # Verify token
-    payload = verify_clerk_token(token)
+    cache_key = _token_cache_key(token)
+    payload = _verify_clerk_token(token, cache_key)
 
-    if not payload:
-        return None
+    # Clerk includes the user data we need in the token claims
+    if payload and payload.get('sub'):
+        g.current_user_claims = payload
+        g._clerk_token_key = cache_key
 
-    # Extract user info from token
-    user_id = payload.get('sub')
+    return None
 
-    if not user_id:
-        return None
 
-    # Get additional user data from token claims or fetch from API
-    # Clerk includes some user data in the token
-    session_claims = payload.get('session_claims', {})
+def _error_body(code: str, message: str) -> bytes:
+    """Serialize an API error envelope once so denied requests reuse the bytes"""
+    return json.dumps({'error': {'code': code, 'message': message}}).encode()
 
-    # Create user object from token
-    g.current_user = ClerkUser(
-        id=user_id,
-        email=payload.get('email', ''),
-        first_name=payload.get('first_name', ''),
-        last_name=payload.get('last_name', ''),
-        roles=payload.get('public_metadata', {}).get('roles', []),
-        org_id=payload.get('org_id'),
-        org_role=payload.get('org_role')
-    )
 
-    return None
+_UNAUTHORIZED_BODY = _error_body('UNAUTHORIZED', 'Authentication required')
+
+
+def _error_response(body: bytes, status: int):
+    """Wrap a pre-serialized error body in a JSON response"""
+    return current_app.response_class(body, status=status, mimetype='application/json')
+
+
+def _ensure_authenticated():
+    """Run the middleware unless it already ran for this request."""
+    if not getattr(g, '_clerk_auth_ran', False):
+        clerk_auth_middleware()
 
 
 def require_auth(f: Callable) -> Callable:
@@ -448,25 +810,13 @@ def require_auth(f: Callable) -> Callable:
     """
     @wraps(f)
     def decorated(*args, **kwargs):
-        config = get_clerk_config()
-
         # Skip auth check if disabled (development mode)
-        if not config.enabled:
+        if not get_clerk_config().enabled:
             return f(*args, **kwargs)
 
-        # Run middleware if not already done
-        if not hasattr(g, 'current_user') or g.current_user is None:
-            clerk_auth_middleware()
-
-        user = get_current_user()
-
-        if not user:
-            return jsonify({
-                'error': {
-                    'code': 'UNAUTHORIZED',
-                    'message': 'Authentication required'
-                }
-            }), 401
+        _ensure_authenticated()
+        if not _is_authenticated():
+            return _error_response(_UNAUTHORIZED_BODY, 401)
 
         return f(*args, **kwargs)
 
@@ -488,33 +838,25 @@ def require_role(*roles: str) -> Callable:
         def edit_route():
             return jsonify({'can_edit': True})
     """
+    required_roles = frozenset(roles)
+    forbidden_body = _error_body('FORBIDDEN', f'Required role: {" or ".join(roles)}')
+
     def decorator(f: Callable) -> Callable:
         @wraps(f)
-        @require_auth
         def decorated(*args, **kwargs):
             # Skip role check if auth is disabled (development mode)
-            config = get_clerk_config()
-            if not config.enabled:
+            if not get_clerk_config().enabled:
                 return f(*args, **kwargs)
 
+            _ensure_authenticated()
             user = get_current_user()
 
             if not user:
-                return jsonify({
-                    'error': {
-                        'code': 'UNAUTHORIZED',
-                        'message': 'Authentication required'
-                    }
-                }), 401
+                return _error_response(_UNAUTHORIZED_BODY, 401)
 
             # Check if user has any of the required roles
-            if not any(user.has_role(role) for role in roles):
-                return jsonify({
-                    'error': {
-                        'code': 'FORBIDDEN',
-                        'message': f'Required role: {" or ".join(roles)}'
-                    }
-                }), 403
+            if not user.has_any_role(required_roles):
+                return _error_response(forbidden_body, 403)
 
             return f(*args, **kwargs)
 
@@ -551,12 +893,29 @@ clerk_bp = Blueprint('clerk', __name__)
 def auth_status():
     """Get authentication status and configuration"""
     config = get_clerk_config()
+    user = get_current_user()
+    publishable_key = config.publishable_key if config.enabled else None
 
-    return jsonify({
+    if user is None:
+        # Polled on every page load; the anonymous answer only depends on config
+        body, etag = _anonymous_status_body(config.enabled, publishable_key)
+        response = current_app.response_class(body, mimetype='application/json')
+        response.set_etag(etag, weak=True)
+        return response.make_conditional(request)
+
+    response = jsonify({
         'enabled': config.enabled,
-        'publishable_key': config.publishable_key if config.enabled else None,
-        'user': get_current_user().to_dict() if get_current_user() else None
+        'publishable_key': publishable_key,
+        'user': user.to_dict()
     })
+    response.add_etag(weak=True)
+    return response.make_conditional(request)
+
+
+@lru_cache(maxsize=4)
+def _anonymous_status_body(enabled: bool, publishable_key: Optional[str]) -> Tuple[bytes, str]:
+    body = _json_dumps({'enabled': enabled, 'publishable_key': publishable_key, 'user': None})
+    return body, hashlib.blake2b(body, digest_size=8).hexdigest()
 
 
 @clerk_bp.route('/auth/me', methods=['GET'])
@@ -576,12 +935,15 @@ def list_users():
     limit = request.args.get('limit', 100, type=int)
     offset = request.args.get('offset', 0, type=int)
 
-    users = client.list_users(limit=limit, offset=offset)
+    # Serialize straight from the page iterator; no intermediate user list
+    try:
+        users = [u.to_dict() for u in islice(client.iter_users(page_size=limit, offset=offset), limit)]
+    except Exception as e:
+        logger.error(f"Failed to list users: {e}")
+        users = []
 
-    return jsonify({
-        'users': [u.to_dict() for u in users],
-        'count': len(users)
-    })
+    body = _json_dumps({'users': users, 'count': len(users)})
+    return current_app.response_class(body, mimetype='application/json')
 
 
 @clerk_bp.route('/auth/users/<user_id>', methods=['GET'])
@@ -606,10 +968,12 @@ def set_user_roles(user_id: str):
     data = request.get_json()
     roles = data.get('roles', [])
 
-    if not isinstance(roles, list):
+    if not isinstance(roles, list) or not all(isinstance(role, str) for role in roles):
         return jsonify({
-            'error': {'code': 'BAD_REQUEST', 'message': 'roles must be an array'}
+            'error': {'code': 'BAD_REQUEST', 'message': 'roles must be an array of strings'}
         }), 400
+    # Drop duplicates, keeping the caller's order
+    roles = list(dict.fromkeys(roles))
 
     client = ClerkClient()
     success = client.set_user_roles(user_id, roles)
@@ -622,6 +986,113 @@ def set_user_roles(user_id: str):
         }), 500
 
 
+# Svix rejects deliveries whose timestamp is further than this from now
+WEBHOOK_TOLERANCE_SECONDS = 300
+
+# Tenant side effects of webhooks run here so the delivery is acknowledged
+# without waiting on the database.
+_webhook_executor: Optional[ThreadPoolExecutor] = None
+_webhook_executor_lock = threading.Lock()
+
+
+def _submit_webhook_task(func: Callable, *args: Any):
+    global _webhook_executor
+    if _webhook_executor is None:
+        with _webhook_executor_lock:
+            if _webhook_executor is None:
+                _webhook_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='clerk-webhook')
+    return _webhook_executor.submit(func, *args)
+
+
+def _verify_webhook_signature(secret: str, headers, body: bytes) -> bool:
+    """Check a Svix webhook signature (v1 HMAC-SHA256 over id.timestamp.body)."""
+    msg_id = headers.get('svix-id', '')
+    timestamp = headers.get('svix-timestamp', '')
+    signatures = headers.get('svix-signature', '')
+    if not (msg_id and timestamp and signatures):
+        return False
+    try:
+        if abs(time.time() - int(timestamp)) > WEBHOOK_TOLERANCE_SECONDS:
+            return False
+        key = base64.b64decode(secret.split('_', 1)[1] if secret.startswith('whsec_') else secret)
+    except (ValueError, binascii.Error):
+        return False
+
+    signed = f"{msg_id}.{timestamp}.".encode() + body
+    expected = base64.b64encode(hmac.new(key, signed, hashlib.sha256).digest()).decode()
+    for candidate in signatures.split():
+        version, _, signature = candidate.partition(',')
+        if version == 'v1' and hmac.compare_digest(signature, expected):
+            return True
+    return False
+
+
+def _record_active_user(org_id: str):
+    try:
+        from app.services.tenant_service import get_tenant_service
+        get_tenant_service().record_usage(org_id, 'active_users')
+    except Exception as e:
+        logger.warning(f"Could not record active user for org {org_id}: {e}")
+
+
+def _deprovision_tenant(org_id: str):
+    try:
+        from app.services.tenant_service import get_tenant_service
+        ts = get_tenant_service()
+        if ts.get_tenant(org_id):
+            ts.on_unsubscription(org_id)
+            logger.info(f"Tenant {org_id} deprovisioned via org deletion")
+    except Exception as e:
+        logger.error(f"Error handling org deletion for {org_id}: {e}")
+
+
+def _on_user_created(data: Dict[str, Any]):
+    logger.info(f"New user created: {data.get('id')}")
+
+
+def _on_user_updated(data: Dict[str, Any]):
+    logger.info(f"User updated: {data.get('id')}")
+    evict_cached_user(data.get('id'))
+
+
+def _on_user_deleted(data: Dict[str, Any]):
+    logger.info(f"User deleted: {data.get('id')}")
+    evict_cached_user(data.get('id'))
+
+
+def _on_membership_created(data: Dict[str, Any]):
+    # A user joined an organization (tenant)
+    org_id = data.get('organization', {}).get('id', '')
+    user_id = data.get('public_user_data', {}).get('user_id', '')
+    logger.info(f"User {user_id} joined org {org_id} as {data.get('role', '')}")
+    if org_id:
+        _submit_webhook_task(_record_active_user, org_id)
+
+
+def _on_membership_deleted(data: Dict[str, Any]):
+    org_id = data.get('organization', {}).get('id', '')
+    user_id = data.get('public_user_data', {}).get('user_id', '')
+    logger.info(f"User {user_id} removed from org {org_id}")
+
+
+def _on_organization_deleted(data: Dict[str, Any]):
+    # Clerk org deleted -> deprovision tenant
+    org_id = data.get('id', '')
+    logger.info(f"Organization deleted: {org_id}")
+    if org_id:
+        _submit_webhook_task(_deprovision_tenant, org_id)
+
+
+_WEBHOOK_HANDLERS: Dict[str, Callable[[Dict[str, Any]], None]] = {
+    'user.created': _on_user_created,
+    'user.updated': _on_user_updated,
+    'user.deleted': _on_user_deleted,
+    'organizationMembership.created': _on_membership_created,
+    'organizationMembership.deleted': _on_membership_deleted,
+    'organization.deleted': _on_organization_deleted,
+}
+
+
 @clerk_bp.route('/auth/webhook', methods=['POST'])
 def clerk_webhook():
     """
@@ -630,67 +1101,23 @@ def clerk_webhook():
     Configure this URL in your Clerk Dashboard under Webhooks.
     Events: user.created, user.updated, user.deleted,
             organization.created, organizationMembership.created, etc.
+
+    Deliveries are verified against CLERK_WEBHOOK_SECRET when it is set.
     """
-    # Verify webhook signature (recommended for production)
-    # webhook_secret = os.environ.get('CLERK_WEBHOOK_SECRET')
-    # signature = request.headers.get('svix-signature')
-    # TODO: Implement signature verification
+    webhook_secret = get_clerk_config().webhook_secret
+    if webhook_secret and not _verify_webhook_signature(
+            webhook_secret, request.headers, request.get_data(cache=True)):
+        logger.warning("Rejected Clerk webhook with invalid signature")
+        return _error_response(_error_body('UNAUTHORIZED', 'Invalid webhook signature'), 401)
 
     event = request.get_json()
     event_type = event.get('type')
 
     logger.info(f"Received Clerk webhook: {event_type}")
 
-    if event_type == 'user.created':
-        user_data = event.get('data', {})
-        logger.info(f"New user created: {user_data.get('id')}")
-
-    elif event_type == 'user.updated':
-        user_data = event.get('data', {})
-        logger.info(f"User updated: {user_data.get('id')}")
-
-    elif event_type == 'user.deleted':
-        user_data = event.get('data', {})
-        logger.info(f"User deleted: {user_data.get('id')}")
-
-    elif event_type == 'organizationMembership.created':
-        # A user joined an organization (tenant)
-        membership = event.get('data', {})
-        org_id = membership.get('organization', {}).get('id', '')
-        user_id = membership.get('public_user_data', {}).get('user_id', '')
-        role = membership.get('role', '')
-        logger.info(f"User {user_id} joined org {org_id} as {role}")
-
-        # Record usage metric for active users
-        if org_id:
-            try:
-                from app.services.tenant_service import get_tenant_service
-                get_tenant_service().record_usage(org_id, 'active_users')
-            except Exception:
-                pass
-
-    elif event_type == 'organizationMembership.deleted':
-        membership = event.get('data', {})
-        org_id = membership.get('organization', {}).get('id', '')
-        user_id = membership.get('public_user_data', {}).get('user_id', '')
-        logger.info(f"User {user_id} removed from org {org_id}")
-
-    elif event_type == 'organization.deleted':
-        # Clerk org deleted -> deprovision tenant
-        org_data = event.get('data', {})
-        org_id = org_data.get('id', '')
-        logger.info(f"Organization deleted: {org_id}")
-
-        if org_id:
-            try:
-                from app.services.tenant_service import get_tenant_service
-                ts = get_tenant_service()
-                tenant = ts.get_tenant(org_id)
-                if tenant:
-                    ts.on_unsubscription(org_id)
-                    logger.info(f"Tenant {org_id} deprovisioned via org deletion")
-            except Exception as e:
-                logger.error(f"Error handling org deletion for {org_id}: {e}")
+    handler = _WEBHOOK_HANDLERS.get(event_type)
+    if handler:
+        handler(event.get('data', {}))
 
     return jsonify({'received': True})
 
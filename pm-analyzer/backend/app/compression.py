@@ -0,0 +1,38 @@
+"""
+Response compression for JSON and CSV payloads.
+
+Dashboard JSON and CSV exports repeat the same field names on every row and
+compress well. When Flask-Compress is installed, responses of at least
+COMPRESS_MIN_SIZE bytes are compressed with Brotli or gzip, depending on the
+client's Accept-Encoding. Streamed CSV exports are compressed chunk by chunk,
+so they are still sent without being buffered. Without the package, responses
+are sent uncompressed.
+"""
+
+import os
+import logging
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESS_MIMETYPES = ['application/json', 'text/csv']
+COMPRESS_LEVEL = int(os.environ.get('COMPRESS_LEVEL', '6'))
+COMPRESS_MIN_SIZE = int(os.environ.get('COMPRESS_MIN_SIZE', '1024'))
+
+
+def init_compression(app) -> None:
+    """Compress JSON and CSV responses when Flask-Compress is installed."""
+    if Compress is None:
+        logger.info("Flask-Compress not installed; responses are sent uncompressed")
+        return
+
+    app.config.setdefault('COMPRESS_MIMETYPES', COMPRESS_MIMETYPES)
+    app.config.setdefault('COMPRESS_ALGORITHM', ['br', 'gzip'])
+    app.config.setdefault('COMPRESS_LEVEL', COMPRESS_LEVEL)
+    app.config.setdefault('COMPRESS_BR_LEVEL', 4)
+    app.config.setdefault('COMPRESS_MIN_SIZE', COMPRESS_MIN_SIZE)
+    Compress(app)
@@ -1,5 +1,7 @@
 import json
 import os
+import tempfile
+import threading
 
 CONFIG_FILE = os.path.join(os.path.dirname(__file__), 'config.json')
 
@@ -14,17 +16,66 @@ DEFAULT_CONFIG = {
     }
 }
 
+# Parsed config.json and its raw bytes, keyed by the file's mtime so external
+# edits are picked up. Callers treat the returned dict as read-only.
+_cfg_cache = {'mtime': None, 'data': None, 'bytes': None}
+_cfg_lock = threading.Lock()
+
 def get_config() -> dict:
     """Loads the configuration from the JSON file, using defaults if the file doesn't exist."""
-    if not os.path.exists(CONFIG_FILE):
+    try:
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+    except FileNotFoundError:
         return DEFAULT_CONFIG
-    with open(CONFIG_FILE, 'r') as f:
-        return json.load(f)
+    with _cfg_lock:
+        if _cfg_cache['mtime'] == mtime:
+            return _cfg_cache['data']
+        with open(CONFIG_FILE, 'rb') as f:
+            raw = f.read()
+        data = json.loads(raw)
+        _cfg_cache['mtime'] = mtime
+        _cfg_cache['data'] = data
+        _cfg_cache['bytes'] = raw
+        return data
 
 def set_config(config: dict):
-    """Saves the configuration to the JSON file."""
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=4)
+    """
+    Saves the configuration to the JSON file.
+
+    Skips the write when the file already holds the same bytes; otherwise
+    writes a temp file and renames it so readers never see a partial file.
+    """
+    raw = json.dumps(config, indent=4).encode('utf-8')
+    with _cfg_lock:
+        try:
+            mtime = os.stat(CONFIG_FILE).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if mtime is not None and mtime == _cfg_cache['mtime'] and raw == _cfg_cache['bytes']:
+            return
+
+        # A unique temp file per write, so concurrent writers (other worker
+        # processes included) never write into each other's file
+        fd, tmp_file = tempfile.mkstemp(
+            dir=os.path.dirname(CONFIG_FILE), prefix='.config-', suffix='.tmp'
+        )
+        try:
+            # mkstemp creates the file 0600; keep config.json readable as before
+            os.chmod(tmp_file, 0o644)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(raw)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, CONFIG_FILE)
+        except BaseException:
+            try:
+                os.unlink(tmp_file)
+            except FileNotFoundError:
+                pass
+            raise
+        _cfg_cache['mtime'] = os.stat(CONFIG_FILE).st_mtime_ns
+        _cfg_cache['data'] = config
+        _cfg_cache['bytes'] = raw
 
 # Alias for backward compatibility
-save_config = set_config
\ No newline at end of file
+save_config = set_config
@@ -0,0 +1,70 @@
+"""
+CORS handling for the /api routes.
+
+Allowed origins come from CORS_ORIGINS (comma-separated, default '*') and
+are resolved once at registration, so each response only needs a prefix
+check and a set lookup. Preflight requests are answered before the other
+before_request hooks (auth, rate limiting, audit) run, and carry a max age
+(CORS_MAX_AGE seconds) so browsers can skip repeat preflights.
+"""
+
+import os
+import logging
+from typing import FrozenSet, Optional
+
+from flask import Flask, request
+
+logger = logging.getLogger(__name__)
+
+CORS_PATH_PREFIX = '/api/'
+CORS_ALLOW_METHODS = 'DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT'
+CORS_MAX_AGE = os.environ.get('CORS_MAX_AGE', '600')
+
+
+def _parse_origins(value: str) -> Optional[FrozenSet[str]]:
+    """None means any origin is allowed."""
+    if value.strip() == '*':
+        return None
+    return frozenset(origin.strip() for origin in value.split(',') if origin.strip())
+
+
+def register_cors(app: Flask, origins: Optional[str] = None):
+    """
+    Add CORS headers to /api responses and answer preflight requests.
+
+    Matches the previous Flask-Cors setup: a wildcard origin by default, or
+    the request origin echoed back (with Vary: Origin) when it is listed.
+    """
+    allowed = _parse_origins(origins if origins is not None else os.environ.get('CORS_ORIGINS', '*'))
+
+    def _allow_origin() -> Optional[str]:
+        if allowed is None:
+            return '*'
+        origin = request.headers.get('Origin')
+        return origin if origin in allowed else None
+
+    @app.before_request
+    def cors_preflight():
+        if (request.method == 'OPTIONS'
+                and request.path.startswith(CORS_PATH_PREFIX)
+                and 'Access-Control-Request-Method' in request.headers):
+            response = app.response_class(status=204)
+            if _allow_origin():
+                response.headers['Access-Control-Allow-Methods'] = CORS_ALLOW_METHODS
+                response.headers['Access-Control-Max-Age'] = CORS_MAX_AGE
+                requested_headers = request.headers.get('Access-Control-Request-Headers')
+                if requested_headers:
+                    response.headers['Access-Control-Allow-Headers'] = requested_headers
+            return response
+
+    @app.after_request
+    def cors_headers(response):
+        if request.path.startswith(CORS_PATH_PREFIX):
+            allow_origin = _allow_origin()
+            if allow_origin:
+                response.headers['Access-Control-Allow-Origin'] = allow_origin
+            if allowed is not None:
+                response.vary.add('Origin')
+        return response
+
+    logger.info(f"CORS enabled for {CORS_PATH_PREFIX}* ({'any origin' if allowed is None else ', '.join(sorted(allowed))})")
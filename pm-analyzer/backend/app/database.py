@@ -12,13 +12,21 @@ supported in both modes.
 """
 
 import os
+import re
+import atexit
 import sqlite3
 import logging
+import threading
+import uuid
 from contextlib import contextmanager
+from itertools import islice
+from functools import lru_cache
 from typing import Optional, Any
 
 from flask import g
 
+from app.btp_config import get_vcap_services
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -32,6 +40,12 @@ _default_db_path = os.path.join(
 
 DATABASE_PATH = os.environ.get('DATABASE_PATH', _default_db_path)
 
+# Rows fetched per round trip by server-side (streaming) PostgreSQL cursors
+STREAM_ITERSIZE = 2000
+
+# Rows sent per executemany / execute_values call by bulk_insert()
+BULK_INSERT_CHUNK_SIZE = 1000
+
 SCHEMA_PATH = os.path.join(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
     'data', 'schema.sql'
@@ -43,6 +57,13 @@ SCHEMA_PG_PATH = os.path.join(
 )
 
 
+@lru_cache(maxsize=None)
+def _read_schema(path: str) -> str:
+    """Schema files do not change while the process runs, so read each once."""
+    with open(path, mode='r') as f:
+        return f.read()
+
+
 def _detect_database_type() -> str:
     """Detect which database backend to use based on environment."""
     # Explicit override
@@ -54,14 +75,9 @@ def _detect_database_type() -> str:
         return 'postgresql'
 
     # BTP Cloud Foundry environment
-    if os.environ.get('VCAP_SERVICES'):
-        import json
-        try:
-            services = json.loads(os.environ['VCAP_SERVICES'])
-            if services.get('postgresql-db') or services.get('postgresql'):
-                return 'postgresql'
-        except (json.JSONDecodeError, KeyError):
-            pass
+    services = get_vcap_services()
+    if services.get('postgresql-db') or services.get('postgresql'):
+        return 'postgresql'
 
     return 'sqlite'
 
@@ -69,6 +85,66 @@ def _detect_database_type() -> str:
 DATABASE_TYPE = _detect_database_type()
 
 
+# ---------------------------------------------------------------------------
+# SQLite per-thread connections (lazy-initialized)
+# ---------------------------------------------------------------------------
+
+# Applied once when a thread opens its connection. WAL lets readers run
+# alongside a writer; NORMAL sync is safe with WAL and avoids an fsync per commit.
+SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-64000',
+)
+
+_sqlite_local = threading.local()
+_sqlite_conns = set()
+_sqlite_conns_lock = threading.Lock()
+
+
+def _get_thread_sqlite_conn(slot: str = 'request') -> sqlite3.Connection:
+    """
+    Get this thread's SQLite connection for slot, opening it on first use.
+
+    Request handlers ('request') and get_db_connection() ('standalone') each
+    reuse a connection instead of reopening the database file per call; the
+    slots keep their transactions independent. A connection is reopened if
+    DATABASE_PATH changes.
+    """
+    conns = getattr(_sqlite_local, 'conns', None)
+    if conns is None:
+        conns = _sqlite_local.conns = {}
+    entry = conns.get(slot)
+    if entry is not None:
+        conn, path = entry
+        # Membership check picks up connections closed by close_pool()
+        if path == DATABASE_PATH and conn in _sqlite_conns:
+            return conn
+        _close_sqlite_conn(conn)
+
+    # check_same_thread=False only so close_pool() can close it at shutdown
+    conn = sqlite3.connect(DATABASE_PATH, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(pragma)
+    conns[slot] = (conn, DATABASE_PATH)
+    with _sqlite_conns_lock:
+        _sqlite_conns.add(conn)
+    logger.debug("Opened SQLite %s connection: %s", slot, DATABASE_PATH)
+    return conn
+
+
+def _close_sqlite_conn(conn: sqlite3.Connection):
+    with _sqlite_conns_lock:
+        _sqlite_conns.discard(conn)
+    conns = getattr(_sqlite_local, 'conns', {})
+    for slot, (slot_conn, _) in list(conns.items()):
+        if slot_conn is conn:
+            del conns[slot]
+    conn.close()
+
+
 # ---------------------------------------------------------------------------
 # PostgreSQL connection pool (lazy-initialized)
 # ---------------------------------------------------------------------------
@@ -83,25 +159,20 @@ def _get_pg_connection_string() -> str:
         return os.environ['DATABASE_URL']
 
     # BTP VCAP_SERVICES
-    if os.environ.get('VCAP_SERVICES'):
-        import json
-        try:
-            services = json.loads(os.environ['VCAP_SERVICES'])
-            pg_services = services.get('postgresql-db', []) or services.get('postgresql', [])
-            if pg_services:
-                creds = pg_services[0].get('credentials', {})
-                uri = creds.get('uri', '')
-                if uri:
-                    return uri
-                # Build from individual fields
-                host = creds.get('hostname', 'localhost')
-                port = creds.get('port', 5432)
-                dbname = creds.get('dbname', 'pm_analyzer')
-                user = creds.get('username', '')
-                password = creds.get('password', '')
-                return f"postgresql://{user}:{password}@{host}:{port}/{dbname}"
-        except (json.JSONDecodeError, KeyError):
-            pass
+    services = get_vcap_services()
+    pg_services = services.get('postgresql-db', []) or services.get('postgresql', [])
+    if pg_services:
+        creds = pg_services[0].get('credentials', {})
+        uri = creds.get('uri', '')
+        if uri:
+            return uri
+        # Build from individual fields
+        host = creds.get('hostname', 'localhost')
+        port = creds.get('port', 5432)
+        dbname = creds.get('dbname', 'pm_analyzer')
+        user = creds.get('username', '')
+        password = creds.get('password', '')
+        return f"postgresql://{user}:{password}@{host}:{port}/{dbname}"
 
     # Fallback to individual env vars
     host = os.environ.get('PG_HOST', 'localhost')
@@ -131,36 +202,99 @@ def _get_pg_pool():
 # DictRow wrapper for PostgreSQL (matches sqlite3.Row interface)
 # ---------------------------------------------------------------------------
 
+def _columns_from_description(description):
+    """Column names and name -> position index for a cursor description."""
+    columns = tuple(desc[0] for desc in description) if description else ()
+    return columns, {name: i for i, name in enumerate(columns)}
+
+
+@lru_cache(maxsize=4096)
+def _to_pg_query(query: str) -> str:
+    """Convert sqlite ? placeholders to psycopg2 %s, once per distinct query text."""
+    if '?' not in query:
+        return query
+    return query.replace('?', '%s')
+
+
+_FIRST_WORD = re.compile(r'\s*(\w+)')
+
+
+@lru_cache(maxsize=4096)
+def _is_read_query(query: str) -> bool:
+    """True for plain SELECT and SHOW statements that can run outside a transaction.
+
+    CTEs may modify data and locking reads need their transaction, so both
+    are treated as writes.
+    """
+    match = _FIRST_WORD.match(query)
+    if not match or match.group(1).upper() not in ('SELECT', 'SHOW'):
+        return False
+    upper = query.upper()
+    return 'FOR UPDATE' not in upper and 'FOR SHARE' not in upper
+
+
+_VALUES_CLAUSE = re.compile(r'VALUES\s*\([^)]*\)', re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _to_pg_values_query(query: str) -> Optional[str]:
+    """Rewrite INSERT ... VALUES (?, ...) to the VALUES %s form execute_values expects."""
+    pg_query, count = _VALUES_CLAUSE.subn('VALUES %s', query, count=1)
+    return pg_query if count else None
+
+
 class PgDictCursor:
     """Wraps a psycopg2 cursor to return dict-like rows (matching sqlite3.Row)."""
 
-    def __init__(self, cursor):
+    def __init__(self, cursor, connection=None):
         self._cursor = cursor
+        self._connection = connection
+        self._shape = None
+
+    def _columns(self):
+        # Parsed once per result set and shared by every DictRow. Resolved on
+        # first fetch: server-side cursors only have a description by then.
+        if self._shape is None:
+            self._shape = _columns_from_description(self._cursor.description)
+        return self._shape
 
     def execute(self, query, params=None):
-        # Convert ? placeholders to %s for PostgreSQL
-        pg_query = query.replace('?', '%s')
-        self._cursor.execute(pg_query, params)
+        if self._connection is not None:
+            self._connection._before_statement(query)
+        self._cursor.execute(_to_pg_query(query), params)
+        self._shape = None
         return self
 
     def executemany(self, query, params_list):
-        pg_query = query.replace('?', '%s')
-        self._cursor.executemany(pg_query, params_list)
+        if self._connection is not None:
+            self._connection._before_statement(query)
+        self._cursor.executemany(_to_pg_query(query), params_list)
+        self._shape = None
         return self
 
     def fetchone(self):
         row = self._cursor.fetchone()
         if row is None:
             return None
-        return DictRow(row, self._cursor.description)
+        return DictRow(row, *self._columns())
 
     def fetchall(self):
         rows = self._cursor.fetchall()
-        return [DictRow(row, self._cursor.description) for row in rows]
+        columns, col_index = self._columns()
+        return [DictRow(row, columns, col_index) for row in rows]
 
     def fetchmany(self, size=None):
         rows = self._cursor.fetchmany(size)
-        return [DictRow(row, self._cursor.description) for row in rows]
+        columns, col_index = self._columns()
+        return [DictRow(row, columns, col_index) for row in rows]
+
+    def __iter__(self):
+        """Yield rows lazily (batches of itersize for server-side cursors)."""
+        columns = col_index = None
+        for row in self._cursor:
+            if columns is None:
+                columns, col_index = self._columns()
+            yield DictRow(row, columns, col_index)
 
     @property
     def description(self):
@@ -179,42 +313,54 @@ class PgDictCursor:
 
 
 class DictRow:
-    """Row wrapper providing dict-like access by column name, matching sqlite3.Row."""
+    """
+    Row wrapper providing dict-like access by column name, matching sqlite3.Row.
+
+    The column names and name -> position index are shared by all rows of a
+    result set; each row only holds its value tuple.
+    """
+
+    __slots__ = ('_tuple', '_columns', '_col_index')
 
-    __slots__ = ('_data', '_columns')
+    def __init__(self, row_tuple, columns, col_index):
+        self._tuple = tuple(row_tuple)
+        self._columns = columns
+        self._col_index = col_index
 
-    def __init__(self, row_tuple, description):
-        self._columns = [desc[0] for desc in description] if description else []
-        self._data = dict(zip(self._columns, row_tuple))
+    @classmethod
+    def from_description(cls, row_tuple, description):
+        """Build a single row from a DB-API cursor description."""
+        return cls(row_tuple, *_columns_from_description(description))
 
     def __getitem__(self, key):
         if isinstance(key, int):
-            return list(self._data.values())[key]
-        return self._data[key]
+            return self._tuple[key]
+        return self._tuple[self._col_index[key]]
 
     def __contains__(self, key):
-        return key in self._data
+        return key in self._col_index
 
     def __iter__(self):
-        return iter(self._data.values())
+        return iter(self._tuple)
 
     def __len__(self):
-        return len(self._data)
+        return len(self._tuple)
 
     def keys(self):
-        return self._columns
+        return list(self._columns)
 
     def values(self):
-        return list(self._data.values())
+        return list(self._tuple)
 
     def items(self):
-        return list(self._data.items())
+        return list(zip(self._columns, self._tuple))
 
     def get(self, key, default=None):
-        return self._data.get(key, default)
+        index = self._col_index.get(key)
+        return default if index is None else self._tuple[index]
 
     def __repr__(self):
-        return f"DictRow({self._data})"
+        return f"DictRow({dict(zip(self._columns, self._tuple))})"
 
 
 # ---------------------------------------------------------------------------
@@ -222,31 +368,57 @@ class DictRow:
 # ---------------------------------------------------------------------------
 
 class PgConnectionWrapper:
-    """Wraps a psycopg2 connection to match the sqlite3.Connection interface."""
+    """
+    Wraps a psycopg2 connection to match the sqlite3.Connection interface.
+
+    The connection starts in autocommit mode, so read-only requests send no
+    BEGIN/COMMIT round trips. The first write (or server-side cursor) opens a
+    transaction, and commit()/rollback() end it and return to autocommit.
+    """
 
     def __init__(self, conn, pool):
         self._conn = conn
         self._pool = pool
         self._closed = False
 
+    def _begin(self):
+        if self._conn.autocommit:
+            self._conn.autocommit = False
+
+    def _before_statement(self, query):
+        if not _is_read_query(query):
+            self._begin()
+
+    def _end(self, finish):
+        if not self._conn.autocommit:
+            finish()
+            self._conn.autocommit = True
+
     def execute(self, query, params=None):
-        cursor = PgDictCursor(self._conn.cursor())
+        cursor = PgDictCursor(self._conn.cursor(), self)
         cursor.execute(query, params)
         return cursor
 
     def executemany(self, query, params_list):
-        cursor = PgDictCursor(self._conn.cursor())
+        cursor = PgDictCursor(self._conn.cursor(), self)
         cursor.executemany(query, params_list)
         return cursor
 
-    def cursor(self):
-        return PgDictCursor(self._conn.cursor())
+    def cursor(self, name=None):
+        """Client-side cursor, or a server-side cursor streaming rows if name is given."""
+        if name is None:
+            return PgDictCursor(self._conn.cursor(), self)
+        # Named cursors only exist inside a transaction
+        self._begin()
+        raw_cursor = self._conn.cursor(name=name)
+        raw_cursor.itersize = STREAM_ITERSIZE
+        return PgDictCursor(raw_cursor)
 
     def commit(self):
-        self._conn.commit()
+        self._end(self._conn.commit)
 
     def rollback(self):
-        self._conn.rollback()
+        self._end(self._conn.rollback)
 
     def close(self):
         if not self._closed:
@@ -283,21 +455,84 @@ def get_db():
         if DATABASE_TYPE == 'postgresql':
             pool = _get_pg_pool()
             raw_conn = pool.getconn()
-            raw_conn.autocommit = False
+            raw_conn.autocommit = True
             db = g._database = PgConnectionWrapper(raw_conn, pool)
             logger.debug("Opened PostgreSQL connection from pool")
         else:
-            db = g._database = sqlite3.connect(DATABASE_PATH)
-            db.row_factory = sqlite3.Row
-            logger.debug(f"Opened SQLite connection: {DATABASE_PATH}")
+            db = g._database = _get_thread_sqlite_conn()
     return db
 
 
+def bulk_insert(db, query, rows, chunk_size=BULK_INSERT_CHUNK_SIZE) -> int:
+    """
+    Insert many rows with one statement per chunk instead of one per row.
+
+    Rows join the caller's open transaction, so a single commit() afterwards
+    covers all of them. PostgreSQL sends each chunk as one multi-row INSERT
+    via psycopg2.extras.execute_values. Returns the number of rows inserted.
+    """
+    if isinstance(db, PgConnectionWrapper):
+        rows = list(rows)
+        pg_query = _to_pg_values_query(query)
+        if rows and pg_query is not None:
+            from psycopg2.extras import execute_values
+            db._begin()
+            execute_values(db._conn.cursor(), pg_query, rows, page_size=chunk_size)
+            return len(rows)
+
+    rows = iter(rows)
+    total = 0
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return total
+        db.executemany(query, chunk)
+        total += len(chunk)
+
+
+# SQLSTATE undefined_table, carried by psycopg2 errors as pgcode
+PG_UNDEFINED_TABLE = '42P01'
+
+
+def is_missing_table_error(exc: BaseException) -> bool:
+    """True if exc means the queried table does not exist (SQLite or PostgreSQL)."""
+    if isinstance(exc, sqlite3.OperationalError):
+        return str(exc).startswith('no such table')
+    return getattr(exc, 'pgcode', None) == PG_UNDEFINED_TABLE
+
+
+def iter_rows(db, query, params=()):
+    """
+    Run a query and yield its rows lazily instead of materializing fetchall().
+
+    On PostgreSQL this uses a server-side cursor fetching STREAM_ITERSIZE rows
+    per round trip; sqlite3 cursors already step through results lazily.
+    """
+    if isinstance(db, PgConnectionWrapper):
+        cursor = db.cursor(name=f"stream_{uuid.uuid4().hex}")
+    else:
+        cursor = db.cursor()
+    try:
+        cursor.execute(query, params)
+        yield from cursor
+    finally:
+        cursor.close()
+
+
 def close_db(e=None):
-    """Close the database connection for the current request context."""
+    """
+    Release the database connection for the current request context.
+
+    PostgreSQL connections go back to the pool. The SQLite connection stays
+    open for the thread's next request; uncommitted work is rolled back.
+    """
     db = getattr(g, '_database', None)
     if db is not None:
-        db.close()
+        if isinstance(db, sqlite3.Connection):
+            if db.in_transaction:
+                db.rollback()
+        else:
+            db.close()
         g._database = None
 
 
@@ -311,7 +546,7 @@ def get_standalone_connection():
     if DATABASE_TYPE == 'postgresql':
         pool = _get_pg_pool()
         raw_conn = pool.getconn()
-        raw_conn.autocommit = False
+        raw_conn.autocommit = True
         return PgConnectionWrapper(raw_conn, pool)
     else:
         conn = sqlite3.connect(DATABASE_PATH)
@@ -329,7 +564,23 @@ def get_db_connection():
             cursor = conn.execute("SELECT * FROM QMEL")
             rows = cursor.fetchall()
             conn.commit()
+
+    On SQLite the outermost block on each thread reuses a per-thread
+    connection; nested blocks get their own connection as before.
     """
+    if DATABASE_TYPE != 'postgresql' and not getattr(_sqlite_local, 'standalone_busy', False):
+        conn = _get_thread_sqlite_conn('standalone')
+        _sqlite_local.standalone_busy = True
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            _sqlite_local.standalone_busy = False
+        return
+
     conn = get_standalone_connection()
     try:
         yield conn
@@ -352,31 +603,41 @@ def init_db():
         pool = _get_pg_pool()
         conn = pool.getconn()
         try:
-            with open(schema_file, mode='r') as f:
-                conn.cursor().execute(f.read())
+            conn.cursor().execute(_read_schema(schema_file))
             conn.commit()
             logger.info("PostgreSQL database initialized")
         finally:
             pool.putconn(conn)
     else:
-        if not os.path.exists(os.path.dirname(DATABASE_PATH)):
-            os.makedirs(os.path.dirname(DATABASE_PATH))
+        os.makedirs(os.path.dirname(DATABASE_PATH), exist_ok=True)
 
         with sqlite3.connect(DATABASE_PATH) as db:
-            with open(SCHEMA_PATH, mode='r') as f:
-                db.cursor().executescript(f.read())
+            db.cursor().executescript(_read_schema(SCHEMA_PATH))
             db.commit()
         logger.info(f"SQLite database initialized at {DATABASE_PATH}")
 
 
 def close_pool():
-    """Close the connection pool (call on app shutdown)."""
+    """Close the connection pool and SQLite thread connections (runs at exit)."""
     global _pg_pool
     if _pg_pool is not None:
         _pg_pool.closeall()
         _pg_pool = None
         logger.info("PostgreSQL connection pool closed")
 
+    with _sqlite_conns_lock:
+        conns = list(_sqlite_conns)
+        _sqlite_conns.clear()
+    for conn in conns:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+    _sqlite_local.conns = {}
+
+
+atexit.register(close_pool)
+
 
 def get_database_info() -> dict:
     """Return information about the current database configuration."""
@@ -0,0 +1,69 @@
+"""
+orjson-backed JSON provider for Flask.
+
+Installed as ``app.json`` so every ``jsonify`` call and ``request.get_json``
+uses orjson. The provider's sort_keys and compact settings are honoured; the
+app disables both sorting and indentation, so responses are compact and keep
+insertion order. Dates are encoded as HTTP date strings like Flask's default
+provider does. Values orjson cannot encode (e.g. integers wider than 64 bits)
+fall back to the stdlib encoder. Pydantic models are also accepted and
+encoded as their model_dump().
+"""
+
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes and decodes with orjson."""
+
+    @staticmethod
+    def default(o: Any) -> Any:
+        if isinstance(o, BaseModel):
+            return o.model_dump()
+        return DefaultJSONProvider.default(o)
+
+    def _options(self, indent: bool = False) -> int:
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def _dumpb(self, obj: Any, indent: bool = False) -> bytes:
+        try:
+            return orjson.dumps(obj, default=self.default, option=self._options(indent))
+        except orjson.JSONEncodeError:
+            kwargs = {'indent': 2} if indent else {'separators': (',', ':')}
+            return super().dumps(obj, **kwargs).encode('utf-8')
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return self._dumpb(obj).decode('utf-8')
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(
+            self._dumpb(obj, indent) + b'\n', mimetype=self.mimetype
+        )
+
+
+def init_json_provider(app) -> None:
+    """Use orjson for the app's JSON handling when it is installed."""
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
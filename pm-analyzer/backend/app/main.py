@@ -1,22 +1,38 @@
-from flask import Flask, request, jsonify, g
-from flask_cors import CORS
+from flask import Flask, Response, request, jsonify, g
 from dotenv import load_dotenv
 import os
 import re
+import csv
+import json
+import hashlib
+import time
+import threading
+import itertools
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import Future
+from dataclasses import asdict
 from datetime import datetime
-from typing import Tuple, Optional
+from io import StringIO
+from typing import Dict, Tuple, Optional
 from google.api_core import exceptions as google_exceptions
 import logging
 
 load_dotenv()
 
-from app.services.analysis_service import analyze_text, chat_with_assistant
-from app.services.data_service import get_all_notifications_summary, get_unified_notification
+from app.services.analysis_service import analyze_text, chat_with_assistant, fetch_active_rules
+from app.services.analysis_jobs import submit_analysis_job, get_analysis_job
+from app.services.data_service import (
+    get_all_notifications_summary,
+    get_unified_notification,
+    get_notifications_version,
+    invalidate_notifications_cache
+)
 from app.models import AnalysisResponse
 from app.config_manager import get_config, save_config
 from app.database import close_db, close_pool, get_database_info, DATABASE_TYPE
 from app.validators import (
-    validate_notification_id,
+    NotificationIdConverter,
     validate_language,
     validate_analysis_request,
     validate_chat_request,
@@ -25,6 +41,9 @@ from app.validators import (
 )
 from app.ai_governance import init_governance_db, create_governance_blueprint
 from app.openapi_spec import register_openapi
+from app.json_provider import init_json_provider
+from app.cors import register_cors
+from app.compression import init_compression
 from app.clerk_auth import register_clerk_auth, require_auth, require_role, require_admin, get_current_user
 from app.services.notification_service import get_notification_service, Alert, AlertSeverity, AlertType
 from app.services.alert_rules_service import get_alert_rules_service, AlertRule, RuleCondition, Subscription
@@ -52,14 +71,21 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
+init_json_provider(app)
+# Compact, insertion-ordered JSON even in debug mode (Flask 3 replacements for
+# JSONIFY_PRETTYPRINT_REGULAR / JSON_SORT_KEYS)
+app.json.compact = True
+app.json.sort_keys = False
+app.url_map.converters['notification_id'] = NotificationIdConverter
 
 # CORS Configuration - restrict origins in production
 # Set CORS_ORIGINS env var to comma-separated list of allowed origins
 # Example: CORS_ORIGINS=https://app.example.com,https://admin.example.com
-cors_origins = os.environ.get('CORS_ORIGINS', '*')
-if cors_origins != '*':
-    cors_origins = [origin.strip() for origin in cors_origins.split(',')]
-CORS(app, resources={r"/api/*": {"origins": cors_origins}})
+# Registered first so preflight requests skip the auth and rate-limit hooks.
+register_cors(app)
+
+# Compress large JSON and CSV responses (optional Flask-Compress)
+init_compression(app)
 
 # Initialize AI Governance database
 try:
@@ -108,18 +134,179 @@ register_monitoring(app)
 def teardown_db(exception):
     close_db(exception)
 
+# The health payload never changes while the process runs, so it is serialized
+# once. A fresh response is still built per request because after_request hooks
+# add headers to it.
+_HEALTH_BODY = app.json.dumps({
+    "status": "ok",
+    "database": get_database_info()['type'],
+    "version": "2.2.0"
+}).encode('utf-8')
+
+
 @app.route('/health', methods=['GET'])
-def health_check() -> Tuple[str, int]:
+def health_check():
     """Health check endpoint for monitoring."""
-    db_info = get_database_info()
-    return jsonify({
-        "status": "ok",
-        "database": db_info['type'],
-        "version": "2.2.0"
-    }), 200
+    return app.response_class(_HEALTH_BODY, status=200, mimetype='application/json')
 
 # --- Data Endpoints ---
 
+# Serialized responses built from notification data (the /api/notifications list,
+# the dashboards, the quality statistics and the combined reliability metrics):
+# key -> (expires_at, data version, body, etag).
+# Polling clients hit the same payloads repeatedly; entries expire after the TTL
+# or once a notification write bumps the data version. Each worker process has
+# its own cache, but the version is read from the database on every lookup, so
+# a write handled by any worker invalidates the entries of all of them.
+NOTIFICATIONS_CACHE_TTL_SECONDS = 10
+QUALITY_DASHBOARD_CACHE_TTL_SECONDS = 30
+QUALITY_STATS_CACHE_TTL_SECONDS = 30
+RELIABILITY_DASHBOARD_CACHE_TTL_SECONDS = 30
+RELIABILITY_METRICS_CACHE_TTL_SECONDS = 30
+NOTIFICATIONS_CACHE_MAX_ENTRIES = 256
+_notifications_cache: 'OrderedDict[tuple, Tuple[float, int, bytes, str]]' = OrderedDict()
+_notifications_cache_lock = threading.Lock()
+
+
+def _get_cached_notifications(key: tuple, version: int) -> Optional[Tuple[bytes, str]]:
+    with _notifications_cache_lock:
+        cached = _notifications_cache.get(key)
+        if cached is None:
+            return None
+        expires_at, cached_version, body, etag = cached
+        if cached_version != version or expires_at <= time.monotonic():
+            del _notifications_cache[key]
+            return None
+        _notifications_cache.move_to_end(key)
+        return body, etag
+
+
+def _cache_notifications(key: tuple, version: int, body: bytes, etag: str,
+                         ttl: int = NOTIFICATIONS_CACHE_TTL_SECONDS):
+    with _notifications_cache_lock:
+        _notifications_cache[key] = (time.monotonic() + ttl, version, body, etag)
+        _notifications_cache.move_to_end(key)
+        while len(_notifications_cache) > NOTIFICATIONS_CACHE_MAX_ENTRIES:
+            _notifications_cache.popitem(last=False)
+
+
+def _clear_notifications_cache():
+    with _notifications_cache_lock:
+        _notifications_cache.clear()
+
+
+# Full notification summaries shared by the quality and reliability endpoints:
+# language -> (expires_at, data version, notifications). The unpaginated
+# summary always holds every notification, so the endpoints' limit parameters
+# are not part of the key and all of them share one list per language.
+# Dashboards call several of these endpoints at once; callers must not mutate
+# the list.
+# Concurrent misses for the same key wait for a single in-flight read instead
+# of each scanning the database.
+SUMMARY_CACHE_TTL_SECONDS = 60
+SUMMARY_CACHE_MAX_ENTRIES = 8
+_summary_cache: 'OrderedDict[str, Tuple[float, int, list]]' = OrderedDict()
+_summary_inflight: Dict[tuple, Future] = {}
+_summary_cache_lock = threading.Lock()
+
+
+def _cached_notifications_summary(language: str) -> list:
+    """Unpaginated notification summary, reused until the TTL or a data write."""
+    key = language
+    version = get_notifications_version()
+    with _summary_cache_lock:
+        cached = _summary_cache.get(key)
+        if cached is not None:
+            expires_at, cached_version, notifications = cached
+            if cached_version == version and expires_at > time.monotonic():
+                _summary_cache.move_to_end(key)
+                return notifications
+            del _summary_cache[key]
+
+        inflight_key = (language, version)
+        pending = _summary_inflight.get(inflight_key)
+        if pending is None:
+            future = _summary_inflight[inflight_key] = Future()
+
+    if pending is not None:
+        return pending.result()
+
+    try:
+        notifications = get_all_notifications_summary(language, paginate=False)
+    except Exception as e:
+        with _summary_cache_lock:
+            del _summary_inflight[inflight_key]
+        future.set_exception(e)
+        raise
+
+    with _summary_cache_lock:
+        del _summary_inflight[inflight_key]
+        _summary_cache[key] = (time.monotonic() + SUMMARY_CACHE_TTL_SECONDS, version, notifications)
+        _summary_cache.move_to_end(key)
+        while len(_summary_cache) > SUMMARY_CACHE_MAX_ENTRIES:
+            _summary_cache.popitem(last=False)
+    future.set_result(notifications)
+    return notifications
+
+
+def _clear_summary_cache():
+    with _summary_cache_lock:
+        _summary_cache.clear()
+
+
+# (epoch second, formatted stamp); exports within the same second share it
+_filename_timestamp_cache: Tuple[int, str] = (-1, '')
+
+
+def _filename_timestamp() -> str:
+    """Local time as YYYYmmdd_HHMMSS for export file names."""
+    global _filename_timestamp_cache
+    second = int(time.time())
+    cached_second, stamp = _filename_timestamp_cache
+    if cached_second != second:
+        stamp = time.strftime('%Y%m%d_%H%M%S', time.localtime(second))
+        _filename_timestamp_cache = (second, stamp)
+    return stamp
+
+
+@lru_cache(maxsize=256)
+def _error_body(code: str, message: str) -> bytes:
+    return app.json.dumps({"error": {"code": code, "message": message}}).encode('utf-8') + b'\n'
+
+
+def _error_response(code: str, message: str, status: int):
+    """Error response for a fixed code/message, serialized once per distinct pair."""
+    return app.response_class(_error_body(code, message), status=status, mimetype='application/json')
+
+
+def _json_etag(body: bytes) -> str:
+    return hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+def _conditional_json(body: bytes, etag: str):
+    """JSON response with a weak ETag; 304 without a body if the client already has it."""
+    response = app.response_class(body, status=200, mimetype='application/json')
+    response.set_etag(etag, weak=True)
+    return response.make_conditional(request)
+
+
+def _cached_json_response(cache_key: tuple, build, ttl: int):
+    """
+    Serve build() as conditional JSON, reusing its serialized body.
+
+    The body is cached for ttl seconds or until notification data changes.
+    """
+    version = get_notifications_version()
+    cached = _get_cached_notifications(cache_key, version)
+    if cached is None:
+        body = app.json.dumps(build()).encode('utf-8')
+        etag = _json_etag(body)
+        _cache_notifications(cache_key, version, body, etag, ttl=ttl)
+    else:
+        body, etag = cached
+    return _conditional_json(body, etag)
+
+
 @app.route('/api/notifications', methods=['GET'])
 @require_auth
 def get_notifications():
@@ -150,35 +337,38 @@ def get_notifications():
             page = int(request.args.get('page', 1))
             page_size = int(request.args.get('page_size', 50))
         except ValueError:
-            return jsonify({"error": {"code": "BAD_REQUEST", "message": "page and page_size must be integers"}}), 400
+            return _error_response("BAD_REQUEST", "page and page_size must be integers", 400)
 
         if page < 1:
-            return jsonify({"error": {"code": "BAD_REQUEST", "message": "page must be >= 1"}}), 400
+            return _error_response("BAD_REQUEST", "page must be >= 1", 400)
         if page_size < 1 or page_size > 100:
-            return jsonify({"error": {"code": "BAD_REQUEST", "message": "page_size must be between 1 and 100"}}), 400
-
-        result = get_all_notifications_summary(language, page, page_size, paginate)
-
-        if paginate:
-            return jsonify(result), 200
+            return _error_response("BAD_REQUEST", "page_size must be between 1 and 100", 400)
+
+        cache_key = (language, paginate, page, page_size) if paginate else (language, False)
+        version = get_notifications_version()
+        cached = _get_cached_notifications(cache_key, version)
+        if cached is None:
+            result = get_all_notifications_summary(language, page, page_size, paginate)
+            if not paginate:
+                # Backward compatible response
+                result = {"value": result}
+            body = app.json.dumps(result).encode('utf-8')
+            etag = _json_etag(body)
+            _cache_notifications(cache_key, version, body, etag)
         else:
-            # Backward compatible response
-            return jsonify({"value": result}), 200
+            body, etag = cached
+
+        return _conditional_json(body, etag)
 
     except Exception as e:
         logger.exception("Error fetching notifications.")
-        return jsonify({"error": {"code": "INTERNAL_SERVER_ERROR", "message": "Failed to fetch notifications"}}), 500
+        return _error_response("INTERNAL_SERVER_ERROR", "Failed to fetch notifications", 500)
 
-@app.route('/api/notifications/<id>', methods=['GET'])
+@app.route('/api/notifications/<notification_id:id>', methods=['GET'])
 @require_auth
 def get_notification_detail(id):
     """Fetches a single notification with details."""
     try:
-        # Validate notification ID
-        is_valid, error = validate_notification_id(id)
-        if not is_valid:
-            return jsonify({"error": {"code": "BAD_REQUEST", "message": error}}), 400
-
         language = request.args.get('language', 'en')
 
         # Validate language
@@ -190,13 +380,59 @@ def get_notification_detail(id):
         if notification:
             return jsonify(notification), 200
         else:
-            return jsonify({"error": {"code": "NOT_FOUND", "message": "Notification not found"}}), 404
+            return _error_response("NOT_FOUND", "Notification not found", 404)
     except Exception as e:
         logger.exception(f"Error fetching notification {id}.")
-        return jsonify({"error": {"code": "INTERNAL_SERVER_ERROR", "message": "Failed to fetch notification"}}), 500
+        return _error_response("INTERNAL_SERVER_ERROR", "Failed to fetch notification", 500)
 
 # --- Analysis Endpoints ---
 
+# Analysis results keyed by a hash of the notification content, language, model
+# settings and the active Rule Manager rules. A changed notification or rule
+# hashes to a new key, so entries only need to expire. Results are not cached
+# when the rules could not be fetched, since the analysis then ran without them.
+ANALYSIS_CACHE_TTL_SECONDS = int(os.environ.get('ANALYSIS_CACHE_TTL_SECONDS', str(3600)))
+ANALYSIS_CACHE_MAX_ENTRIES = int(os.environ.get('ANALYSIS_CACHE_MAX_ENTRIES', '1024'))
+_analysis_cache: 'OrderedDict[str, Tuple[float, bytes]]' = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+
+def _analysis_cache_key(notification_data: dict, language: str, rules: list) -> str:
+    llm_settings = get_config().get('analysis_llm_settings', {})
+    payload = json.dumps([notification_data, language, llm_settings, rules], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _get_cached_analysis(key: str) -> Optional[bytes]:
+    with _analysis_cache_lock:
+        cached = _analysis_cache.get(key)
+        if cached is None:
+            return None
+        expires_at, body = cached
+        if expires_at <= time.monotonic():
+            del _analysis_cache[key]
+            return None
+        _analysis_cache.move_to_end(key)
+        return body
+
+
+def _cache_analysis(key: str, body: bytes):
+    with _analysis_cache_lock:
+        _analysis_cache[key] = (time.monotonic() + ANALYSIS_CACHE_TTL_SECONDS, body)
+        _analysis_cache.move_to_end(key)
+        while len(_analysis_cache) > ANALYSIS_CACHE_MAX_ENTRIES:
+            _analysis_cache.popitem(last=False)
+
+
+def _run_analysis(notification_data: dict, language: str, rules: Optional[list],
+                  cache_key: Optional[str]) -> dict:
+    """Run the LLM analysis and cache the serialized result when cache_key is set."""
+    result = analyze_text(notification_data, language, rules if rules is not None else []).dict()
+    if cache_key is not None:
+        _cache_analysis(cache_key, app.json.dumps(result).encode())
+    return result
+
+
 @app.route('/api/analyze', methods=['POST'])
 @require_auth
 def analyze() -> Tuple[str, int]:
@@ -215,30 +451,62 @@ def analyze() -> Tuple[str, int]:
         # Fetch from DB with correct language
         notification_data = get_unified_notification(data['notificationId'], language)
         if not notification_data:
-            return jsonify({"error": {"code": "NOT_FOUND", "message": "Notification ID not found"}}), 404
+            return _error_response("NOT_FOUND", "Notification ID not found", 404)
     else:
         # Use provided payload (Legacy/What-If mode)
         notification_data = data['notification']
 
+    # The current rules are part of the cache key; a failed fetch is not cached
+    rules = fetch_active_rules(notification_data.get('NotificationType', ''))
+    cache_key = None
+    if rules is not None:
+        cache_key = _analysis_cache_key(notification_data, language, rules)
+        cached = _get_cached_analysis(cache_key)
+        if cached is not None:
+            # Served directly, also for async requests: a 200 carries the final result
+            return app.response_class(cached, mimetype='application/json')
+
+    if request.args.get('async', '').lower() in ('1', 'true', 'yes'):
+        job = submit_analysis_job(
+            _run_analysis, notification_data, language, rules, cache_key,
+            error_handler=lambda e: _analysis_error(e)[0]['error']
+        )
+        return jsonify(job.to_dict()), 202
+
     try:
-        analysis_result = analyze_text(notification_data, language)
-        return jsonify(analysis_result.dict())
-    except google_exceptions.PermissionDenied as e:
+        return jsonify(_run_analysis(notification_data, language, rules, cache_key))
+    except Exception as e:
+        body, status = _analysis_error(e)
+        return jsonify(body), status
+
+
+@app.route('/api/analyze/<job_id>', methods=['GET'])
+@require_auth
+def analyze_job_status(job_id: str) -> Tuple[str, int]:
+    """Poll a background analysis started with POST /api/analyze?async=true."""
+    job = get_analysis_job(job_id)
+    if job is None:
+        return _error_response("NOT_FOUND", "Analysis job not found", 404)
+    return jsonify(job.to_dict()), 200
+
+
+def _analysis_error(e: Exception) -> Tuple[dict, int]:
+    """Map an analysis exception to the error body and status returned to clients."""
+    if isinstance(e, google_exceptions.PermissionDenied):
         logger.error(f"Google API permission denied: {e}")
-        return jsonify({
+        return {
             "error": {
                 "code": "API_PERMISSION_DENIED",
                 "message": "The backend server was denied access by the analysis service. Please check API configuration."
             }
-        }), 500
-    except Exception as e:
-        logger.exception("An unexpected error occurred during analysis.")
-        return jsonify({
-            "error": {
-                "code": "INTERNAL_SERVER_ERROR",
-                "message": "An unexpected error occurred during analysis"
-            }
-        }), 500
+        }, 500
+    logger.exception("An unexpected error occurred during analysis.", exc_info=e)
+    return {
+        "error": {
+            "code": "INTERNAL_SERVER_ERROR",
+            "message": "An unexpected error occurred during analysis"
+        }
+    }, 500
 
 
 @app.route('/api/chat', methods=['POST'])
@@ -261,11 +529,18 @@ def chat() -> Tuple[str, int]:
         # Convert the analysis data back into an AnalysisResponse object
         analysis_context = AnalysisResponse(**analysis_context_data)
 
+        if request.args.get('async', '').lower() in ('1', 'true', 'yes'):
+            job = submit_analysis_job(
+                chat_with_assistant, notification_data, question, analysis_context, language,
+                error_handler=_chat_error
+            )
+            return jsonify(job.to_dict()), 202
+
         # Call the chat assistant with the full context
         chat_result = chat_with_assistant(notification_data, question, analysis_context, language)
         return jsonify(chat_result)
     except ValueError as e:
-        logger.warning(f"Invalid analysis context data: {e}")
+        logger.warning("Invalid analysis context data: %s", e)
         return jsonify({
             "error": {
                 "code": "BAD_REQUEST",
@@ -282,6 +557,29 @@ def chat() -> Tuple[str, int]:
         }), 500
 
 
+@app.route('/api/chat/<job_id>', methods=['GET'])
+@require_auth
+def chat_job_status(job_id: str) -> Tuple[str, int]:
+    """
+    Poll a background chat started with POST /api/chat?async=true.
+
+    Chat jobs share the analysis job store, so any worker can answer the poll.
+    """
+    job = get_analysis_job(job_id)
+    if job is None:
+        return _error_response("NOT_FOUND", "Chat job not found", 404)
+    return jsonify(job.to_dict()), 200
+
+
+def _chat_error(e: Exception) -> dict:
+    """Error body exposed for a failed background chat."""
+    logger.exception("An unexpected error occurred during chat.", exc_info=e)
+    return {
+        "code": "INTERNAL_SERVER_ERROR",
+        "message": "An unexpected error occurred during chat"
+    }
+
+
 # --- Configuration Endpoints ---
 
 @app.route('/api/configuration', methods=['GET'])
@@ -289,11 +587,11 @@ def chat() -> Tuple[str, int]:
 def get_configuration():
     """Get the current application configuration."""
     try:
-        config = get_config()
-        return jsonify(config)
+        body = app.json.dumps(get_config()).encode('utf-8')
+        return _conditional_json(body, _json_etag(body))
     except Exception as e:
         logger.exception("Failed to read configuration.")
-        return jsonify({"error": {"code": "CONFIG_READ_ERROR", "message": "Failed to read configuration"}}), 500
+        return _error_response("CONFIG_READ_ERROR", "Failed to read configuration", 500)
 
 @app.route('/api/configuration', methods=['POST'])
 @require_admin
@@ -308,23 +606,62 @@ def set_configuration():
             return jsonify({"error": {"code": "BAD_REQUEST", "message": error}}), 400
 
         save_config(config_data)
+        # Other workers drop their summaries once they see the new data version
+        invalidate_notifications_cache()
+        _clear_summary_cache()
+        _clear_notifications_cache()
         logger.info("Configuration updated successfully")
         return jsonify({"status": "ok"}), 200
     except Exception as e:
         logger.exception("Failed to save configuration.")
-        return jsonify({"error": {"code": "CONFIG_WRITE_ERROR", "message": "Failed to save configuration"}}), 500
+        return _error_response("CONFIG_WRITE_ERROR", "Failed to save configuration", 500)
+
+
+@app.route('/api/configuration/cache', methods=['DELETE'])
+@require_admin
+def clear_configuration_cache():
+    """Drop cached notification summaries and list responses in every worker."""
+    # Bumping the shared data version makes the other workers discard their
+    # entries on their next lookup; this worker frees its memory right away.
+    invalidate_notifications_cache()
+    _clear_summary_cache()
+    _clear_notifications_cache()
+    logger.info("Notification caches cleared")
+    return jsonify({"status": "ok"}), 200
 
 
 # --- Data Quality Endpoints ---
 
 from app.services.data_quality_service import (
-    calculate_notification_quality,
+    cached_notification_quality,
     calculate_batch_quality,
-    calculate_quality_trend,
-    to_dict
+    calculate_quality_trend
 )
 
-@app.route('/api/quality/notification/<id>', methods=['GET'])
+
+# Longest analysis window accepted by the reliability endpoints
+MAX_PERIOD_DAYS = 3650
+
+
+def _positive_int_arg(name: str, default: int, maximum: Optional[int] = None) -> Optional[int]:
+    """
+    Positive integer query parameter, or None if it is present but malformed.
+
+    Values above maximum are clamped to it.
+    """
+    if name not in request.args:
+        return default
+    value = request.args.get(name, type=int)
+    if value is None or value <= 0:
+        return None
+    return min(value, maximum) if maximum is not None else value
+
+
+def _invalid_int_arg(name: str):
+    return _error_response("BAD_REQUEST", f"{name} must be a positive integer", 400)
+
+
+@app.route('/api/quality/notification/<notification_id:id>', methods=['GET'])
 @require_auth
 def get_notification_quality(id):
     """
@@ -333,22 +670,17 @@ def get_notification_quality(id):
     Returns comprehensive quality metrics including ALCOA+ compliance.
     """
     try:
-        # Validate notification ID
-        is_valid, error = validate_notification_id(id)
-        if not is_valid:
-            return jsonify({"error": {"code": "BAD_REQUEST", "message": error}}), 400
-
         language = request.args.get('language', 'en')
 
         # Get notification data
         notification = get_unified_notification(id, language)
         if not notification:
-            return jsonify({"error": {"code": "NOT_FOUND", "message": "Notification not found"}}), 404
+            return _error_response("NOT_FOUND", "Notification not found", 404)
 
         # Calculate quality score
-        quality_score = calculate_notification_quality(notification)
+        quality_score = cached_notification_quality(notification)
 
-        return jsonify(to_dict(quality_score))
+        return jsonify(quality_score)
 
     except Exception as e:
         logger.exception(f"Error calculating quality for notification {id}")
@@ -375,22 +707,15 @@ def get_batch_quality():
     """
     try:
         language = request.args.get('language', 'en')
-        limit = min(int(request.args.get('limit', 100)), 1000)
-
-        # Get notifications
-        result = get_all_notifications_summary(language, page=1, page_size=limit, paginate=False)
-
-        if not result:
-            return jsonify({
-                'count': 0,
-                'average_score': 0,
-                'message': 'No notifications found'
-            })
-
-        # Calculate batch quality
-        batch_stats = calculate_batch_quality(result)
-
-        return jsonify(batch_stats)
+        limit = _positive_int_arg('limit', 100, maximum=1000)
+        if limit is None:
+            return _invalid_int_arg('limit')
+
+        return _cached_json_response(
+            ('quality_batch', language, limit),
+            lambda: _build_batch_quality(language, limit),
+            QUALITY_STATS_CACHE_TTL_SECONDS
+        )
 
     except Exception as e:
         logger.exception("Error calculating batch quality")
@@ -402,6 +727,21 @@ def get_batch_quality():
         }), 500
 
 
+def _build_batch_quality(language: str, limit: int) -> dict:
+    # Get notifications
+    result = _cached_notifications_summary(language)
+
+    if not result:
+        return {
+            'count': 0,
+            'average_score': 0,
+            'message': 'No notifications found'
+        }
+
+    # Calculate batch quality
+    return calculate_batch_quality(result)
+
+
 @app.route('/api/quality/trend', methods=['GET'])
 @require_auth
 def get_quality_trend():
@@ -419,7 +759,9 @@ def get_quality_trend():
     try:
         language = request.args.get('language', 'en')
         period = request.args.get('period', 'weekly')
-        limit = min(int(request.args.get('limit', 500)), 2000)
+        limit = _positive_int_arg('limit', 500, maximum=2000)
+        if limit is None:
+            return _invalid_int_arg('limit')
 
         if period not in ['daily', 'weekly', 'monthly']:
             return jsonify({
@@ -429,16 +771,11 @@ def get_quality_trend():
                 }
             }), 400
 
-        # Get notifications
-        result = get_all_notifications_summary(language, page=1, page_size=limit, paginate=False)
-
-        if not result:
-            return jsonify([])
-
-        # Calculate trend
-        trends = calculate_quality_trend(result, period)
-
-        return jsonify([to_dict(t) for t in trends])
+        return _cached_json_response(
+            ('quality_trend', language, period, limit),
+            lambda: _build_quality_trend(language, period, limit),
+            QUALITY_STATS_CACHE_TTL_SECONDS
+        )
 
     except Exception as e:
         logger.exception("Error calculating quality trend")
@@ -450,6 +787,17 @@ def get_quality_trend():
         }), 500
 
 
+def _build_quality_trend(language: str, period: str, limit: int) -> list:
+    # Get notifications
+    result = _cached_notifications_summary(language)
+
+    if not result:
+        return []
+
+    # Calculate trend
+    return calculate_quality_trend(result, period)
+
+
 @app.route('/api/quality/dashboard', methods=['GET'])
 @require_auth
 def get_quality_dashboard():
@@ -457,53 +805,27 @@ def get_quality_dashboard():
     Get comprehensive data quality dashboard data.
 
     Returns all metrics needed for a quality dashboard in a single call.
+    The serialized dashboard is reused for QUALITY_DASHBOARD_CACHE_TTL_SECONDS
+    or until notification data changes, so generated_at may lag slightly.
+
+    Query Parameters:
+        language: Language code ('en' or 'de'), default 'en'
+        limit: Max notifications (default 200, max 500)
+        include_samples: If 'true', sample_scores lists up to 50 individual
+            scores; otherwise it is empty and only score_distribution is sent
     """
     try:
         language = request.args.get('language', 'en')
-        limit = min(int(request.args.get('limit', 200)), 500)
-
-        # Get notifications
-        notifications = get_all_notifications_summary(language, page=1, page_size=limit, paginate=False)
-
-        if not notifications:
-            return jsonify({
-                'summary': {'count': 0, 'average_score': 0},
-                'trends': [],
-                'top_issues': [],
-                'alcoa_compliance': {}
-            })
-
-        # Calculate all metrics
-        batch_stats = calculate_batch_quality(notifications)
-        weekly_trends = calculate_quality_trend(notifications, 'weekly')
-
-        # Get individual scores for distribution chart
-        individual_scores = []
-        for notif in notifications[:50]:  # Limit for performance
-            quality = calculate_notification_quality(notif)
-            individual_scores.append({
-                'notification_id': quality.notification_id,
-                'score': quality.overall_score,
-                'completeness': quality.completeness_score,
-                'accuracy': quality.accuracy_score
-            })
-
-        dashboard_data = {
-            'summary': {
-                'count': batch_stats['count'],
-                'average_score': batch_stats['average_score'],
-                'min_score': batch_stats.get('min_score', 0),
-                'max_score': batch_stats.get('max_score', 100),
-                'score_distribution': batch_stats['score_distribution']
-            },
-            'trends': [to_dict(t) for t in weekly_trends[-12:]],  # Last 12 weeks
-            'top_issues': batch_stats['common_issues'][:10],
-            'alcoa_compliance': batch_stats['alcoa_summary'],
-            'sample_scores': individual_scores,
-            'generated_at': datetime.now().isoformat()
-        }
-
-        return jsonify(dashboard_data)
+        limit = _positive_int_arg('limit', 200, maximum=500)
+        if limit is None:
+            return _invalid_int_arg('limit')
+        include_samples = request.args.get('include_samples', 'false').lower() == 'true'
+
+        return _cached_json_response(
+            ('quality_dashboard', language, limit, include_samples),
+            lambda: _build_quality_dashboard(language, limit, include_samples),
+            QUALITY_DASHBOARD_CACHE_TTL_SECONDS
+        )
 
     except Exception as e:
         logger.exception("Error generating quality dashboard")
@@ -515,6 +837,58 @@ def get_quality_dashboard():
         }), 500
 
 
+def _build_quality_dashboard(language: str, limit: int, include_samples: bool = False) -> dict:
+    # Get notifications
+    notifications = _cached_notifications_summary(language)
+
+    if not notifications:
+        return {
+            'summary': {'count': 0, 'average_score': 0},
+            'trends': [],
+            'top_issues': [],
+            'alcoa_compliance': {}
+        }
+
+    # Score each notification once and share the results
+    qualities = [cached_notification_quality(notif) for notif in notifications]
+    # Individual scores, when requested, come from the same pass
+    batch_stats = calculate_batch_quality(
+        notifications, qualities, collect_individuals=50 if include_samples else 0
+    )
+    weekly_trends = calculate_quality_trend(notifications, 'weekly', qualities)
+
+    dashboard_data = {
+        'summary': {
+            'count': batch_stats['count'],
+            'average_score': batch_stats['average_score'],
+            'min_score': batch_stats.get('min_score', 0),
+            'max_score': batch_stats.get('max_score', 100),
+            'score_distribution': batch_stats['score_distribution']
+        },
+        'trends': weekly_trends[-12:],  # Last 12 weeks
+        'top_issues': batch_stats['common_issues'][:10],
+        'alcoa_compliance': batch_stats['alcoa_summary'],
+        'sample_scores': batch_stats.get('individuals', []),
+        'generated_at': datetime.now().isoformat()
+    }
+
+    return dashboard_data
+
+
+# Column layout of the quality CSV export; the header line is built once.
+_QUALITY_EXPORT_ALCOA = (
+    'attributable', 'legible', 'contemporaneous', 'original', 'accurate',
+    'complete', 'consistent', 'enduring', 'available'
+)
+_QUALITY_EXPORT_FIELDS = (
+    'notification_id', 'overall_score', 'completeness_score',
+    'accuracy_score', 'timeliness_score', 'consistency_score',
+    'validity_score', *(f'alcoa_{p}' for p in _QUALITY_EXPORT_ALCOA),
+    'issue_count', 'recommendation_count'
+)
+_QUALITY_EXPORT_HEADER = ','.join(_QUALITY_EXPORT_FIELDS) + '\n'
+
+
 @app.route('/api/quality/export', methods=['GET'])
 @require_auth
 def export_quality_report():
@@ -528,59 +902,49 @@ def export_quality_report():
     Returns:
         CSV file with quality scores for all notifications
     """
-    import csv
-    from io import StringIO
-    from flask import Response
-
     try:
         language = request.args.get('language', 'en')
-        limit = min(int(request.args.get('limit', 500)), 2000)
+        limit = _positive_int_arg('limit', 500, maximum=2000)
+        if limit is None:
+            return _invalid_int_arg('limit')
 
         # Get notifications
-        notifications = get_all_notifications_summary(language, page=1, page_size=limit, paginate=False)
+        notifications = _cached_notifications_summary(language)
 
         if not notifications:
-            return jsonify({"error": {"code": "NOT_FOUND", "message": "No notifications found"}}), 404
-
-        # Generate CSV
-        output = StringIO()
-        fieldnames = [
-            'notification_id', 'overall_score', 'completeness_score',
-            'accuracy_score', 'timeliness_score', 'consistency_score',
-            'validity_score', 'alcoa_attributable', 'alcoa_legible',
-            'alcoa_contemporaneous', 'alcoa_original', 'alcoa_accurate',
-            'alcoa_complete', 'alcoa_consistent', 'alcoa_enduring',
-            'alcoa_available', 'issue_count', 'recommendation_count'
-        ]
-
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for notif in notifications:
-            quality = calculate_notification_quality(notif)
-
-            row = {
-                'notification_id': quality.notification_id,
-                'overall_score': quality.overall_score,
-                'completeness_score': quality.completeness_score,
-                'accuracy_score': quality.accuracy_score,
-                'timeliness_score': quality.timeliness_score,
-                'consistency_score': quality.consistency_score,
-                'validity_score': quality.validity_score,
-                'issue_count': len(quality.issues),
-                'recommendation_count': len(quality.recommendations)
-            }
-
-            # Add ALCOA+ compliance
-            for principle, met in quality.alcoa_compliance.items():
-                row[f'alcoa_{principle}'] = 'Yes' if met else 'No'
-
-            writer.writerow(row)
+            return _error_response("NOT_FOUND", "No notifications found", 404)
+
+        def generate():
+            # Stream one CSV line per notification instead of buffering the file
+            output = StringIO()
+            writer = csv.writer(output, lineterminator='\n')
+
+            yield _QUALITY_EXPORT_HEADER
+
+            for notif in notifications:
+                quality = cached_notification_quality(notif)
+                alcoa = quality.alcoa_compliance
+
+                writer.writerow((
+                    quality.notification_id,
+                    quality.overall_score,
+                    quality.completeness_score,
+                    quality.accuracy_score,
+                    quality.timeliness_score,
+                    quality.consistency_score,
+                    quality.validity_score,
+                    *(('Yes' if alcoa[p] else 'No') if p in alcoa else '' for p in _QUALITY_EXPORT_ALCOA),
+                    len(quality.issues),
+                    len(quality.recommendations)
+                ))
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate()
 
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = _filename_timestamp()
 
         return Response(
-            output.getvalue(),
+            generate(),
             mimetype='text/csv',
             headers={
                 'Content-Disposition': f'attachment; filename=quality_report_{timestamp}.csv'
@@ -618,14 +982,15 @@ def get_equipment_mtbf(equipment_id):
         MTBF in hours and days, failure count, trend analysis
     """
     try:
-        period_days = int(request.args.get('period_days', 365))
+        period_days = _positive_int_arg('period_days', 365, maximum=MAX_PERIOD_DAYS)
+        if period_days is None:
+            return _invalid_int_arg('period_days')
         language = request.args.get('language', 'en')
 
         # Get notifications to populate reliability data
-        notifications = get_all_notifications_summary(language, page=1, page_size=1000, paginate=False)
+        notifications = _cached_notifications_summary(language)
 
-        service = get_reliability_service()
-        service.load_notifications_as_failures(notifications)
+        service = get_reliability_service().for_notifications(notifications)
 
         mtbf = service.calculate_mtbf(equipment_id, period_days)
 
@@ -664,13 +1029,14 @@ def get_equipment_mttr(equipment_id):
         MTTR statistics including min, max, and trend
     """
     try:
-        period_days = int(request.args.get('period_days', 365))
+        period_days = _positive_int_arg('period_days', 365, maximum=MAX_PERIOD_DAYS)
+        if period_days is None:
+            return _invalid_int_arg('period_days')
         language = request.args.get('language', 'en')
 
-        notifications = get_all_notifications_summary(language, page=1, page_size=1000, paginate=False)
+        notifications = _cached_notifications_summary(language)
 
-        service = get_reliability_service()
-        service.load_notifications_as_failures(notifications)
+        service = get_reliability_service().for_notifications(notifications)
 
         mttr = service.calculate_mttr(equipment_id, period_days)
 
@@ -708,13 +1074,14 @@ def get_equipment_availability(equipment_id):
         Availability percentage, uptime/downtime hours
     """
     try:
-        period_days = int(request.args.get('period_days', 365))
+        period_days = _positive_int_arg('period_days', 365, maximum=MAX_PERIOD_DAYS)
+        if period_days is None:
+            return _invalid_int_arg('period_days')
         language = request.args.get('language', 'en')
 
-        notifications = get_all_notifications_summary(language, page=1, page_size=1000, paginate=False)
+        notifications = _cached_notifications_summary(language)
 
-        service = get_reliability_service()
-        service.load_notifications_as_failures(notifications)
+        service = get_reliability_service().for_notifications(notifications)
 
         availability = service.calculate_availability(equipment_id, period_days)
 
@@ -752,13 +1119,14 @@ def get_equipment_reliability_score(equipment_id):
         Overall reliability score, component scores, risk level, recommendations
     """
     try:
-        period_days = int(request.args.get('period_days', 365))
+        period_days = _positive_int_arg('period_days', 365, maximum=MAX_PERIOD_DAYS)
+        if period_days is None:
+            return _invalid_int_arg('period_days')
         language = request.args.get('language', 'en')
 
-        notifications = get_all_notifications_summary(language, page=1, page_size=1000, paginate=False)
+        notifications = _cached_notifications_summary(language)
 
-        service = get_reliability_service()
-        service.load_notifications_as_failures(notifications)
+        service = get_reliability_service().for_notifications(notifications)
 
         score = service.calculate_reliability_score(equipment_id, period_days)
 
@@ -798,13 +1166,14 @@ def get_equipment_predictive(equipment_id):
         Failure probability, recommended action, urgency, contributing factors
     """
     try:
-        period_days = int(request.args.get('period_days', 365))
+        period_days = _positive_int_arg('period_days', 365, maximum=MAX_PERIOD_DAYS)
+        if period_days is None:
+            return _invalid_int_arg('period_days')
         language = request.args.get('language', 'en')
 
-        notifications = get_all_notifications_summary(language, page=1, page_size=1000, paginate=False)
+        notifications = _cached_notifications_summary(language)
 
-        service = get_reliability_service()
-        service.load_notifications_as_failures(notifications)
+        service = get_reliability_service().for_notifications(notifications)
 
         predictive = service.generate_predictive_indicators(equipment_id, period_days)
 
@@ -842,13 +1211,14 @@ def get_equipment_weibull(equipment_id):
         Weibull shape/scale parameters, failure pattern, reliability estimates
     """
     try:
-        period_days = int(request.args.get('period_days', 365))
+        period_days = _positive_int_arg('period_days', 365, maximum=MAX_PERIOD_DAYS)
+        if period_days is None:
+            return _invalid_int_arg('period_days')
         language = request.args.get('language', 'en')
 
-        notifications = get_all_notifications_summary(language, page=1, page_size=1000, paginate=False)
+        notifications = _cached_notifications_summary(language)
 
-        service = get_reliability_service()
-        service.load_notifications_as_failures(notifications)
+        service = get_reliability_service().for_notifications(notifications)
 
         weibull = service.estimate_weibull_parameters(equipment_id, period_days)
 
@@ -870,6 +1240,57 @@ def get_equipment_weibull(equipment_id):
         }), 500
 
 
+@app.route('/api/reliability/equipment/<equipment_id>/all', methods=['GET'])
+@require_auth
+def get_equipment_all_metrics(equipment_id):
+    """
+    Get every reliability metric for equipment in a single call.
+
+    Query Parameters:
+        period_days: Analysis period in days (default 365)
+        language: Language for notifications (default 'en')
+
+    Returns:
+        mtbf, mttr, availability, score, predictive and weibull objects,
+        each shaped like the response of the matching per-metric endpoint
+    """
+    try:
+        period_days = _positive_int_arg('period_days', 365, maximum=MAX_PERIOD_DAYS)
+        if period_days is None:
+            return _invalid_int_arg('period_days')
+        language = request.args.get('language', 'en')
+
+        return _cached_json_response(
+            ('reliability_all', equipment_id, language, period_days),
+            lambda: _build_equipment_all_metrics(equipment_id, language, period_days),
+            RELIABILITY_METRICS_CACHE_TTL_SECONDS
+        )
+
+    except Exception as e:
+        logger.exception(f"Error calculating reliability metrics for equipment {equipment_id}")
+        return jsonify({
+            "error": {
+                "code": "INTERNAL_SERVER_ERROR",
+                "message": "Failed to calculate reliability metrics"
+            }
+        }), 500
+
+
+def _build_equipment_all_metrics(equipment_id: str, language: str, period_days: int) -> dict:
+    notifications = _cached_notifications_summary(language)
+
+    service = get_reliability_service().for_notifications(notifications)
+
+    return {
+        'mtbf': asdict(service.calculate_mtbf(equipment_id, period_days)),
+        'mttr': asdict(service.calculate_mttr(equipment_id, period_days)),
+        'availability': asdict(service.calculate_availability(equipment_id, period_days)),
+        'score': asdict(service.calculate_reliability_score(equipment_id, period_days)),
+        'predictive': asdict(service.generate_predictive_indicators(equipment_id, period_days)),
+        'weibull': asdict(service.estimate_weibull_parameters(equipment_id, period_days))
+    }
+
+
 @app.route('/api/reliability/fmea', methods=['GET'])
 @require_auth
 def get_fmea_analysis():
@@ -885,37 +1306,19 @@ def get_fmea_analysis():
         List of failure modes with RPN (Risk Priority Number) scores
     """
     try:
-        period_days = int(request.args.get('period_days', 365))
+        period_days = _positive_int_arg('period_days', 365, maximum=MAX_PERIOD_DAYS)
+        if period_days is None:
+            return _invalid_int_arg('period_days')
         language = request.args.get('language', 'en')
-        limit = int(request.args.get('limit', 20))
-
-        notifications = get_all_notifications_summary(language, page=1, page_size=1000, paginate=False)
-
-        service = get_reliability_service()
-        service.load_notifications_as_failures(notifications)
-
-        fmea_items = service.perform_fmea_analysis(period_days)
-
-        result = []
-        for item in fmea_items[:limit]:
-            result.append({
-                'failure_mode': item.failure_mode,
-                'potential_effect': item.potential_effect,
-                'severity': item.severity,
-                'occurrence': item.occurrence,
-                'detection': item.detection,
-                'rpn': item.rpn,
-                'recommended_action': item.recommended_action,
-                'current_controls': item.current_controls,
-                'equipment_affected': item.equipment_affected,
-                'occurrence_count': item.occurrence_count
-            })
-
-        return jsonify({
-            'fmea_items': result,
-            'total_count': len(fmea_items),
-            'period_days': period_days
-        })
+        limit = _positive_int_arg('limit', 20)
+        if limit is None:
+            return _invalid_int_arg('limit')
+
+        return _cached_json_response(
+            ('reliability_fmea', language, period_days, limit),
+            lambda: _build_fmea_analysis(language, period_days, limit),
+            RELIABILITY_METRICS_CACHE_TTL_SECONDS
+        )
 
     except Exception as e:
         logger.exception("Error performing FMEA analysis")
@@ -927,6 +1330,39 @@ def get_fmea_analysis():
         }), 500
 
 
+def _build_fmea_analysis(language: str, period_days: int, limit: int) -> dict:
+    notifications = _cached_notifications_summary(language)
+
+    service = get_reliability_service().for_notifications(notifications)
+
+    fmea_items = service.perform_fmea_analysis(period_days)
+
+    result = []
+    for item in fmea_items[:limit]:
+        result.append({
+            'failure_mode': item.failure_mode,
+            'potential_effect': item.potential_effect,
+            'severity': item.severity,
+            'occurrence': item.occurrence,
+            'detection': item.detection,
+            'rpn': item.rpn,
+            'recommended_action': item.recommended_action,
+            'current_controls': item.current_controls,
+            'equipment_affected': item.equipment_affected,
+            'occurrence_count': item.occurrence_count
+        })
+
+    return {
+        'fmea_items': result,
+        'total_count': len(fmea_items),
+        'period_days': period_days
+    }
+
+
+_ATTENTION_RISK_LEVELS = frozenset(('critical', 'high'))
+_ATTENTION_REQUIRED_LIMIT = 10
+
+
 @app.route('/api/reliability/dashboard', methods=['GET'])
 @require_auth
 def get_reliability_dashboard():
@@ -939,55 +1375,21 @@ def get_reliability_dashboard():
 
     Returns:
         Overall statistics, equipment summaries, top issues, FMEA highlights
+
+    The serialized dashboard is cached like the quality dashboard, for
+    RELIABILITY_DASHBOARD_CACHE_TTL_SECONDS or until notification data changes.
     """
     try:
-        period_days = int(request.args.get('period_days', 365))
+        period_days = _positive_int_arg('period_days', 365, maximum=MAX_PERIOD_DAYS)
+        if period_days is None:
+            return _invalid_int_arg('period_days')
         language = request.args.get('language', 'en')
 
-        notifications = get_all_notifications_summary(language, page=1, page_size=1000, paginate=False)
-
-        service = get_reliability_service()
-        service.load_notifications_as_failures(notifications)
-
-        # Get equipment summary
-        summary = service.get_equipment_summary(period_days)
-
-        # Get FMEA highlights
-        fmea_items = service.perform_fmea_analysis(period_days)
-        fmea_highlights = []
-        for item in fmea_items[:5]:
-            fmea_highlights.append({
-                'failure_mode': item.failure_mode,
-                'rpn': item.rpn,
-                'severity': item.severity,
-                'recommended_action': item.recommended_action
-            })
-
-        # Calculate overall metrics
-        equipment_summaries = summary.get('equipment_summaries', [])
-
-        # Get equipment requiring attention
-        attention_required = [
-            eq for eq in equipment_summaries
-            if eq['risk_level'] in ['critical', 'high'] or eq['failure_probability'] > 0.5
-        ]
-
-        dashboard_data = {
-            'summary': {
-                'total_equipment': summary['total_equipment'],
-                'average_reliability_score': summary['average_reliability_score'],
-                'average_availability': summary['average_availability'],
-                'critical_risk_count': summary['critical_risk_count'],
-                'high_risk_count': summary['high_risk_count']
-            },
-            'equipment_list': equipment_summaries[:20],  # Top 20
-            'attention_required': attention_required[:10],
-            'fmea_highlights': fmea_highlights,
-            'period_days': period_days,
-            'generated_at': datetime.now().isoformat()
-        }
-
-        return jsonify(dashboard_data)
+        return _cached_json_response(
+            ('reliability_dashboard', language, period_days),
+            lambda: _build_reliability_dashboard(language, period_days),
+            RELIABILITY_DASHBOARD_CACHE_TTL_SECONDS
+        )
 
     except Exception as e:
         logger.exception("Error generating reliability dashboard")
@@ -999,6 +1401,61 @@ def get_reliability_dashboard():
         }), 500
 
 
+def _build_reliability_dashboard(language: str, period_days: int) -> dict:
+    notifications = _cached_notifications_summary(language)
+
+    service = get_reliability_service().for_notifications(notifications)
+
+    # Get equipment summary
+    summary = service.get_equipment_summary(period_days)
+
+    # Get FMEA highlights
+    fmea_items = service.perform_fmea_analysis(period_days)
+    fmea_highlights = []
+    for item in fmea_items[:5]:
+        fmea_highlights.append({
+            'failure_mode': item.failure_mode,
+            'rpn': item.rpn,
+            'severity': item.severity,
+            'recommended_action': item.recommended_action
+        })
+
+    # Calculate overall metrics
+    equipment_summaries = summary.get('equipment_summaries', [])
+
+    # Get equipment requiring attention
+    attention_required = list(itertools.islice(
+        (eq for eq in equipment_summaries
+         if eq['risk_level'] in _ATTENTION_RISK_LEVELS or eq['failure_probability'] > 0.5),
+        _ATTENTION_REQUIRED_LIMIT
+    ))
+
+    dashboard_data = {
+        'summary': {
+            'total_equipment': summary['total_equipment'],
+            'average_reliability_score': summary['average_reliability_score'],
+            'average_availability': summary['average_availability'],
+            'critical_risk_count': summary['critical_risk_count'],
+            'high_risk_count': summary['high_risk_count']
+        },
+        'equipment_list': equipment_summaries[:20],  # Top 20
+        'attention_required': attention_required,
+        'fmea_highlights': fmea_highlights,
+        'period_days': period_days,
+        'generated_at': datetime.now().isoformat()
+    }
+
+    return dashboard_data
+
+
+_RELIABILITY_EXPORT_FIELDS = (
+    'equipment_id', 'reliability_score', 'availability_percent',
+    'risk_level', 'failure_probability', 'urgency',
+    'top_recommendation'
+)
+_RELIABILITY_EXPORT_HEADER = ','.join(_RELIABILITY_EXPORT_FIELDS) + '\n'
+
+
 @app.route('/api/reliability/export', methods=['GET'])
 @require_auth
 def export_reliability_report():
@@ -1012,47 +1469,44 @@ def export_reliability_report():
     Returns:
         CSV file with reliability metrics for all equipment
     """
-    import csv
-    from io import StringIO
-    from flask import Response
-
     try:
-        period_days = int(request.args.get('period_days', 365))
+        period_days = _positive_int_arg('period_days', 365, maximum=MAX_PERIOD_DAYS)
+        if period_days is None:
+            return _invalid_int_arg('period_days')
         language = request.args.get('language', 'en')
 
-        notifications = get_all_notifications_summary(language, page=1, page_size=1000, paginate=False)
+        notifications = _cached_notifications_summary(language)
 
-        service = get_reliability_service()
-        service.load_notifications_as_failures(notifications)
+        service = get_reliability_service().for_notifications(notifications)
 
         summary = service.get_equipment_summary(period_days)
         equipment_summaries = summary.get('equipment_summaries', [])
 
-        output = StringIO()
-        fieldnames = [
-            'equipment_id', 'reliability_score', 'availability_percent',
-            'risk_level', 'failure_probability', 'urgency',
-            'top_recommendation'
-        ]
-
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for eq in equipment_summaries:
-            writer.writerow({
-                'equipment_id': eq['equipment_id'],
-                'reliability_score': eq['reliability_score'],
-                'availability_percent': eq['availability'],
-                'risk_level': eq['risk_level'],
-                'failure_probability': eq['failure_probability'],
-                'urgency': eq['urgency'],
-                'top_recommendation': eq['recommendations'][0] if eq['recommendations'] else ''
-            })
+        def generate():
+            # Stream one CSV line per equipment instead of buffering the file
+            output = StringIO()
+            writer = csv.writer(output, lineterminator='\n')
+
+            yield _RELIABILITY_EXPORT_HEADER
+
+            for eq in equipment_summaries:
+                writer.writerow((
+                    eq['equipment_id'],
+                    eq['reliability_score'],
+                    eq['availability'],
+                    eq['risk_level'],
+                    eq['failure_probability'],
+                    eq['urgency'],
+                    eq['recommendations'][0] if eq['recommendations'] else ''
+                ))
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate()
 
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = _filename_timestamp()
 
         return Response(
-            output.getvalue(),
+            generate(),
             mimetype='text/csv',
             headers={
                 'Content-Disposition': f'attachment; filename=reliability_report_{timestamp}.csv'
@@ -1230,7 +1684,7 @@ def get_audit_report():
         }), 500
 
 
-@app.route('/api/audit/notification/<notification_id>/history', methods=['GET'])
+@app.route('/api/audit/notification/<notification_id:notification_id>/history', methods=['GET'])
 @require_role('admin', 'auditor')
 def get_notification_change_history(notification_id):
     """
@@ -1243,11 +1697,6 @@ def get_notification_change_history(notification_id):
         Notification version history with change reasons
     """
     try:
-        # Validate notification ID
-        is_valid, error = validate_notification_id(notification_id)
-        if not is_valid:
-            return jsonify({"error": {"code": "BAD_REQUEST", "message": error}}), 400
-
         service = get_change_document_service()
         history = service.get_notification_history(notification_id)
 
@@ -1364,7 +1813,7 @@ def create_time_confirmation(order_number):
         data = request.get_json()
 
         if not data:
-            return jsonify({"error": {"code": "BAD_REQUEST", "message": "Request body required"}}), 400
+            return _error_response("BAD_REQUEST", "Request body required", 400)
 
         username = data.get('username', 'SYSTEM')
         actual_work_hours = float(data.get('actual_work_hours', 0))
@@ -1405,6 +1854,12 @@ def create_time_confirmation(order_number):
         }), 500
 
 
+_AUDIT_EXPORT_FIELDS = (
+    'change_number', 'timestamp', 'user', 'object_type', 'object_id',
+    'change_type', 'table', 'field', 'old_value', 'new_value'
+)
+
+
 @app.route('/api/audit/export', methods=['GET'])
 @require_role('admin', 'auditor')
 def export_audit_report():
@@ -1420,10 +1875,6 @@ def export_audit_report():
     Returns:
         CSV file with audit trail data
     """
-    import csv
-    from io import StringIO
-    from flask import Response
-
     try:
         from_date = request.args.get('from_date')
         to_date = request.args.get('to_date')
@@ -1440,30 +1891,28 @@ def export_audit_report():
         )
 
         output = StringIO()
-        fieldnames = [
-            'change_number', 'timestamp', 'user', 'object_type', 'object_id',
-            'change_type', 'table', 'field', 'old_value', 'new_value'
-        ]
-
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
+        writer = csv.writer(output, lineterminator='\n')
+        writer.writerow(_AUDIT_EXPORT_FIELDS)
 
         for entry in history:
+            entry_columns = (
+                entry.change_number,
+                entry.timestamp.isoformat(),
+                entry.user,
+                entry.object_type,
+                entry.object_id,
+                entry.change_type
+            )
             for field_change in entry.fields_changed:
-                writer.writerow({
-                    'change_number': entry.change_number,
-                    'timestamp': entry.timestamp.isoformat(),
-                    'user': entry.user,
-                    'object_type': entry.object_type,
-                    'object_id': entry.object_id,
-                    'change_type': entry.change_type,
-                    'table': field_change.get('table', ''),
-                    'field': field_change.get('field', ''),
-                    'old_value': field_change.get('old_value', ''),
-                    'new_value': field_change.get('new_value', '')
-                })
-
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                writer.writerow((
+                    *entry_columns,
+                    field_change.get('table', ''),
+                    field_change.get('field', ''),
+                    field_change.get('old_value', ''),
+                    field_change.get('new_value', '')
+                ))
+
+        timestamp = _filename_timestamp()
 
         return Response(
             output.getvalue(),
@@ -1497,7 +1946,7 @@ REPORT_DB_PATH = os.path.join(
 )
 
 
-@app.route('/api/reports/notification/<notification_id>/pdf', methods=['GET'])
+@app.route('/api/reports/notification/<notification_id:notification_id>/pdf', methods=['GET'])
 @require_auth
 def get_notification_pdf_report(notification_id):
     """
@@ -1512,14 +1961,7 @@ def get_notification_pdf_report(notification_id):
     Returns:
         PDF file
     """
-    from flask import Response
-
     try:
-        # Validate notification ID
-        is_valid, error = validate_notification_id(notification_id)
-        if not is_valid:
-            return jsonify({"error": {"code": "BAD_REQUEST", "message": error}}), 400
-
         if not check_reportlab_available():
             return jsonify({
                 "error": {
@@ -1568,8 +2010,6 @@ def get_audit_pdf_report():
     Returns:
         PDF file
     """
-    from flask import Response
-
     try:
         if not check_reportlab_available():
             return jsonify({
@@ -1592,7 +2032,7 @@ def get_audit_pdf_report():
             username=username
         )
 
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = _filename_timestamp()
 
         return Response(
             pdf_bytes,
@@ -1624,8 +2064,6 @@ def get_quality_pdf_report():
     Returns:
         PDF file
     """
-    from flask import Response
-
     try:
         if not check_reportlab_available():
             return jsonify({
@@ -1640,7 +2078,7 @@ def get_quality_pdf_report():
         service = ReportGenerationService(REPORT_DB_PATH)
         pdf_bytes = service.generate_quality_report(period_days=period_days)
 
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = _filename_timestamp()
 
         return Response(
             pdf_bytes,
@@ -1669,8 +2107,6 @@ def get_reliability_pdf_report():
     Returns:
         PDF file
     """
-    from flask import Response
-
     try:
         if not check_reportlab_available():
             return jsonify({
@@ -1683,7 +2119,7 @@ def get_reliability_pdf_report():
         service = ReportGenerationService(REPORT_DB_PATH)
         pdf_bytes = service.generate_reliability_report()
 
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = _filename_timestamp()
 
         return Response(
             pdf_bytes,
@@ -1767,7 +2203,7 @@ def send_test_alert():
         data = request.get_json()
 
         if not data or not data.get('email'):
-            return jsonify({"error": {"code": "BAD_REQUEST", "message": "Email address required"}}), 400
+            return _error_response("BAD_REQUEST", "Email address required", 400)
 
         email = data['email']
 
@@ -1875,7 +2311,7 @@ def create_alert_rule():
         data = request.get_json()
 
         if not data:
-            return jsonify({"error": {"code": "BAD_REQUEST", "message": "Request body required"}}), 400
+            return _error_response("BAD_REQUEST", "Request body required", 400)
 
         required_fields = ['name', 'conditions', 'severity', 'alert_type']
         for field in required_fields:
@@ -1945,14 +2381,14 @@ def update_alert_rule(rule_id):
         data = request.get_json()
 
         if not data:
-            return jsonify({"error": {"code": "BAD_REQUEST", "message": "Request body required"}}), 400
+            return _error_response("BAD_REQUEST", "Request body required", 400)
 
         service = get_alert_rules_service()
 
         # Get existing rule
         existing_rule = service.get_rule(rule_id)
         if not existing_rule:
-            return jsonify({"error": {"code": "NOT_FOUND", "message": "Rule not found"}}), 404
+            return _error_response("NOT_FOUND", "Rule not found", 404)
 
         # Update fields
         if 'enabled' in data:
@@ -2014,7 +2450,7 @@ def delete_alert_rule(rule_id):
                 'status': 'deleted'
             })
         else:
-            return jsonify({"error": {"code": "NOT_FOUND", "message": "Rule not found"}}), 404
+            return _error_response("NOT_FOUND", "Rule not found", 404)
 
     except Exception as e:
         logger.exception(f"Error deleting alert rule {rule_id}")
@@ -2098,7 +2534,7 @@ def create_subscription():
         data = request.get_json()
 
         if not data:
-            return jsonify({"error": {"code": "BAD_REQUEST", "message": "Request body required"}}), 400
+            return _error_response("BAD_REQUEST", "Request body required", 400)
 
         current_user = get_current_user()
 
@@ -2108,7 +2544,7 @@ def create_subscription():
             user_email = current_user.get('email')
 
         if not user_email:
-            return jsonify({"error": {"code": "BAD_REQUEST", "message": "Email address required"}}), 400
+            return _error_response("BAD_REQUEST", "Email address required", 400)
 
         # Parse alert types
         alert_types = [AlertType(t) for t in data.get('alert_types', ['quality', 'reliability', 'compliance'])]
@@ -2167,7 +2603,7 @@ def update_subscription(subscription_id):
         data = request.get_json()
 
         if not data:
-            return jsonify({"error": {"code": "BAD_REQUEST", "message": "Request body required"}}), 400
+            return _error_response("BAD_REQUEST", "Request body required", 400)
 
         service = get_alert_rules_service()
         current_user = get_current_user()
@@ -2175,12 +2611,12 @@ def update_subscription(subscription_id):
         # Get existing subscription
         existing = service.get_subscription(subscription_id)
         if not existing:
-            return jsonify({"error": {"code": "NOT_FOUND", "message": "Subscription not found"}}), 404
+            return _error_response("NOT_FOUND", "Subscription not found", 404)
 
         # Check ownership (unless admin)
         is_admin = current_user and 'admin' in current_user.get('roles', [])
         if not is_admin and current_user.get('email') != existing.user_email:
-            return jsonify({"error": {"code": "FORBIDDEN", "message": "Cannot modify another user's subscription"}}), 403
+            return _error_response("FORBIDDEN", "Cannot modify another user's subscription", 403)
 
         # Update fields
         if 'enabled' in data:
@@ -2230,12 +2666,12 @@ def delete_subscription(subscription_id):
         # Get existing subscription
         existing = service.get_subscription(subscription_id)
         if not existing:
-            return jsonify({"error": {"code": "NOT_FOUND", "message": "Subscription not found"}}), 404
+            return _error_response("NOT_FOUND", "Subscription not found", 404)
 
         # Check ownership (unless admin)
         is_admin = current_user and 'admin' in current_user.get('roles', [])
         if not is_admin and current_user.get('email') != existing.user_email:
-            return jsonify({"error": {"code": "FORBIDDEN", "message": "Cannot delete another user's subscription"}}), 403
+            return _error_response("FORBIDDEN", "Cannot delete another user's subscription", 403)
 
         service.remove_subscription(subscription_id)
 
@@ -2271,7 +2707,7 @@ def evaluate_alerts():
         data = request.get_json()
 
         if not data or 'data' not in data:
-            return jsonify({"error": {"code": "BAD_REQUEST", "message": "Data object required"}}), 400
+            return _error_response("BAD_REQUEST", "Data object required", 400)
 
         service = get_alert_rules_service()
         alerts = service.evaluate_and_alert(
@@ -2436,7 +2872,7 @@ def disconnect_from_sap():
         }), 500
 
 
-@app.route('/api/sap/notifications/<notification_id>', methods=['GET'])
+@app.route('/api/sap/notifications/<notification_id:notification_id>', methods=['GET'])
 @require_auth
 def get_sap_notification(notification_id):
     """
@@ -2449,11 +2885,6 @@ def get_sap_notification(notification_id):
         Notification data from SAP
     """
     try:
-        # Validate notification ID
-        is_valid, error = validate_notification_id(notification_id)
-        if not is_valid:
-            return jsonify({"error": {"code": "BAD_REQUEST", "message": error}}), 400
-
         service = get_sap_service()
 
         if not service.is_connected():
@@ -2509,7 +2940,7 @@ def create_sap_notification():
         data = request.get_json()
 
         if not data:
-            return jsonify({"error": {"code": "BAD_REQUEST", "message": "Request body required"}}), 400
+            return _error_response("BAD_REQUEST", "Request body required", 400)
 
         service = get_sap_service()
 
@@ -2824,7 +3255,7 @@ def create_api_key():
         data = request.get_json()
 
         if not data or not data.get('name'):
-            return jsonify({"error": {"code": "BAD_REQUEST", "message": "Key name required"}}), 400
+            return _error_response("BAD_REQUEST", "Key name required", 400)
 
         current_user = get_current_user()
         created_by = current_user.get('email') if current_user else 'admin'
@@ -2904,7 +3335,7 @@ def revoke_api_key(key_id):
                 'status': 'revoked'
             })
         else:
-            return jsonify({"error": {"code": "NOT_FOUND", "message": "API key not found"}}), 404
+            return _error_response("NOT_FOUND", "API key not found", 404)
 
     except Exception as e:
         logger.exception(f"Error revoking API key {key_id}")
@@ -3073,7 +3504,7 @@ def invalidate_other_sessions():
 
         current_user = get_current_user()
         if not current_user:
-            return jsonify({"error": {"code": "UNAUTHORIZED", "message": "Not authenticated"}}), 401
+            return _error_response("UNAUTHORIZED", "Not authenticated", 401)
 
         user_id = current_user.get('user_id') or current_user.get('email')
         current_session = getattr(g, 'session_id', None)
@@ -3457,7 +3888,7 @@ def get_tenant(tenant_id):
         tenant_service = get_tenant_service()
         tenant = tenant_service.get_tenant(tenant_id)
         if not tenant:
-            return jsonify({"error": {"code": "NOT_FOUND", "message": "Tenant not found"}}), 404
+            return _error_response("NOT_FOUND", "Tenant not found", 404)
 
         usage = tenant_service.get_usage_summary(tenant_id)
         result = tenant.to_dict()
@@ -3477,12 +3908,12 @@ def update_tenant_plan(tenant_id):
         data = request.get_json()
         plan = data.get('plan')
         if not plan:
-            return jsonify({"error": {"code": "BAD_REQUEST", "message": "plan is required"}}), 400
+            return _error_response("BAD_REQUEST", "plan is required", 400)
 
         tenant_service = get_tenant_service()
         tenant = tenant_service.update_tenant_plan(tenant_id, plan)
         if not tenant:
-            return jsonify({"error": {"code": "BAD_REQUEST", "message": "Invalid plan"}}), 400
+            return _error_response("BAD_REQUEST", "Invalid plan", 400)
 
         return jsonify(tenant.to_dict())
 
@@ -3544,7 +3975,7 @@ def provision_trial():
         data = request.get_json() or {}
         subdomain = data.get('subdomain')
         if not subdomain:
-            return jsonify({"error": {"code": "BAD_REQUEST", "message": "subdomain is required"}}), 400
+            return _error_response("BAD_REQUEST", "subdomain is required", 400)
 
         # Sanitize subdomain
         subdomain = re.sub(r'[^a-z0-9-]', '', subdomain.lower().strip())
@@ -4094,9 +4525,9 @@ def create_gdpr_request():
         subject_email = data.get('subject_email')
 
         if request_type not in ('access', 'erasure', 'portability', 'rectification', 'restriction'):
-            return jsonify({"error": {"code": "BAD_REQUEST", "message": "Invalid request_type"}}), 400
+            return _error_response("BAD_REQUEST", "Invalid request_type", 400)
         if not subject_email:
-            return jsonify({"error": {"code": "BAD_REQUEST", "message": "subject_email is required"}}), 400
+            return _error_response("BAD_REQUEST", "subject_email is required", 400)
 
         user = get_current_user()
         tenant_id = getattr(g, 'tenant_id', 'default')
@@ -4135,7 +4566,7 @@ def get_gdpr_request(request_id):
         gdpr = get_gdpr_service()
         dsr = gdpr.get_request(request_id)
         if not dsr:
-            return jsonify({"error": {"code": "NOT_FOUND", "message": "Request not found"}}), 404
+            return _error_response("NOT_FOUND", "Request not found", 404)
         return jsonify(dsr.to_dict())
     except Exception as e:
         logger.exception(f"Error getting GDPR request {request_id}")
@@ -4150,7 +4581,7 @@ def execute_gdpr_request(request_id):
         gdpr = get_gdpr_service()
         dsr = gdpr.get_request(request_id)
         if not dsr:
-            return jsonify({"error": {"code": "NOT_FOUND", "message": "Request not found"}}), 404
+            return _error_response("NOT_FOUND", "Request not found", 404)
 
         user = get_current_user()
         processed_by = user.get('user_id', 'admin') if user else 'admin'
@@ -4211,7 +4642,7 @@ def record_consent():
         granted = data.get('granted', True)
 
         if not purpose:
-            return jsonify({"error": {"code": "BAD_REQUEST", "message": "purpose is required"}}), 400
+            return _error_response("BAD_REQUEST", "purpose is required", 400)
 
         user = get_current_user()
         user_id = user.get('user_id', 'unknown') if user else 'unknown'
@@ -4263,7 +4694,7 @@ def revoke_consent(purpose):
         if revoked:
             return jsonify({'status': 'revoked', 'purpose': purpose})
         else:
-            return jsonify({"error": {"code": "NOT_FOUND", "message": "No active consent found"}}), 404
+            return _error_response("NOT_FOUND", "No active consent found", 404)
 
     except Exception as e:
         logger.exception(f"Error revoking consent for {purpose}")
@@ -4492,7 +4923,6 @@ def import_template(file_format):
         file_format: 'csv' or 'json'
     """
     from app.services.import_service import get_import_template
-    from flask import Response
 
     if file_format not in ('csv', 'json'):
         return jsonify({"error": {"code": "BAD_REQUEST",
@@ -4580,6 +5010,27 @@ def import_formats():
     }), 200
 
 
+def warm_caches():
+    """
+    Fill the per-process caches the dashboards rely on before serving.
+
+    Called from the gunicorn post_worker_init hook so the first reliability
+    or quality request in each worker does not pay for the config read, the
+    full notification summary and the failure event rebuild. Failures are
+    logged and otherwise ignored; the caches then fill on first use.
+    """
+    started = time.monotonic()
+    try:
+        with app.app_context():
+            get_config()
+            notifications = _cached_notifications_summary('en')
+            get_reliability_service().for_notifications(notifications)
+        logger.info(f"Caches warmed with {len(notifications)} notifications "
+                    f"in {time.monotonic() - started:.2f}s")
+    except Exception as e:
+        logger.warning(f"Cache warmup failed: {e}")
+
+
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5001))
     # Use debug mode only in development
@@ -91,7 +91,7 @@ def _get_tenant_id() -> Optional[str]:
     Resolution order:
     1. X-Tenant-ID header (set by approuter or test clients)
     2. Clerk org_id from JWT (direct-sales model via Clerk organizations)
-    3. Clerk org_id from Flask g.current_user (set by clerk_auth_middleware)
+    3. Clerk org_id from Flask g (claims set by clerk_auth_middleware)
     4. BTP XSUAA zid claim from JWT (BTP marketplace model)
     5. TENANT_ID environment variable (single-tenant dev mode)
     """
@@ -124,7 +124,10 @@ def _get_tenant_id() -> Optional[str]:
         except (IndexError, ValueError, Exception):
             pass
 
-    # Check Flask g for Clerk user org_id (set by clerk_auth_middleware)
+    # Check Flask g for Clerk org_id (claims set by clerk_auth_middleware)
+    claims = getattr(g, 'current_user_claims', None)
+    if claims and claims.get('org_id'):
+        return claims['org_id']
     user = getattr(g, 'current_user', None)
     if user and hasattr(user, 'org_id') and user.org_id:
         return user.org_id
@@ -336,6 +336,12 @@ No rate limiting is currently enforced. Implement rate limiting for production u
                         "name": "limit",
                         "in": "query",
                         "schema": {"type": "integer", "default": 200, "maximum": 500}
+                    },
+                    {
+                        "name": "include_samples",
+                        "in": "query",
+                        "description": "Include up to 50 individual scores in sample_scores",
+                        "schema": {"type": "boolean", "default": False}
                     }
                 ],
                 "responses": {
@@ -415,6 +421,48 @@ No rate limiting is currently enforced. Implement rate limiting for production u
                 }
             }
         },
+        "/api/reliability/equipment/{equipment_id}/all": {
+            "get": {
+                "tags": ["Reliability"],
+                "summary": "Get all reliability metrics for equipment",
+                "description": "MTBF, MTTR, availability, reliability score, predictive indicators and Weibull parameters in one response",
+                "operationId": "getEquipmentAllMetrics",
+                "parameters": [
+                    {
+                        "name": "equipment_id",
+                        "in": "path",
+                        "required": True,
+                        "schema": {"type": "string"}
+                    },
+                    {
+                        "name": "period_days",
+                        "in": "query",
+                        "schema": {"type": "integer", "default": 365}
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Reliability metrics keyed by metric name",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "mtbf": {"$ref": "#/components/schemas/MTBFResponse"},
+                                        "mttr": {"$ref": "#/components/schemas/MTTRResponse"},
+                                        "availability": {"type": "object"},
+                                        "score": {"type": "object"},
+                                        "predictive": {"type": "object"},
+                                        "weibull": {"type": "object"}
+                                    }
+                                }
+                            }
+                        }
+                    },
+                    "500": {"$ref": "#/components/responses/InternalError"}
+                }
+            }
+        },
         "/api/reliability/fmea": {
             "get": {
                 "tags": ["Reliability"],
@@ -690,6 +738,29 @@ No rate limiting is currently enforced. Implement rate limiting for production u
                     "500": {"$ref": "#/components/responses/InternalError"}
                 }
             }
+        },
+        "/api/configuration/cache": {
+            "delete": {
+                "tags": ["Configuration"],
+                "summary": "Clear notification caches",
+                "description": "Drop cached notification summaries and list responses so the next request reads the database",
+                "operationId": "clearConfigurationCache",
+                "responses": {
+                    "200": {
+                        "description": "Caches cleared",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "status": {"type": "string", "example": "ok"}
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
         }
     },
     "components": {
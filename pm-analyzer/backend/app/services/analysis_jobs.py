@@ -0,0 +1,203 @@
+"""
+Background Analysis Jobs for PM Notification Analyzer
+
+Runs LLM notification analysis and assistant chat on a small worker pool
+so the request thread can return immediately with a job id. Clients poll
+the job until it has finished or failed.
+
+Job state is kept in the analysis_jobs table rather than in memory, so a
+job submitted to one worker process can be polled through any other. The
+job itself runs on the pool of the worker that accepted it. Jobs expire
+ANALYSIS_JOB_TTL_SECONDS after they finish; jobs that never finish (their
+worker was stopped) expire the same time after they were created.
+"""
+
+import os
+import json
+import time
+import uuid
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from app.database import get_db_connection, is_missing_table_error
+
+logger = logging.getLogger(__name__)
+
+ANALYSIS_WORKERS = int(os.environ.get('ANALYSIS_WORKERS', '4'))
+ANALYSIS_JOB_TTL_SECONDS = int(os.environ.get('ANALYSIS_JOB_TTL_SECONDS', '600'))
+ANALYSIS_MAX_JOBS = int(os.environ.get('ANALYSIS_MAX_JOBS', '1000'))
+
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_FINISHED = 'finished'
+JOB_FAILED = 'failed'
+
+
+@dataclass
+class AnalysisJob:
+    """State of a single background analysis."""
+    id: str
+    status: str = JOB_QUEUED
+    created_at: float = 0.0
+    finished_at: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[Dict[str, str]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {'job_id': self.id, 'status': self.status}
+        if self.status == JOB_FINISHED:
+            data['result'] = self.result
+        elif self.status == JOB_FAILED:
+            data['error'] = self.error
+        return data
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+_JOB_COLUMNS = "id, status, created_at, finished_at, result, error"
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=ANALYSIS_WORKERS,
+                    thread_name_prefix='analysis-job'
+                )
+    return _executor
+
+
+def _create_jobs_table(conn) -> None:
+    """Create the analysis_jobs table on databases that predate it."""
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS analysis_jobs ("
+        "id TEXT PRIMARY KEY, status TEXT NOT NULL, created_at REAL NOT NULL, "
+        "finished_at REAL, result TEXT, error TEXT)"
+    )
+
+
+def _execute(query: str, params: tuple = (), fetch: bool = False):
+    """Run query in its own transaction, creating the table if it is missing."""
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.execute(query, params)
+            return cursor.fetchone() if fetch else None
+    except Exception as e:
+        if not is_missing_table_error(e):
+            raise
+        logger.info("analysis_jobs table missing; creating it")
+        with get_db_connection() as conn:
+            _create_jobs_table(conn)
+    with get_db_connection() as conn:
+        cursor = conn.execute(query, params)
+        return cursor.fetchone() if fetch else None
+
+
+def _prune_jobs(now: float) -> None:
+    """Drop expired jobs and cap the table size."""
+    cutoff = now - ANALYSIS_JOB_TTL_SECONDS
+    _execute(
+        "DELETE FROM analysis_jobs WHERE finished_at < ? OR (finished_at IS NULL AND created_at < ?)",
+        (cutoff, cutoff)
+    )
+    _execute(
+        "DELETE FROM analysis_jobs WHERE created_at < ("
+        "SELECT created_at FROM analysis_jobs ORDER BY created_at DESC LIMIT 1 OFFSET ?)",
+        (ANALYSIS_MAX_JOBS - 1,)
+    )
+
+
+def _job_from_row(row) -> AnalysisJob:
+    return AnalysisJob(
+        id=row['id'],
+        status=row['status'],
+        created_at=row['created_at'],
+        finished_at=row['finished_at'],
+        result=json.loads(row['result']) if row['result'] is not None else None,
+        error=json.loads(row['error']) if row['error'] is not None else None
+    )
+
+
+def _save_job(job: AnalysisJob) -> None:
+    _execute(
+        "UPDATE analysis_jobs SET status = ?, finished_at = ?, result = ?, error = ? WHERE id = ?",
+        (
+            job.status,
+            job.finished_at,
+            json.dumps(job.result, default=str) if job.result is not None else None,
+            json.dumps(job.error) if job.error is not None else None,
+            job.id
+        )
+    )
+
+
+def _run_job(job: AnalysisJob, func: Callable[..., Any], args: tuple,
+             error_handler: Optional[Callable[[Exception], Dict[str, str]]]) -> None:
+    job.status = JOB_RUNNING
+    _save_job(job)
+    try:
+        result = func(*args)
+        job.result = result.dict() if hasattr(result, 'dict') else result
+        job.status = JOB_FINISHED
+    except Exception as e:
+        if error_handler:
+            job.error = error_handler(e)
+        else:
+            logger.exception(f"Analysis job {job.id} failed.")
+            job.error = {
+                'code': 'INTERNAL_SERVER_ERROR',
+                'message': 'An unexpected error occurred during analysis'
+            }
+        job.status = JOB_FAILED
+    finally:
+        job.finished_at = time.time()
+        try:
+            _save_job(job)
+        except Exception:
+            logger.exception(f"Failed to store the outcome of analysis job {job.id}.")
+
+
+def submit_analysis_job(func: Callable[..., Any], *args: Any,
+                        error_handler: Optional[Callable[[Exception], Dict[str, str]]] = None) -> AnalysisJob:
+    """
+    Queue func(*args) for background execution and return its job.
+
+    error_handler maps an exception raised by func to the error body
+    exposed to clients when the job fails.
+    """
+    now = time.time()
+    job = AnalysisJob(id=uuid.uuid4().hex, created_at=now)
+    _prune_jobs(now)
+    _execute(
+        "INSERT INTO analysis_jobs (id, status, created_at) VALUES (?, ?, ?)",
+        (job.id, job.status, job.created_at)
+    )
+    _get_executor().submit(_run_job, job, func, args, error_handler)
+    return job
+
+
+def get_analysis_job(job_id: str) -> Optional[AnalysisJob]:
+    """Return the job with the given id, or None if unknown or expired."""
+    row = _execute(f"SELECT {_JOB_COLUMNS} FROM analysis_jobs WHERE id = ?", (job_id,), fetch=True)
+    if row is None:
+        return None
+    job = _job_from_row(row)
+    expires_from = job.finished_at if job.finished_at is not None else job.created_at
+    if time.time() - expires_from > ANALYSIS_JOB_TTL_SECONDS:
+        return None
+    return job
+
+
+def shutdown_analysis_jobs(wait: bool = False) -> None:
+    """Stop the worker pool; queued jobs that have not started are cancelled."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait, cancel_futures=True)
+            _executor = None
@@ -4,6 +4,7 @@ import re
 import time
 import logging
 import requests
+from typing import Optional
 import google.generativeai as genai
 from app.models import AnalysisResponse, ProblemDetail
 from app.config_manager import get_config
@@ -21,8 +22,13 @@ RULE_MANAGER_URL = os.environ.get('RULE_MANAGER_URL', 'http://localhost:5002')
 HTTP_TIMEOUT = int(os.environ.get('HTTP_TIMEOUT', '30'))  # seconds
 
 
-def _fetch_rules_from_manager(notification_type: str) -> list:
-    """Fetch active rules from Rule Manager service for the given notification type."""
+def fetch_active_rules(notification_type: str) -> Optional[list]:
+    """
+    Fetch active rules from Rule Manager service for the given notification type.
+
+    Returns None when the Rule Manager could not be reached, so callers can
+    tell a failed fetch apart from a type that has no active rules.
+    """
     try:
         response = requests.get(
             f"{RULE_MANAGER_URL}/api/v1/rulesets",
@@ -43,13 +49,13 @@ def _fetch_rules_from_manager(notification_type: str) -> list:
         return detail_response.json().get('rules', [])
     except requests.exceptions.Timeout:
         logger.warning("Timeout while fetching rules from Rule Manager")
-        return []
+        return None
     except requests.exceptions.ConnectionError:
         logger.warning("Could not connect to Rule Manager service")
-        return []
+        return None
     except requests.exceptions.RequestException as e:
         logger.warning(f"Could not fetch rules from Rule Manager: {e}")
-        return []
+        return None
 
 def _execute_rules(rules: list, notification_data: dict) -> tuple[int, list]:
     score_adjustment = 0
@@ -80,13 +86,20 @@ def _execute_rules(rules: list, notification_data: dict) -> tuple[int, list]:
             problems.append(ProblemDetail(field="GENERAL", severity="Major", description=rule['feedback_message']))
     return score_adjustment, problems
 
-def analyze_text(notification_data: dict, language: str = "en") -> AnalysisResponse:
+def analyze_text(notification_data: dict, language: str = "en",
+                 rules: Optional[list] = None) -> AnalysisResponse:
+    """
+    Analyze a notification with the LLM and the Rule Manager rules.
+
+    rules can be passed in when the caller already fetched them with
+    fetch_active_rules; otherwise they are fetched here.
+    """
     config = get_config()
     llm_settings = config.get('analysis_llm_settings', {})
     notification_type = notification_data.get('NotificationType', '')
 
     # Fetch all rules and separate them by type
-    external_rules = _fetch_rules_from_manager(notification_type)
+    external_rules = rules if rules is not None else (fetch_active_rules(notification_type) or [])
     validation_rules = [rule for rule in external_rules if rule.get('rule_type', 'VALIDATION') == 'VALIDATION']
     ai_guidance_rules = [rule for rule in external_rules if rule.get('rule_type') == 'AI_GUIDANCE']
 
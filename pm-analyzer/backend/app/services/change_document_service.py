@@ -20,6 +20,8 @@ import sqlite3
 import os
 import logging
 
+from app.database import bulk_insert
+
 logger = logging.getLogger(__name__)
 
 
@@ -230,20 +232,19 @@ class ChangeDocumentService:
                   udate, utime, transaction_code, change_type, 'en'))
 
             # Insert items (field-level changes)
-            for change in changes:
-                cursor.execute("""
-                    INSERT INTO CDPOS (CHANGENR, TABNAME, TABKEY, FNAME,
-                                       VALUE_NEW, VALUE_OLD, CHNGIND)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    changenr,
-                    change.get('table', object_class),
-                    change.get('key', object_id),
-                    change.get('field', ''),
-                    str(change.get('new', ''))[:255] if change.get('new') else None,
-                    str(change.get('old', ''))[:255] if change.get('old') else None,
-                    change.get('indicator', change_type)
-                ))
+            bulk_insert(conn, """
+                INSERT INTO CDPOS (CHANGENR, TABNAME, TABKEY, FNAME,
+                                   VALUE_NEW, VALUE_OLD, CHNGIND)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, [(
+                changenr,
+                change.get('table', object_class),
+                change.get('key', object_id),
+                change.get('field', ''),
+                str(change.get('new', ''))[:255] if change.get('new') else None,
+                str(change.get('old', ''))[:255] if change.get('old') else None,
+                change.get('indicator', change_type)
+            ) for change in changes])
 
             conn.commit()
             logger.info(f"Change document {changenr} created for {object_class}/{object_id}")
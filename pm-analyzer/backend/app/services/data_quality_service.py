@@ -17,10 +17,12 @@ Implements ALCOA+ principles:
 - Enduring: Available for review period
 - Available: Accessible when needed
 """
+import json
 import logging
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from dataclasses import dataclass, asdict
 from enum import Enum
 
@@ -279,7 +281,7 @@ def calculate_timeliness_score(notification: Dict[str, Any]) -> Tuple[float, Lis
                 })
 
         except (ValueError, TypeError) as e:
-            logger.debug(f"Could not parse dates for timeliness: {e}")
+            logger.debug("Could not parse dates for timeliness: %s", e)
 
     return round(score, 2), issues
 
@@ -515,14 +517,54 @@ def calculate_notification_quality(notification: Dict[str, Any]) -> Notification
     )
 
 
+# Scores are a pure function of the notification's content, so they are
+# memoized by a canonical JSON rendering of it. Cached scores are shared
+# between callers and must not be mutated.
+QUALITY_CACHE_MAX_ENTRIES = 4096
+_quality_cache: 'OrderedDict[str, NotificationQualityScore]' = OrderedDict()
+_quality_cache_lock = threading.Lock()
+
+
+def cached_notification_quality(notification: Dict[str, Any]) -> NotificationQualityScore:
+    """
+    Cached calculate_notification_quality.
+
+    Notifications with identical content share one score; any changed
+    field produces a new key, so no explicit invalidation is needed.
+    """
+    key = json.dumps(notification, sort_keys=True, default=str)
+    with _quality_cache_lock:
+        quality = _quality_cache.get(key)
+        if quality is not None:
+            _quality_cache.move_to_end(key)
+            return quality
+
+    quality = calculate_notification_quality(notification)
+
+    with _quality_cache_lock:
+        _quality_cache[key] = quality
+        while len(_quality_cache) > QUALITY_CACHE_MAX_ENTRIES:
+            _quality_cache.popitem(last=False)
+    return quality
+
+
 # =============================================================================
 # BATCH AND TREND ANALYSIS
 # =============================================================================
 
-def calculate_batch_quality(notifications: List[Dict[str, Any]]) -> Dict[str, Any]:
+def calculate_batch_quality(
+    notifications: List[Dict[str, Any]],
+    qualities: Optional[List[NotificationQualityScore]] = None,
+    collect_individuals: int = 0
+) -> Dict[str, Any]:
     """
     Calculate quality metrics for a batch of notifications.
 
+    qualities may hold the already calculated score of each notification,
+    in the same order, so callers that need them too only score once.
+    When collect_individuals is set, the first that many per-notification
+    scores are returned under 'individuals', gathered in the same pass.
+
     Returns aggregate statistics and distribution data.
     """
     if not notifications:
@@ -536,24 +578,39 @@ def calculate_batch_quality(notifications: List[Dict[str, Any]]) -> Dict[str, An
 
     scores = []
     all_issues = []
+    individuals = []
     alcoa_results = defaultdict(int)
+    distribution = {'excellent': 0, 'good': 0, 'acceptable': 0, 'poor': 0}
+
+    if qualities is None:
+        qualities = [cached_notification_quality(notif) for notif in notifications]
 
-    for notif in notifications:
-        quality = calculate_notification_quality(notif)
-        scores.append(quality.overall_score)
+    for index, quality in enumerate(qualities):
+        score = quality.overall_score
+        scores.append(score)
         all_issues.extend(quality.issues)
 
+        # Calculate distribution
+        if score >= 90:
+            distribution['excellent'] += 1
+        elif score >= 75:
+            distribution['good'] += 1
+        elif score >= 60:
+            distribution['acceptable'] += 1
+        else:
+            distribution['poor'] += 1
+
         for principle, met in quality.alcoa_compliance.items():
             if met:
                 alcoa_results[principle] += 1
 
-    # Calculate distribution
-    distribution = {
-        'excellent': len([s for s in scores if s >= 90]),
-        'good': len([s for s in scores if 75 <= s < 90]),
-        'acceptable': len([s for s in scores if 60 <= s < 75]),
-        'poor': len([s for s in scores if s < 60])
-    }
+        if index < collect_individuals:
+            individuals.append({
+                'notification_id': quality.notification_id,
+                'score': score,
+                'completeness': quality.completeness_score,
+                'accuracy': quality.accuracy_score
+            })
 
     # Find most common issues
     issue_counts = defaultdict(int)
@@ -574,7 +631,7 @@ def calculate_batch_quality(notifications: List[Dict[str, Any]]) -> Dict[str, An
         for principle, count in alcoa_results.items()
     }
 
-    return {
+    result = {
         'count': len(notifications),
         'average_score': round(sum(scores) / len(scores), 2),
         'min_score': round(min(scores), 2),
@@ -584,11 +641,16 @@ def calculate_batch_quality(notifications: List[Dict[str, Any]]) -> Dict[str, An
         'common_issues': common_issues,
         'alcoa_summary': alcoa_summary
     }
+    if collect_individuals:
+        result['individuals'] = individuals
+
+    return result
 
 
 def calculate_quality_trend(
     notifications: List[Dict[str, Any]],
-    period: str = 'weekly'
+    period: str = 'weekly',
+    qualities: Optional[List[NotificationQualityScore]] = None
 ) -> List[QualityTrend]:
     """
     Calculate quality trends over time.
@@ -596,6 +658,7 @@ def calculate_quality_trend(
     Args:
         notifications: List of notifications with CreationDate
         period: 'daily', 'weekly', or 'monthly'
+        qualities: Optional precalculated scores, one per notification
 
     Returns:
         List of QualityTrend data points
@@ -603,10 +666,14 @@ def calculate_quality_trend(
     if not notifications:
         return []
 
-    # Group notifications by period
+    if qualities is None:
+        qualities = [cached_notification_quality(notif) for notif in notifications]
+
+    # Group notifications and their scores by period
     grouped = defaultdict(list)
+    grouped_qualities = defaultdict(list)
 
-    for notif in notifications:
+    for notif, quality in zip(notifications, qualities):
         creation_date = notif.get('CreationDate')
         if not creation_date:
             continue
@@ -626,6 +693,7 @@ def calculate_quality_trend(
                 period_key = dt.strftime('%Y-%m')
 
             grouped[period_key].append(notif)
+            grouped_qualities[period_key].append(quality)
 
         except (ValueError, TypeError):
             continue
@@ -634,15 +702,15 @@ def calculate_quality_trend(
     trends = []
     for period_key in sorted(grouped.keys()):
         period_notifs = grouped[period_key]
-        batch_stats = calculate_batch_quality(period_notifs)
+        period_qualities = grouped_qualities[period_key]
+        batch_stats = calculate_batch_quality(period_notifs, period_qualities)
 
         # Get completeness and accuracy averages
         completeness_scores = []
         accuracy_scores = []
         all_issues = []
 
-        for notif in period_notifs:
-            quality = calculate_notification_quality(notif)
+        for quality in period_qualities:
             completeness_scores.append(quality.completeness_score)
             accuracy_scores.append(quality.accuracy_score)
             all_issues.extend([i.get('issue', 'unknown') for i in quality.issues])
@@ -668,7 +736,8 @@ def calculate_quality_trend(
 def to_dict(obj):
     """Convert dataclass objects to dictionaries recursively."""
     if hasattr(obj, '__dataclass_fields__'):
-        return {k: to_dict(v) for k, v in asdict(obj).items()}
+        # asdict already recurses into nested dataclasses, lists and dicts
+        return asdict(obj)
     elif isinstance(obj, list):
         return [to_dict(item) for item in obj]
     elif isinstance(obj, dict):
@@ -1,6 +1,7 @@
 import logging
 from typing import List, Optional, Dict, Any
-from app.database import get_db
+from flask import has_app_context
+from app.database import get_db, get_db_connection, is_missing_table_error, iter_rows
 from app.models import UnifiedPMObject, DBNotificationHeader, DBOrderHeader, DBNotificationItem, DBOperation, DBMaterial
 
 logger = logging.getLogger(__name__)
@@ -32,6 +33,83 @@ def get_order_type_text(code: str, language: str = 'en') -> str:
 
 # -----------------------
 
+# Bumped on every notification write; caches of notification reads store the
+# version they were built from and are discarded once it changes. The counter
+# lives in the database so a write handled by one worker process invalidates
+# the caches of every other worker on their next lookup.
+NOTIFICATIONS_VERSION_KEY = 'notifications'
+
+
+def _create_version_table():
+    """Create the data_version row on databases that predate it."""
+    with get_db_connection() as conn:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS data_version ("
+            "name TEXT PRIMARY KEY, version INTEGER NOT NULL DEFAULT 0)"
+        )
+        conn.execute(
+            "INSERT INTO data_version (name, version) SELECT ?, 0 "
+            "WHERE NOT EXISTS (SELECT 1 FROM data_version WHERE name = ?)",
+            (NOTIFICATIONS_VERSION_KEY, NOTIFICATIONS_VERSION_KEY)
+        )
+
+
+def _read_notifications_version(db) -> int:
+    row = db.execute(
+        "SELECT version FROM data_version WHERE name = ?", (NOTIFICATIONS_VERSION_KEY,)
+    ).fetchone()
+    return row["version"] if row else 0
+
+
+def _bump_notifications_version(db=None):
+    query = "UPDATE data_version SET version = version + 1 WHERE name = ?"
+    if db is not None:
+        db.execute(query, (NOTIFICATIONS_VERSION_KEY,))
+        return
+    with get_db_connection() as conn:
+        conn.execute(query, (NOTIFICATIONS_VERSION_KEY,))
+
+
+def get_notifications_version() -> int:
+    """Current version of the notification data (see invalidate_notifications_cache)."""
+    try:
+        if has_app_context():
+            return _read_notifications_version(get_db())
+        with get_db_connection() as conn:
+            return _read_notifications_version(conn)
+    except Exception as e:
+        if not is_missing_table_error(e):
+            raise
+        logger.info("data_version table missing; creating it")
+        _create_version_table()
+    with get_db_connection() as conn:
+        return _read_notifications_version(conn)
+
+
+def invalidate_notifications_cache(db=None):
+    """
+    Mark cached notification reads as stale in every worker.
+
+    Call after writing QMEL/NOTIF_CONTENT. Pass the connection used for the
+    write so the bump commits in the same transaction; without one the bump
+    is committed on its own.
+    """
+    if db is not None:
+        # Reading first creates the table outside the caller's transaction
+        # if the database predates it
+        get_notifications_version()
+        _bump_notifications_version(db)
+        return
+    try:
+        _bump_notifications_version()
+    except Exception as e:
+        if not is_missing_table_error(e):
+            raise
+        logger.info("data_version table missing; creating it")
+        _create_version_table()
+        _bump_notifications_version()
+
+
 def get_notifications_count(language: str = 'en') -> int:
     """
     Returns the total count of notifications.
@@ -78,7 +156,7 @@ def get_all_notifications_summary(
             ORDER BY n.ERDAT DESC, n.MZEIT DESC
             LIMIT ? OFFSET ?
         """
-        cursor = db.execute(query, (language, page_size, offset))
+        params = (language, page_size, offset)
     else:
         query = """
             SELECT n.QMNUM, n.QMART, n.PRIOK, n.QMNAM, n.ERDAT, n.MZEIT, n.STRMN, n.LTRMN, n.EQUNR, n.TPLNR,
@@ -87,12 +165,11 @@ def get_all_notifications_summary(
             LEFT JOIN NOTIF_CONTENT t ON n.QMNUM = t.QMNUM AND t.SPRAS = ?
             ORDER BY n.ERDAT DESC, n.MZEIT DESC
         """
-        cursor = db.execute(query, (language,))
-
-    rows = cursor.fetchall()
+        params = (language,)
 
+    # Stream rows into the result list instead of holding the raw rows as well
     results = []
-    for row in rows:
+    for row in iter_rows(db, query, params):
         results.append({
             "NotificationId": row["QMNUM"],
             "NotificationType": row["QMART"],
@@ -141,7 +218,8 @@ def get_unified_notification(notification_id: str, language: str = 'en') -> Opti
     if not row:
         return None
 
-    logger.debug(f"Fetched Row Values ({language}): {dict(row)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Fetched Row Values (%s): %s", language, dict(row))
 
     # Map Header
     notification_data = {
@@ -26,6 +26,7 @@ from datetime import datetime, timedelta
 from enum import Enum
 
 from app.database import get_db_connection, DATABASE_TYPE
+from app.services.data_service import invalidate_notifications_cache
 
 logger = logging.getLogger(__name__)
 
@@ -420,6 +421,9 @@ class GDPRService:
             )
             erased['tables_affected']['consent_records_deleted'] = cursor.rowcount
 
+            if erased['tables_affected']['QMEL']:
+                invalidate_notifications_cache(conn)
+
         logger.info(f"GDPR erasure completed for {subject_id} -> {pseudonym} "
                      f"(tenant: {tenant_id}, by: {processed_by})")
         return erased
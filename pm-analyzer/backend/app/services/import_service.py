@@ -38,7 +38,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
-from app.database import get_db
+from app.database import get_db, bulk_insert
+from app.services.data_service import invalidate_notifications_cache
 
 logger = logging.getLogger(__name__)
 
@@ -656,6 +657,16 @@ def _get_existing_qmnums(db, qmnums: List[str]) -> set:
     return existing
 
 
+_INSERT_QMFE_SQL = """INSERT INTO QMFE (QMNUM, FENUM, OTGRP, OTEIL, FEGRP, FECOD)
+                      VALUES (?, ?, ?, ?, ?, ?)"""
+_INSERT_QMFE_TEXT_SQL = """INSERT INTO QMFE_TEXT (QMNUM, FENUM, SPRAS, FETXT)
+                           VALUES (?, ?, ?, ?)"""
+_INSERT_QMUR_SQL = """INSERT INTO QMUR (QMNUM, FENUM, URNUM, URGRP, URCOD)
+                      VALUES (?, ?, ?, ?, ?)"""
+_INSERT_QMUR_TEXT_SQL = """INSERT INTO QMUR_TEXT (QMNUM, FENUM, URNUM, SPRAS, URTXT)
+                           VALUES (?, ?, ?, ?, ?)"""
+
+
 def _insert_notification(db, data: Dict[str, Any], language: str, import_id: str, username: str):
     """Insert a single notification and its related records."""
     qmnum = data['QMNUM']
@@ -715,26 +726,19 @@ def _insert_notification(db, data: Dict[str, Any], language: str, import_id: str
                 (qmnum, fenum, urnum, language, urtxt)
             )
 
-    # Insert JSON-format items (nested array)
+    # Insert JSON-format items (nested array), batched per table
     items = data.get('_items', [])
+    item_rows, item_text_rows, cause_rows, cause_text_rows = [], [], [], []
     if isinstance(items, list):
         for idx, item in enumerate(items):
             if not isinstance(item, dict):
                 continue
             fenum = item.get('FENUM', f'{idx + 1:04d}')
-            db.execute(
-                """INSERT INTO QMFE (QMNUM, FENUM, OTGRP, OTEIL, FEGRP, FECOD)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                (qmnum, fenum, item.get('OTGRP'), item.get('OTEIL'),
-                 item.get('FEGRP'), item.get('FECOD'))
-            )
+            item_rows.append((qmnum, fenum, item.get('OTGRP'), item.get('OTEIL'),
+                              item.get('FEGRP'), item.get('FECOD')))
             fetxt = item.get('FETXT', item.get('text', ''))
             if fetxt:
-                db.execute(
-                    """INSERT INTO QMFE_TEXT (QMNUM, FENUM, SPRAS, FETXT)
-                       VALUES (?, ?, ?, ?)""",
-                    (qmnum, fenum, language, fetxt)
-                )
+                item_text_rows.append((qmnum, fenum, language, fetxt))
 
             # Nested causes within items
             item_causes = item.get('causes', [])
@@ -743,18 +747,10 @@ def _insert_notification(db, data: Dict[str, Any], language: str, import_id: str
                     if not isinstance(cause, dict):
                         continue
                     urnum = cause.get('URNUM', f'{cidx + 1:04d}')
-                    db.execute(
-                        """INSERT INTO QMUR (QMNUM, FENUM, URNUM, URGRP, URCOD)
-                           VALUES (?, ?, ?, ?, ?)""",
-                        (qmnum, fenum, urnum, cause.get('URGRP'), cause.get('URCOD'))
-                    )
+                    cause_rows.append((qmnum, fenum, urnum, cause.get('URGRP'), cause.get('URCOD')))
                     urtxt = cause.get('URTXT', cause.get('text', ''))
                     if urtxt:
-                        db.execute(
-                            """INSERT INTO QMUR_TEXT (QMNUM, FENUM, URNUM, SPRAS, URTXT)
-                               VALUES (?, ?, ?, ?, ?)""",
-                            (qmnum, fenum, urnum, language, urtxt)
-                        )
+                        cause_text_rows.append((qmnum, fenum, urnum, language, urtxt))
 
     # Insert JSON-format causes at notification level (not nested under items)
     causes = data.get('_causes', [])
@@ -775,18 +771,15 @@ def _insert_notification(db, data: Dict[str, Any], language: str, import_id: str
             if not isinstance(cause, dict):
                 continue
             urnum = cause.get('URNUM', f'{cidx + 1:04d}')
-            db.execute(
-                """INSERT INTO QMUR (QMNUM, FENUM, URNUM, URGRP, URCOD)
-                   VALUES (?, ?, ?, ?, ?)""",
-                (qmnum, fenum, urnum, cause.get('URGRP'), cause.get('URCOD'))
-            )
+            cause_rows.append((qmnum, fenum, urnum, cause.get('URGRP'), cause.get('URCOD')))
             urtxt = cause.get('URTXT', cause.get('text', ''))
             if urtxt:
-                db.execute(
-                    """INSERT INTO QMUR_TEXT (QMNUM, FENUM, URNUM, SPRAS, URTXT)
-                       VALUES (?, ?, ?, ?, ?)""",
-                    (qmnum, fenum, urnum, language, urtxt)
-                )
+                cause_text_rows.append((qmnum, fenum, urnum, language, urtxt))
+
+    bulk_insert(db, _INSERT_QMFE_SQL, item_rows)
+    bulk_insert(db, _INSERT_QMFE_TEXT_SQL, item_text_rows)
+    bulk_insert(db, _INSERT_QMUR_SQL, cause_rows)
+    bulk_insert(db, _INSERT_QMUR_TEXT_SQL, cause_text_rows)
 
     # Insert inline order (from CSV flat format or JSON)
     inline_order = data.get('_inline_order')
@@ -810,25 +803,18 @@ def _insert_notification(db, data: Dict[str, Any], language: str, import_id: str
              inline_order.get('KTEXT'))
         )
 
-        # Insert operations (JSON format only)
+        # Insert operations (JSON format only), batched per table
+        operation_rows, operation_text_rows, material_rows, material_texts = [], [], [], []
         if isinstance(operations, list):
             for oidx, op in enumerate(operations):
                 if not isinstance(op, dict):
                     continue
                 vornr = op.get('VORNR', f'{(oidx + 1) * 10:04d}')
-                db.execute(
-                    """INSERT INTO AFVC (AUFNR, VORNR, ARBPL, STEUS, DAUER, DAUERE)
-                       VALUES (?, ?, ?, ?, ?, ?)""",
-                    (aufnr, vornr, op.get('ARBPL'), op.get('STEUS'),
-                     op.get('DAUER'), op.get('DAUERE'))
-                )
+                operation_rows.append((aufnr, vornr, op.get('ARBPL'), op.get('STEUS'),
+                                       op.get('DAUER'), op.get('DAUERE')))
                 ltxa1 = op.get('LTXA1', op.get('text', ''))
                 if ltxa1:
-                    db.execute(
-                        """INSERT INTO AFVC_TEXT (AUFNR, VORNR, SPRAS, LTXA1)
-                           VALUES (?, ?, ?, ?)""",
-                        (aufnr, vornr, language, ltxa1)
-                    )
+                    operation_text_rows.append((aufnr, vornr, language, ltxa1))
 
                 # Insert materials
                 materials = op.get('materials', [])
@@ -836,22 +822,28 @@ def _insert_notification(db, data: Dict[str, Any], language: str, import_id: str
                     for mat in materials:
                         if not isinstance(mat, dict) or not mat.get('MATNR'):
                             continue
-                        db.execute(
-                            """INSERT INTO RESB (AUFNR, VORNR, MATNR, MENGE, MEINS)
-                               VALUES (?, ?, ?, ?, ?)""",
-                            (aufnr, vornr, mat['MATNR'],
-                             float(mat.get('MENGE', 0)), mat.get('MEINS', 'EA'))
-                        )
+                        material_rows.append((aufnr, vornr, mat['MATNR'],
+                                              float(mat.get('MENGE', 0)), mat.get('MEINS', 'EA')))
                         maktx = mat.get('MAKTX', mat.get('description', ''))
                         if maktx:
-                            try:
-                                db.execute(
-                                    """INSERT INTO MAKT (MATNR, SPRAS, MAKTX)
-                                       VALUES (?, ?, ?)""",
-                                    (mat['MATNR'], language, maktx)
-                                )
-                            except Exception:
-                                pass  # Material text may already exist
+                            material_texts.append((mat['MATNR'], language, maktx))
+
+        bulk_insert(db, """INSERT INTO AFVC (AUFNR, VORNR, ARBPL, STEUS, DAUER, DAUERE)
+                           VALUES (?, ?, ?, ?, ?, ?)""", operation_rows)
+        bulk_insert(db, """INSERT INTO AFVC_TEXT (AUFNR, VORNR, SPRAS, LTXA1)
+                           VALUES (?, ?, ?, ?)""", operation_text_rows)
+        bulk_insert(db, """INSERT INTO RESB (AUFNR, VORNR, MATNR, MENGE, MEINS)
+                           VALUES (?, ?, ?, ?, ?)""", material_rows)
+        # Row by row: an existing material text must not abort the batch
+        for material_text in material_texts:
+            try:
+                db.execute(
+                    """INSERT INTO MAKT (MATNR, SPRAS, MAKTX)
+                       VALUES (?, ?, ?)""",
+                    material_text
+                )
+            except Exception:
+                pass  # Material text may already exist
 
     # Record audit trail
     now = datetime.utcnow()
@@ -953,6 +945,8 @@ def import_csv(file_content: str, language: str = 'en',
                                              f'Database error for {qmnum}: {str(e)[:200]}',
                                              qmnum))
 
+    if result.imported:
+        invalidate_notifications_cache(db)
     db.commit()
 
     if result.imported == 0:
@@ -1041,6 +1035,8 @@ def import_json(file_content: str, language: str = 'en',
                                              f'Database error for {qmnum}: {str(e)[:200]}',
                                              qmnum))
 
+    if result.imported:
+        invalidate_notifications_cache(db)
     db.commit()
 
     if result.imported == 0:
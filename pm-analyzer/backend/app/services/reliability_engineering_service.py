@@ -17,7 +17,8 @@ from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
 import math
 import statistics
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict
 
 
 class FailureSeverity(Enum):
@@ -165,14 +166,21 @@ class ReliabilityEngineeringService:
     actionable insights for maintenance optimization.
     """
 
+    # Loaded snapshots kept per notification list (e.g. one per language)
+    MAX_SNAPSHOTS = 4
+
     def __init__(self):
         self.failure_events: List[FailureEvent] = []
+        self.failures_by_equipment: Dict[str, List[FailureEvent]] = {}
         self.equipment_operating_hours: Dict[str, float] = {}
-
-    def load_notifications_as_failures(self, notifications: List[Dict]) -> List[FailureEvent]:
-        """
-        Convert PM notifications to failure events for analysis.
-        """
+        # id(notifications) -> (notifications, snapshot); holding the list keeps its id unique
+        self._snapshots: 'OrderedDict[int, Tuple[List[Dict], ReliabilityEngineeringService]]' = OrderedDict()
+        self._load_lock = threading.Lock()
+
+    def _build_failure_events(
+        self, notifications: List[Dict]
+    ) -> Tuple[List[FailureEvent], Dict[str, List[FailureEvent]]]:
+        """Convert PM notifications to failure events, indexed by equipment."""
         failure_events = []
 
         for notif in notifications:
@@ -198,8 +206,43 @@ class ReliabilityEngineeringService:
             )
             failure_events.append(failure_event)
 
-        self.failure_events = failure_events
-        return failure_events
+        # Index by equipment so per-equipment metrics don't scan every event
+        failures_by_equipment = defaultdict(list)
+        for failure_event in failure_events:
+            failures_by_equipment[failure_event.equipment_id].append(failure_event)
+
+        return failure_events, dict(failures_by_equipment)
+
+    def load_notifications_as_failures(self, notifications: List[Dict]) -> List[FailureEvent]:
+        """
+        Convert PM notifications to failure events for analysis.
+        """
+        self.failure_events, self.failures_by_equipment = self._build_failure_events(notifications)
+        return self.failure_events
+
+    def for_notifications(self, notifications: List[Dict]) -> 'ReliabilityEngineeringService':
+        """
+        Return a service loaded with notifications to compute metrics against.
+
+        Snapshots are built once per list object and never reloaded, so
+        concurrent requests for different lists (e.g. languages) each keep
+        their own data. Callers passing a cached (unchanged) list skip the
+        O(N) rebuild, and concurrent requests with a new list build it once.
+        """
+        key = id(notifications)
+        with self._load_lock:
+            entry = self._snapshots.get(key)
+            if entry is not None and entry[0] is notifications:
+                self._snapshots.move_to_end(key)
+                return entry[1]
+
+            snapshot = ReliabilityEngineeringService()
+            snapshot.failure_events, snapshot.failures_by_equipment = \
+                self._build_failure_events(notifications)
+            self._snapshots[key] = (notifications, snapshot)
+            while len(self._snapshots) > self.MAX_SNAPSHOTS:
+                self._snapshots.popitem(last=False)
+            return snapshot
 
     def _determine_severity(self, notif: Dict) -> FailureSeverity:
         """Determine failure severity from notification data."""
@@ -267,10 +310,7 @@ class ReliabilityEngineeringService:
         MTBF = Total Operating Time / Number of Failures
         """
         # Filter failures for this equipment
-        equipment_failures = [
-            f for f in self.failure_events
-            if f.equipment_id == equipment_id
-        ]
+        equipment_failures = self.failures_by_equipment.get(equipment_id, [])
 
         # Calculate period boundaries
         end_date = datetime.now()
@@ -324,8 +364,8 @@ class ReliabilityEngineeringService:
         """
         # Filter failures for this equipment with repair times
         equipment_failures = [
-            f for f in self.failure_events
-            if f.equipment_id == equipment_id and f.repair_hours > 0
+            f for f in self.failures_by_equipment.get(equipment_id, [])
+            if f.repair_hours > 0
         ]
 
         # Calculate period boundaries
@@ -380,10 +420,7 @@ class ReliabilityEngineeringService:
         Or using MTBF/MTTR: Availability = MTBF / (MTBF + MTTR)
         """
         # Filter failures for this equipment
-        equipment_failures = [
-            f for f in self.failure_events
-            if f.equipment_id == equipment_id
-        ]
+        equipment_failures = self.failures_by_equipment.get(equipment_id, [])
 
         # Calculate period boundaries
         end_date = datetime.now()
@@ -433,13 +470,13 @@ class ReliabilityEngineeringService:
         end_date = datetime.now()
         start_date = end_date - timedelta(days=period_days)
 
+        total_failures = 0
         for failure in self.failure_events:
             if failure.failure_date and start_date <= failure.failure_date <= end_date:
                 failure_modes[failure.failure_mode].append(failure)
+                total_failures += 1
 
         fmea_items = []
-        total_failures = len([f for f in self.failure_events
-                            if f.failure_date and start_date <= f.failure_date <= end_date])
 
         for mode, failures in failure_modes.items():
             if mode == 'UNKNOWN':
@@ -561,8 +598,8 @@ class ReliabilityEngineeringService:
         """
         # Filter failures for this equipment
         equipment_failures = [
-            f for f in self.failure_events
-            if f.equipment_id == equipment_id and f.failure_date
+            f for f in self.failures_by_equipment.get(equipment_id, [])
+            if f.failure_date
         ]
 
         # Sort by date
@@ -656,8 +693,8 @@ class ReliabilityEngineeringService:
 
         # Get most recent failure
         equipment_failures = [
-            f for f in self.failure_events
-            if f.equipment_id == equipment_id and f.failure_date
+            f for f in self.failures_by_equipment.get(equipment_id, [])
+            if f.failure_date
         ]
         equipment_failures.sort(key=lambda x: x.failure_date, reverse=True)
 
@@ -745,9 +782,10 @@ class ReliabilityEngineeringService:
         Get summary statistics for all equipment.
         """
         # Get unique equipment
-        equipment_ids = list(set(f.equipment_id for f in self.failure_events))
+        equipment_ids = list(self.failures_by_equipment)
 
         summaries = []
+        risk_counts: Dict[str, int] = defaultdict(int)
         for eq_id in equipment_ids:
             if eq_id == 'UNKNOWN':
                 continue
@@ -765,6 +803,7 @@ class ReliabilityEngineeringService:
                 'urgency': predictive.urgency,
                 'recommendations': reliability.recommendations[:2]  # Top 2
             })
+            risk_counts[reliability.risk_level] += 1
 
         # Sort by risk
         risk_order = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
@@ -775,15 +814,12 @@ class ReliabilityEngineeringService:
         avg_reliability = statistics.mean([s['reliability_score'] for s in summaries]) if summaries else 0
         avg_availability = statistics.mean([s['availability'] for s in summaries]) if summaries else 100
 
-        critical_count = len([s for s in summaries if s['risk_level'] == 'critical'])
-        high_risk_count = len([s for s in summaries if s['risk_level'] == 'high'])
-
         return {
             'total_equipment': total_equipment,
             'average_reliability_score': round(avg_reliability, 1),
             'average_availability': round(avg_availability, 1),
-            'critical_risk_count': critical_count,
-            'high_risk_count': high_risk_count,
+            'critical_risk_count': risk_counts['critical'],
+            'high_risk_count': risk_counts['high'],
             'equipment_summaries': summaries
         }
 
@@ -951,11 +987,14 @@ class ReliabilityEngineeringService:
 
 # Singleton instance
 _reliability_service = None
+_reliability_service_lock = threading.Lock()
 
 
 def get_reliability_service() -> ReliabilityEngineeringService:
     """Get or create the reliability engineering service instance."""
     global _reliability_service
     if _reliability_service is None:
-        _reliability_service = ReliabilityEngineeringService()
+        with _reliability_service_lock:
+            if _reliability_service is None:
+                _reliability_service = ReliabilityEngineeringService()
     return _reliability_service
@@ -21,6 +21,7 @@ from datetime import datetime
 from enum import Enum
 
 from app.database import DATABASE_TYPE, get_db_connection, get_standalone_connection
+from app.services.data_service import invalidate_notifications_cache
 
 logger = logging.getLogger(__name__)
 
@@ -570,6 +571,9 @@ class TenantService:
                     except Exception:
                         pass  # Skip if already exists
 
+                if seeded['notifications']:
+                    invalidate_notifications_cache(conn)
+
             # Update tenant metadata
             if tenant.metadata:
                 tenant.metadata['demo_data_seeded'] = True
@@ -3,10 +3,13 @@ import re
 from typing import Optional, Tuple, Any
 from functools import wraps
 from flask import request, jsonify
+from werkzeug.routing import BaseConverter
 
 # Validation patterns
 NOTIFICATION_ID_PATTERN = re.compile(r'^[A-Z0-9]{10,12}$')  # SAP notification IDs are typically 10-12 alphanumeric
-ALLOWED_LANGUAGES = {'en', 'de'}
+NOTIFICATION_ID_CHARS_PATTERN = re.compile(r'^[A-Za-z0-9_-]+$')
+ALLOWED_LANGUAGES = frozenset({'en', 'de'})
+_LANGUAGE_ERROR = f"Language must be one of: {', '.join(sorted(ALLOWED_LANGUAGES))}"
 MAX_TEXT_LENGTH = 10000  # Maximum length for text fields
 MAX_QUESTION_LENGTH = 1000  # Maximum length for chat questions
 
@@ -23,18 +26,28 @@ def validate_notification_id(notification_id: str) -> Tuple[bool, Optional[str]]
     if len(notification_id) > 20:
         return False, "Notification ID is too long"
     # Allow alphanumeric characters only
-    if not re.match(r'^[A-Za-z0-9_-]+$', notification_id):
+    if not NOTIFICATION_ID_CHARS_PATTERN.match(notification_id):
         return False, "Notification ID contains invalid characters"
     return True, None
 
 
+class NotificationIdConverter(BaseConverter):
+    """
+    URL converter for notification IDs, registered as <notification_id:...>.
+
+    Accepts what validate_notification_id accepts, so malformed IDs fail
+    route matching (404) without reaching the view.
+    """
+    regex = r'[A-Za-z0-9_-]{1,20}'
+
+
 def validate_language(language: str) -> Tuple[bool, Optional[str]]:
     """
     Validate language code.
     Returns (is_valid, error_message).
     """
     if language not in ALLOWED_LANGUAGES:
-        return False, f"Language must be one of: {', '.join(ALLOWED_LANGUAGES)}"
+        return False, _LANGUAGE_ERROR
     return True, None
 
 
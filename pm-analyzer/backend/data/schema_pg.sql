@@ -385,7 +385,9 @@ CREATE TABLE IF NOT EXISTS alert_log (
 -- Primary lookup indexes
 CREATE INDEX IF NOT EXISTS idx_qmel_equnr ON QMEL(EQUNR);
 CREATE INDEX IF NOT EXISTS idx_qmel_tplnr ON QMEL(TPLNR);
-CREATE INDEX IF NOT EXISTS idx_qmel_erdat ON QMEL(ERDAT DESC);
+-- Worklist order (ERDAT DESC, MZEIT DESC): lets paged reads skip the sort;
+-- also serves ERDAT-only lookups, so there is no separate ERDAT index
+CREATE INDEX IF NOT EXISTS idx_qmel_erdat_mzeit ON QMEL(ERDAT DESC, MZEIT DESC);
 
 -- Foreign key indexes for JOIN performance
 CREATE INDEX IF NOT EXISTS idx_aufk_qmnum ON AUFK(QMNUM);
@@ -443,3 +445,20 @@ CREATE INDEX IF NOT EXISTS idx_security_audit_event ON security_audit_log(event_
 CREATE INDEX IF NOT EXISTS idx_security_audit_user ON security_audit_log(user_id);
 CREATE INDEX IF NOT EXISTS idx_security_audit_ts ON security_audit_log(timestamp DESC);
 CREATE INDEX IF NOT EXISTS idx_api_keys_hash ON api_keys(key_hash);
+
+-- Data version counters shared by all worker processes (cache invalidation)
+CREATE TABLE IF NOT EXISTS data_version (
+    name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+-- Background analysis and chat jobs, polled from any worker process
+CREATE TABLE IF NOT EXISTS analysis_jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    created_at DOUBLE PRECISION NOT NULL,
+    finished_at DOUBLE PRECISION,
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_analysis_jobs_created ON analysis_jobs(created_at);
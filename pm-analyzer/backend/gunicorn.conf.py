@@ -0,0 +1,23 @@
+"""
+Gunicorn settings, picked up automatically from the working directory.
+
+Most request time is spent waiting on the database, SAP and the LLM API, so
+each worker serves requests from a thread pool (gthread) and those waits
+overlap instead of blocking the whole worker.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5001')}"
+worker_class = 'gthread'
+workers = int(os.environ.get('WEB_CONCURRENCY', '2'))
+threads = int(os.environ.get('GUNICORN_THREADS', '8'))
+# Analysis requests wait on Gemini; keep the worker timeout above the LLM retries
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '120'))
+keepalive = 5
+
+
+def post_worker_init(worker):
+    # Warm the config, notification summary and reliability caches per worker
+    from app.main import warm_caches
+    warm_caches()
@@ -0,0 +1,28 @@
+"""Index QMEL in worklist order (ERDAT DESC, MZEIT DESC).
+
+Revision ID: 002_worklist_order_index
+Revises: 002_tenancy_security
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '002_worklist_order_index'
+down_revision: Union[str, None] = '002_tenancy_security'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Let the notification summary read rows in index order instead of sorting."""
+    op.create_index('idx_qmel_erdat_mzeit', 'QMEL', [sa.text('"ERDAT" DESC'), sa.text('"MZEIT" DESC')])
+    # ERDAT is the leading column of the new index, so the old one is redundant
+    op.drop_index('idx_qmel_erdat', table_name='QMEL')
+
+
+def downgrade() -> None:
+    """Restore the ERDAT index and drop the worklist order index."""
+    op.create_index('idx_qmel_erdat', 'QMEL', ['ERDAT'])
+    op.drop_index('idx_qmel_erdat_mzeit', table_name='QMEL')
@@ -0,0 +1,29 @@
+"""Add the data_version table used to invalidate caches across workers.
+
+Revision ID: 003_data_version
+Revises: 002_worklist_order_index
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '003_data_version'
+down_revision: Union[str, None] = '002_worklist_order_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the version counter table with the notifications row."""
+    data_version = op.create_table('data_version',
+        sa.Column('name', sa.Text(), primary_key=True),
+        sa.Column('version', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.bulk_insert(data_version, [{'name': 'notifications', 'version': 0}])
+
+
+def downgrade() -> None:
+    """Drop the version counter table."""
+    op.drop_table('data_version')
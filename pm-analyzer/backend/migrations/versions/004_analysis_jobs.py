@@ -0,0 +1,34 @@
+"""Add the analysis_jobs table shared by all worker processes.
+
+Revision ID: 004_analysis_jobs
+Revises: 003_data_version
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '004_analysis_jobs'
+down_revision: Union[str, None] = '003_data_version'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the background job table."""
+    op.create_table('analysis_jobs',
+        sa.Column('id', sa.Text(), primary_key=True),
+        sa.Column('status', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.Float(), nullable=False),
+        sa.Column('finished_at', sa.Float(), nullable=True),
+        sa.Column('result', sa.Text(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+    )
+    op.create_index('idx_analysis_jobs_created', 'analysis_jobs', ['created_at'])
+
+
+def downgrade() -> None:
+    """Drop the background job table."""
+    op.drop_index('idx_analysis_jobs_created', table_name='analysis_jobs')
+    op.drop_table('analysis_jobs')
@@ -37,6 +37,10 @@ def app():
             with open(schema_path, 'r') as f:
                 conn.executescript(f.read())
 
+    # Drop notification reads cached against a previous test database
+    from app.services.data_service import invalidate_notifications_cache
+    invalidate_notifications_cache()
+
     yield flask_app
 
     # Cleanup
@@ -117,4 +121,7 @@ def db_with_data(app):
 
         conn.commit()
 
+    from app.services.data_service import invalidate_notifications_cache
+    invalidate_notifications_cache()
+
     return app
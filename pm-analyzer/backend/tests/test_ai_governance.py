@@ -29,6 +29,7 @@ from app.ai_governance import (
     log_config_change,
     get_config_history,
     generate_request_id,
+    flush_ai_usage_log,
     APPROVED_MODELS
 )
 
@@ -66,6 +67,10 @@ class TestHashFunctions:
         hash2 = compute_hash('content2')
         assert hash1 != hash2
 
+    def test_compute_hash_multiple_parts(self):
+        """Test that hashing parts matches hashing the concatenated content."""
+        assert compute_hash('user', ':', b'2024', 'secret') == compute_hash('user:2024secret')
+
 
 class TestPromptTemplates:
     """Tests for prompt template management."""
@@ -125,6 +130,86 @@ class TestPromptTemplates:
         assert len(history) >= 2
         assert history[0]['version'] > history[1]['version']  # Sorted by version desc
 
+    def test_get_prompt_template_history_reflects_approvals(self):
+        """Test that cached history is refreshed after a new approval."""
+        _, data, _ = create_prompt_template(
+            template_name='approval_count_prompt',
+            template_content='Count approvals',
+            created_by='user'
+        )
+        assert get_prompt_template_history('approval_count_prompt')[0]['approval_count'] == 0
+
+        approve_prompt_template(data['id'], 'approver', 'review', 'pw-hash')
+
+        history = get_prompt_template_history('approval_count_prompt')
+        assert history[0]['approval_count'] == 1
+        assert history[0]['status'] == 'pending_approval'
+
+    def test_prompt_history_cache_returns_copies(self):
+        """Test that mutating a returned history does not change the cached one."""
+        create_prompt_template(
+            template_name='copy_history_prompt',
+            template_content='Copy me',
+            created_by='user'
+        )
+        history = get_prompt_template_history('copy_history_prompt')
+        history[0]['status'] = 'tampered'
+        history.clear()
+
+        cached = get_prompt_template_history('copy_history_prompt')
+        assert len(cached) == 1
+        assert cached[0]['status'] != 'tampered'
+
+    def test_prompt_history_not_cached_across_invalidation(self):
+        """Test that a read overlapping an invalidation does not store stale history."""
+        from unittest.mock import patch
+        from app import ai_governance
+
+        create_prompt_template(
+            template_name='racing_history_prompt',
+            template_content='Race',
+            created_by='user'
+        )
+        get_db = ai_governance._get_db
+
+        def invalidating_get_db():
+            # An approval commits while the history query is in flight
+            ai_governance._invalidate_prompt_history('racing_history_prompt')
+            return get_db()
+
+        with patch.object(ai_governance, '_get_db', side_effect=invalidating_get_db):
+            get_prompt_template_history('racing_history_prompt')
+        assert 'racing_history_prompt' not in ai_governance._prompt_history_cache
+
+    def test_approve_prompt_template_activates_version(self):
+        """Test that an approval marks the template approved and active."""
+        _, data, _ = create_prompt_template(
+            template_name='approved_prompt',
+            template_content='Approve me',
+            created_by='user'
+        )
+
+        success, error = approve_prompt_template(data['id'], 'qa_lead', 'approval', 'pw-hash')
+
+        assert success is True
+        assert error is None
+        active = get_active_prompt_template('approved_prompt')
+        assert active['id'] == data['id']
+        assert active['approved_by'] == 'qa_lead'
+
+    def test_approve_prompt_template_invalid_type(self):
+        """Test that an unknown approval type is rejected without writing."""
+        _, data, _ = create_prompt_template(
+            template_name='invalid_approval_prompt',
+            template_content='Content',
+            created_by='user'
+        )
+
+        success, error = approve_prompt_template(data['id'], 'qa_lead', 'bogus', 'pw-hash')
+
+        assert success is False
+        assert get_prompt_template_history('invalid_approval_prompt')[0]['approval_count'] == 0
+
     def test_get_active_prompt_template_none_approved(self):
         """Test getting active template when none are approved."""
         create_prompt_template(
@@ -214,6 +299,51 @@ class TestAIUsageLogging:
 
         assert all(log['model_id'] == 'filter-test-model' for log in logs)
 
+    def test_duplicate_request_id_does_not_drop_batch(self):
+        """Test that one failing entry does not lose the other queued entries."""
+        duplicate_id = generate_request_id()
+        for i in range(3):
+            log_ai_usage(
+                request_id=duplicate_id if i < 2 else generate_request_id(),
+                model_id='batch-test-model',
+                input_data=f'Batch test {i}',
+                status='success'
+            )
+        flush_ai_usage_log()
+
+        logs = get_ai_usage_logs(model_id='batch-test-model')
+
+        assert len(logs) == 2
+
+    def test_flush_times_out_when_writer_stalls(self):
+        """Test that flushing gives up after the timeout instead of blocking forever."""
+        import threading
+        import time
+        from unittest.mock import patch
+        from app import ai_governance
+
+        release = threading.Event()
+        write = ai_governance._write_usage_entries
+
+        def stalled_write(entries):
+            release.wait(5)
+            return write(entries)
+
+        with patch.object(ai_governance, '_write_usage_entries', side_effect=stalled_write):
+            log_ai_usage(
+                request_id=generate_request_id(),
+                model_id='stalled-test-model',
+                input_data='Stalled write',
+                status='success'
+            )
+            started = time.monotonic()
+            assert flush_ai_usage_log(timeout=0.2) is False
+            assert time.monotonic() - started < 2
+            release.set()
+            assert flush_ai_usage_log() is True
+
+        assert len(get_ai_usage_logs(model_id='stalled-test-model')) == 1
+
 
 class TestModelGovernance:
     """Tests for AI model governance."""
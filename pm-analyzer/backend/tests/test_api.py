@@ -3,6 +3,7 @@ Integration tests for PM Analyzer API endpoints.
 """
 import pytest
 import json
+import os
 
 
 class TestHealthEndpoint:
@@ -14,6 +15,14 @@ class TestHealthEndpoint:
         assert response.status_code == 200
         data = json.loads(response.data)
         assert data['status'] == 'ok'
+        assert data['database'] in ('sqlite', 'postgresql')
+        assert response.mimetype == 'application/json'
+
+    def test_json_responses_compact(self, client):
+        """Test API responses are compact and keep insertion order."""
+        body = client.get('/health').get_data(as_text=True)
+        assert '\n ' not in body
+        assert body.index('"status"') < body.index('"database"')
 
 
 class TestNotificationsEndpoint:
@@ -50,10 +59,149 @@ class TestNotificationsEndpoint:
         assert 'page_size' in data
         assert 'total_pages' in data
 
+    def test_get_notifications_cached_until_write(self, client):
+        """Test repeated list requests are served from cache until data changes."""
+        from unittest.mock import patch
+        from app.services.data_service import invalidate_notifications_cache
+
+        with patch('app.main.get_all_notifications_summary', return_value=[]) as summary:
+            first = client.get('/api/notifications?language=en')
+            second = client.get('/api/notifications?language=en')
+            assert summary.call_count == 1
+            assert first.data == second.data
+
+            invalidate_notifications_cache()
+            client.get('/api/notifications?language=en')
+            assert summary.call_count == 2
+
+    def test_notifications_version_shared_through_database(self, client):
+        """Test a version bump committed by another process is seen on the next lookup."""
+        from app.database import get_db_connection
+        from app.services.data_service import get_notifications_version
+
+        before = get_notifications_version()
+        # Simulates a write handled by a different worker process
+        with get_db_connection() as conn:
+            conn.execute("UPDATE data_version SET version = version + 1 WHERE name = 'notifications'")
+        assert get_notifications_version() == before + 1
+
+    def test_get_notifications_etag_revalidation(self, client):
+        """Test that a client holding the current ETag gets a 304 without a body."""
+        from unittest.mock import patch
+        from app.services.data_service import invalidate_notifications_cache
+
+        with patch('app.main.get_all_notifications_summary', return_value=[{'NotificationId': '1'}]) as summary:
+            first = client.get('/api/notifications?language=de')
+            etag = first.headers['ETag']
+            revalidated = client.get('/api/notifications?language=de', headers={'If-None-Match': etag})
+            assert revalidated.status_code == 304
+            assert revalidated.data == b''
+
+            invalidate_notifications_cache()
+            summary.return_value = [{'NotificationId': '2'}]
+            changed = client.get('/api/notifications?language=de', headers={'If-None-Match': etag})
+            assert changed.status_code == 200
+            assert changed.headers['ETag'] != etag
+
+    def test_notifications_summary_shared_across_endpoints(self, client):
+        """Test quality endpoints reuse one summary read until data changes."""
+        from unittest.mock import patch
+        from app.main import _clear_summary_cache
+        from app.services.data_service import invalidate_notifications_cache
+
+        _clear_summary_cache()
+        with patch('app.main.get_all_notifications_summary', return_value=[]) as summary:
+            client.get('/api/quality/batch?limit=100')
+            client.get('/api/quality/batch?limit=100')
+            assert summary.call_count == 1
+
+            invalidate_notifications_cache()
+            client.get('/api/quality/batch?limit=100')
+            assert summary.call_count == 2
+
+    def test_notifications_summary_shared_across_limits(self, client):
+        """Test different limit values reuse the one full summary per language."""
+        from unittest.mock import patch
+        from app.main import _clear_summary_cache, _summary_cache
+
+        _clear_summary_cache()
+        with patch('app.main.get_all_notifications_summary', return_value=[]) as summary:
+            for limit in (10, 50, 100, 500):
+                client.get(f'/api/quality/batch?limit={limit}')
+            client.get('/api/reliability/dashboard')
+            assert summary.call_count == 1
+        assert list(_summary_cache) == ['en']
+
+    def test_clear_cache_endpoint_drops_summaries(self, client):
+        """Test the admin cache endpoint forces the next summary read."""
+        from unittest.mock import patch
+        from app.main import _clear_summary_cache
+
+        _clear_summary_cache()
+        with patch('app.main.get_all_notifications_summary', return_value=[]) as summary:
+            client.get('/api/quality/batch?limit=100')
+            response = client.delete('/api/configuration/cache')
+            assert response.status_code == 200
+            client.get('/api/quality/batch?limit=100')
+            assert summary.call_count == 2
+
+    def test_clear_cache_endpoint_bumps_shared_version(self, client):
+        """Test the admin cache flush reaches other workers through the data version."""
+        from app.services.data_service import get_notifications_version
+
+        before = get_notifications_version()
+        response = client.delete('/api/configuration/cache')
+        assert response.status_code == 200
+        assert get_notifications_version() == before + 1
+
+    def test_notifications_summary_single_flight(self, client):
+        """Test concurrent summary misses share one database read."""
+        import threading
+        from unittest.mock import patch
+        from app.main import _cached_notifications_summary, _clear_summary_cache
+
+        _clear_summary_cache()
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_summary(*args, **kwargs):
+            started.set()
+            release.wait(5)
+            return [{'NotificationId': '1'}]
+
+        results = []
+        with patch('app.main.get_all_notifications_summary', side_effect=slow_summary) as summary:
+            leader = threading.Thread(target=lambda: results.append(_cached_notifications_summary('en')))
+            leader.start()
+            started.wait(5)
+            follower = threading.Thread(target=lambda: results.append(_cached_notifications_summary('en')))
+            follower.start()
+            release.set()
+            leader.join(5)
+            follower.join(5)
+            assert summary.call_count == 1
+        assert len(results) == 2
+        assert results[0] is results[1]
+
+    def test_warm_caches_fills_summary_and_reliability(self, client):
+        """Test startup warmup loads the summary cache and failure events."""
+        from unittest.mock import patch
+        from app.main import warm_caches, _cached_notifications_summary, _clear_summary_cache
+        from app.services.reliability_engineering_service import get_reliability_service
+
+        _clear_summary_cache()
+        with patch('app.main.get_all_notifications_summary', return_value=[{'NotificationId': '1'}]) as summary:
+            warm_caches()
+            notifications = _cached_notifications_summary('en')
+            assert summary.call_count == 1
+        assert id(notifications) in get_reliability_service()._snapshots
+
     def test_get_notifications_invalid_page(self, client):
         """Test getting notifications with invalid page number."""
         response = client.get('/api/notifications?paginate=true&page=0')
         assert response.status_code == 400
+        assert response.get_json() == {'error': {'code': 'BAD_REQUEST', 'message': 'page must be >= 1'}}
+        assert response.mimetype == 'application/json'
 
     def test_get_notifications_invalid_page_size(self, client):
         """Test getting notifications with invalid page size."""
@@ -79,9 +227,10 @@ class TestNotificationDetailEndpoint:
         assert data['error']['code'] == 'NOT_FOUND'
 
     def test_get_notification_invalid_id(self, client):
-        """Test getting notification with invalid ID format."""
-        response = client.get('/api/notifications/<script>alert(1)</script>')
-        assert response.status_code == 400
+        """Test malformed IDs are rejected by routing before the view runs."""
+        for bad_id in ('<script>alert(1)</script>', 'bad id!', 'A' * 21):
+            response = client.get(f'/api/notifications/{bad_id}')
+            assert response.status_code == 404
 
     def test_get_notification_with_data(self, client, db_with_data):
         """Test getting notification that exists."""
@@ -139,6 +288,136 @@ class TestAnalyzeEndpoint:
         assert response.status_code == 400
 
 
+    def test_analyze_async_job(self, client, sample_notification, sample_analysis_response):
+        """Test that async analysis returns a job id that can be polled for the result."""
+        from unittest.mock import patch
+        from app.services.analysis_jobs import shutdown_analysis_jobs
+        import app.main as main_module
+
+        main_module._analysis_cache.clear()
+        with patch('app.main.analyze_text') as analyze:
+            analyze.return_value.dict.return_value = sample_analysis_response
+            response = client.post(
+                '/api/analyze?async=true',
+                data=json.dumps({'notification': sample_notification}),
+                content_type='application/json'
+            )
+            assert response.status_code == 202
+            job_id = json.loads(response.data)['job_id']
+            shutdown_analysis_jobs(wait=True)
+
+        response = client.get(f'/api/analyze/{job_id}')
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['status'] == 'finished'
+        assert data['result'] == sample_analysis_response
+        main_module._analysis_cache.clear()
+
+    def test_analyze_result_cached_by_content(self, client, sample_notification, sample_analysis_response):
+        """Test that repeat analyses of unchanged content skip the LLM call."""
+        from unittest.mock import patch
+        import app.main as main_module
+
+        main_module._analysis_cache.clear()
+        with patch('app.main.analyze_text') as analyze, \
+                patch('app.main.fetch_active_rules', return_value=[]):
+            analyze.return_value.dict.return_value = sample_analysis_response
+            for _ in range(2):
+                response = client.post(
+                    '/api/analyze',
+                    data=json.dumps({'notification': sample_notification}),
+                    content_type='application/json'
+                )
+                assert response.status_code == 200
+                assert json.loads(response.data) == sample_analysis_response
+            assert analyze.call_count == 1
+
+            changed = dict(sample_notification, LongText='Updated text')
+            client.post(
+                '/api/analyze',
+                data=json.dumps({'notification': changed}),
+                content_type='application/json'
+            )
+            assert analyze.call_count == 2
+        main_module._analysis_cache.clear()
+
+    def test_analyze_cache_keyed_by_rules(self, client, sample_notification, sample_analysis_response):
+        """Test that rule changes and failed rule fetches bypass cached analyses."""
+        from unittest.mock import patch
+        import app.main as main_module
+
+        main_module._analysis_cache.clear()
+        rule = {'name': 'Long text', 'target_field': 'Long Text', 'rule_type': 'VALIDATION'}
+        with patch('app.main.analyze_text') as analyze, \
+                patch('app.main.fetch_active_rules') as rules:
+            analyze.return_value.dict.return_value = sample_analysis_response
+            for active_rules in ([], [rule], [rule], None, None):
+                rules.return_value = active_rules
+                response = client.post(
+                    '/api/analyze',
+                    data=json.dumps({'notification': sample_notification}),
+                    content_type='application/json'
+                )
+                assert response.status_code == 200
+            # Cached only for the repeated ruleset; failed fetches always re-run
+            assert analyze.call_count == 4
+            assert analyze.call_args_list[1].args[2] == [rule]
+        main_module._analysis_cache.clear()
+
+    def test_analyze_unknown_job(self, client):
+        """Test polling an unknown analysis job."""
+        response = client.get('/api/analyze/doesnotexist')
+        assert response.status_code == 404
+
+    def test_analyze_job_polled_from_other_worker(self, client, sample_analysis_response):
+        """Test a job stored by another worker process can be polled here."""
+        import time
+        from app.database import get_db_connection
+        from app.services.analysis_jobs import get_analysis_job
+
+        get_analysis_job('warmup')  # creates the table on databases that predate it
+        with get_db_connection() as conn:
+            conn.execute(
+                "INSERT INTO analysis_jobs (id, status, created_at, finished_at, result) "
+                "VALUES (?, 'finished', ?, ?, ?)",
+                ('otherworker1', time.time(), time.time(), json.dumps(sample_analysis_response))
+            )
+
+        response = client.get('/api/analyze/otherworker1')
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['status'] == 'finished'
+        assert data['result'] == sample_analysis_response
+
+    def test_job_store_does_not_retry_other_errors(self, client):
+        """Test a failing statement is raised once, not taken for a missing table."""
+        import sqlite3
+        from unittest.mock import patch
+        from app.services import analysis_jobs
+
+        analysis_jobs.get_analysis_job('warmup')
+        insert = "INSERT INTO analysis_jobs (id, status, created_at) VALUES ('dupjob1', 'queued', 0)"
+        analysis_jobs._execute(insert)
+        with patch.object(analysis_jobs, '_create_jobs_table') as create_table:
+            with pytest.raises(sqlite3.IntegrityError):
+                analysis_jobs._execute(insert)
+        create_table.assert_not_called()
+
+    def test_expired_analysis_job_not_found(self, client):
+        """Test jobs are dropped once the TTL has passed, also if never finished."""
+        import time
+        from app.database import get_db_connection
+        from app.services.analysis_jobs import get_analysis_job, ANALYSIS_JOB_TTL_SECONDS
+
+        get_analysis_job('warmup')
+        with get_db_connection() as conn:
+            conn.execute(
+                "INSERT INTO analysis_jobs (id, status, created_at) VALUES ('stalejob1', 'running', ?)",
+                (time.time() - ANALYSIS_JOB_TTL_SECONDS - 1,)
+            )
+        assert client.get('/api/analyze/stalejob1').status_code == 404
+
+
 class TestChatEndpoint:
     """Tests for the chat endpoint."""
 
@@ -184,6 +463,70 @@ class TestChatEndpoint:
         assert response.status_code == 400
 
 
+    def test_chat_async_job(self, client, sample_notification, sample_analysis_response):
+        """Test that async chat returns a job id that can be polled for the answer."""
+        from unittest.mock import patch
+        from app.services.analysis_jobs import shutdown_analysis_jobs
+
+        with patch('app.main.chat_with_assistant', return_value={'answer': 'Add the equipment.'}) as chat:
+            response = client.post(
+                '/api/chat?async=true',
+                data=json.dumps({
+                    'notification': sample_notification,
+                    'question': 'What can I improve?',
+                    'analysis': sample_analysis_response
+                }),
+                content_type='application/json'
+            )
+            assert response.status_code == 202
+            job_id = json.loads(response.data)['job_id']
+            shutdown_analysis_jobs(wait=True)
+            assert chat.call_count == 1
+
+        response = client.get(f'/api/chat/{job_id}')
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['status'] == 'finished'
+        assert data['result'] == {'answer': 'Add the equipment.'}
+
+    def test_chat_async_job_failure_stored(self, client, sample_notification, sample_analysis_response):
+        """Test that a failed chat job exposes its error through the shared job store."""
+        from unittest.mock import patch
+        from app.services.analysis_jobs import shutdown_analysis_jobs, get_analysis_job
+
+        with patch('app.main.chat_with_assistant', side_effect=RuntimeError('LLM down')):
+            response = client.post(
+                '/api/chat?async=true',
+                data=json.dumps({
+                    'notification': sample_notification,
+                    'question': 'What can I improve?',
+                    'analysis': sample_analysis_response
+                }),
+                content_type='application/json'
+            )
+            job_id = json.loads(response.data)['job_id']
+            shutdown_analysis_jobs(wait=True)
+
+        # Read back from the database, as a worker that did not run the job would
+        assert get_analysis_job(job_id).status == 'failed'
+        data = json.loads(client.get(f'/api/chat/{job_id}').data)
+        assert data['status'] == 'failed'
+        assert data['error']['code'] == 'INTERNAL_SERVER_ERROR'
+
+    def test_chat_async_invalid_context(self, client, sample_notification):
+        """Test that a malformed analysis context is rejected before queuing."""
+        response = client.post(
+            '/api/chat?async=true',
+            data=json.dumps({
+                'notification': sample_notification,
+                'question': 'What can I improve?',
+                'analysis': {'score': 'not a number'}
+            }),
+            content_type='application/json'
+        )
+        assert response.status_code == 400
+
+
 class TestConfigurationEndpoint:
     """Tests for the configuration endpoints."""
 
@@ -225,6 +568,71 @@ class TestConfigurationEndpoint:
         data = json.loads(response.data)
         assert data['status'] == 'ok'
 
+    def test_get_configuration_reflects_update(self, client):
+        """Test that a saved configuration is returned by the next read."""
+        config = {
+            'analysis_llm_settings': {
+                'model': 'gemini-1.5-pro',
+                'temperature': 0.4
+            }
+        }
+        client.post(
+            '/api/configuration',
+            data=json.dumps(config),
+            content_type='application/json'
+        )
+
+        response = client.get('/api/configuration')
+        data = json.loads(response.data)
+        assert data['analysis_llm_settings'] == config['analysis_llm_settings']
+
+    def test_set_configuration_bumps_shared_version(self, client):
+        """Test a configuration save invalidates the summaries of every worker."""
+        from app.services.data_service import get_notifications_version
+
+        before = get_notifications_version()
+        response = client.post(
+            '/api/configuration',
+            data=json.dumps({'chat_llm_settings': {'model': 'gemini-1.5-flash', 'temperature': 0.5}}),
+            content_type='application/json'
+        )
+        assert response.status_code == 200
+        assert get_notifications_version() == before + 1
+
+    def test_unchanged_configuration_not_rewritten(self, tmp_path, monkeypatch):
+        """Test that saving an identical configuration skips the file write."""
+        from unittest.mock import patch
+        from app import config_manager
+
+        monkeypatch.setattr(config_manager, 'CONFIG_FILE', str(tmp_path / 'config.json'))
+        monkeypatch.setattr(config_manager, '_cfg_cache', {'mtime': None, 'data': None, 'bytes': None})
+        config = {'chat_llm_settings': {'model': 'gemini-1.5-flash', 'temperature': 0.7}}
+
+        config_manager.set_config(config)
+        with patch.object(config_manager.os, 'replace') as replace:
+            config_manager.set_config(dict(config))
+        replace.assert_not_called()
+        assert config_manager.get_config() == config
+        assert [p.name for p in tmp_path.iterdir()] == ['config.json']
+
+    def test_configuration_write_uses_unique_temp_file(self, tmp_path, monkeypatch):
+        """Test each save writes its own temp file and removes it if the rename fails."""
+        from unittest.mock import patch
+        from app import config_manager
+
+        monkeypatch.setattr(config_manager, 'CONFIG_FILE', str(tmp_path / 'config.json'))
+        monkeypatch.setattr(config_manager, '_cfg_cache', {'mtime': None, 'data': None, 'bytes': None})
+
+        with patch.object(config_manager.os, 'replace', side_effect=OSError('disk full')) as replace:
+            with pytest.raises(OSError):
+                config_manager.set_config({'chat_llm_settings': {'temperature': 0.1}})
+            with pytest.raises(OSError):
+                config_manager.set_config({'chat_llm_settings': {'temperature': 0.2}})
+        first_tmp, second_tmp = (c.args[0] for c in replace.call_args_list)
+        assert first_tmp != second_tmp
+        assert os.path.dirname(first_tmp) == str(tmp_path)
+        assert list(tmp_path.iterdir()) == []
+
     def test_set_configuration_invalid_temperature(self, client):
         """Test setting configuration with invalid temperature."""
         config = {
@@ -0,0 +1,183 @@
+"""
+Unit tests for SAP BTP configuration helpers.
+"""
+import pytest
+import sys
+import os
+import json
+import asyncio
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app import btp_config
+
+
+VCAP_SERVICES = {
+    'xsuaa': [{'credentials': {
+        'clientid': 'xsuaa-client', 'clientsecret': 'secret',
+        'url': 'https://tenant.authentication.example.com',
+        'xsappname': 'pm-analyzer', 'identityzone': 'tenant'
+    }}],
+    'destination': [{'credentials': {
+        'uri': 'https://destination.example.com', 'clientid': 'dest-client',
+        'clientsecret': 'dest-secret', 'url': 'https://tenant.authentication.example.com'
+    }}]
+}
+
+
+@pytest.fixture
+def vcap_env(monkeypatch):
+    """Bind fake BTP services and reset the module caches around each test."""
+    btp_config.reset_btp_cache()
+    monkeypatch.setenv('VCAP_SERVICES', json.dumps(VCAP_SERVICES))
+    yield
+    btp_config.reset_btp_cache()
+
+
+class TestVcapParsing:
+    """Tests for VCAP_SERVICES parsing and memoization."""
+
+    def test_get_vcap_services_is_memoized(self, vcap_env):
+        """Test that repeated calls reuse the parsed VCAP_SERVICES."""
+        first = btp_config.get_vcap_services()
+        assert btp_config.get_vcap_services() is first
+        assert 'xsuaa' in first
+
+    def test_get_vcap_services_reparses_on_change(self, vcap_env, monkeypatch):
+        """Test that a changed environment variable is picked up."""
+        btp_config.get_vcap_services()
+        monkeypatch.setenv('VCAP_SERVICES', json.dumps({'connectivity': []}))
+        assert list(btp_config.get_vcap_services()) == ['connectivity']
+
+    def test_service_configs_follow_bindings(self, vcap_env, monkeypatch):
+        """Test that derived configs are cached until bindings change."""
+        xsuaa = btp_config.get_xsuaa_config()
+        assert xsuaa.clientid == 'xsuaa-client'
+        assert btp_config.get_xsuaa_config() is xsuaa
+
+        monkeypatch.setenv('VCAP_SERVICES', '{}')
+        assert btp_config.get_xsuaa_config() is None
+
+    def test_is_cf_environment_follows_environment(self, vcap_env, monkeypatch):
+        """Test that CF detection picks up environment changes without a reset."""
+        assert btp_config.is_cf_environment() is True
+
+        monkeypatch.delenv('VCAP_SERVICES')
+        monkeypatch.delenv('VCAP_APPLICATION', raising=False)
+        assert btp_config.is_cf_environment() is False
+
+        monkeypatch.setenv('VCAP_APPLICATION', '{}')
+        assert btp_config.is_cf_environment() is True
+
+    def test_invalid_vcap_services(self, vcap_env, monkeypatch):
+        """Test that invalid JSON yields an empty dict."""
+        monkeypatch.setenv('VCAP_SERVICES', 'not-json')
+        assert btp_config.get_vcap_services() == {}
+
+
+class TestDestinationFetch:
+    """Tests for destination lookups with token and destination caching."""
+
+    @staticmethod
+    def _mock_session():
+        session = MagicMock()
+        session.post.return_value.content = json.dumps({'access_token': 'tok', 'expires_in': 43199}).encode()
+        session.get.return_value.content = json.dumps({
+            'destinationConfiguration': {'URL': 'https://sap.example.com'}
+        }).encode()
+        return session
+
+    def test_destination_and_token_are_cached(self, vcap_env):
+        """Test that repeated lookups reuse the token and the destination."""
+        session = self._mock_session()
+        with patch.object(btp_config, '_get_http_session', return_value=session):
+            first = btp_config.get_destination_sync('SAP_PM_SYSTEM')
+            second = btp_config.get_destination_sync('SAP_PM_SYSTEM')
+
+        assert first['destinationConfiguration']['URL'] == 'https://sap.example.com'
+        assert second is first
+        assert session.post.call_count == 1
+        assert session.get.call_count == 1
+
+    def test_token_is_shared_across_destinations(self, vcap_env):
+        """Test that one OAuth token serves lookups of different destinations."""
+        session = self._mock_session()
+        with patch.object(btp_config, '_get_http_session', return_value=session):
+            btp_config.get_destination_sync('SAP_PM_SYSTEM')
+            btp_config.get_destination_sync('SAP_QM_SYSTEM')
+
+        assert session.post.call_count == 1
+        assert session.get.call_count == 2
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self.status = 200
+        self._payload = payload
+
+    async def json(self, loads=json.loads):
+        return loads(json.dumps(self._payload))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeAsyncSession:
+    def __init__(self):
+        self.posts = 0
+        self.gets = []
+
+    def post(self, url, data=None):
+        self.posts += 1
+        return _FakeResponse({'access_token': 'tok', 'expires_in': 43199})
+
+    def get(self, url, headers=None):
+        self.gets.append(url.rsplit('/', 1)[-1])
+        return _FakeResponse({'destinationConfiguration': {'URL': url}})
+
+
+class TestFetchDestinations:
+    """Tests for batched async destination lookups."""
+
+    def test_fetch_destinations_single_token_request(self, vcap_env):
+        """Test that several destinations are fetched with one token request."""
+        session = _FakeAsyncSession()
+        with patch.object(btp_config, '_get_aiohttp_session', return_value=session):
+            results = asyncio.run(btp_config.fetch_destinations(['SAP_PM_SYSTEM', 'SAP_QM_SYSTEM']))
+
+        assert set(results) == {'SAP_PM_SYSTEM', 'SAP_QM_SYSTEM'}
+        assert all(results.values())
+        assert session.posts == 1
+        assert sorted(session.gets) == ['SAP_PM_SYSTEM', 'SAP_QM_SYSTEM']
+
+    def test_configure_sap_from_destination(self, vcap_env):
+        """Test that the sync wrapper maps the destination using the pooled session."""
+        session = TestDestinationFetch._mock_session()
+        with patch.object(btp_config, '_get_http_session', return_value=session), \
+                patch.object(btp_config, 'close_http_sessions') as close_sessions:
+            env_config = btp_config.configure_sap_from_destination('SAP_PM_SYSTEM')
+            btp_config.configure_sap_from_destination('SAP_QM_SYSTEM')
+
+        assert env_config['SAP_ODATA_URL'] == 'https://sap.example.com'
+        assert env_config['SAP_AUTH_TYPE'] == 'BasicAuthentication'
+        # The pooled session (and its token) is reused, not torn down per call
+        assert session.post.call_count == 1
+        session.close.assert_not_called()
+        close_sessions.assert_not_called()
+
+    def test_initialize_keeps_existing_env(self, vcap_env, monkeypatch):
+        """Test that startup only fills SAP settings that are not already set."""
+        monkeypatch.setenv('SAP_AUTH_TYPE', 'OAuth2')
+        for key in ('SAP_ODATA_URL', 'SAP_USER'):
+            monkeypatch.delenv(key, raising=False)
+        session = _FakeAsyncSession()
+        with patch.object(btp_config, '_get_aiohttp_session', return_value=session):
+            btp_config.initialize_btp_config()
+
+        assert os.environ['SAP_ODATA_URL'].endswith('/SAP_PM_SYSTEM')
+        assert os.environ['SAP_AUTH_TYPE'] == 'OAuth2'
+        assert session.posts == 1
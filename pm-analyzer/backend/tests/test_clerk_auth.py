@@ -0,0 +1,503 @@
+"""
+Unit tests for Clerk authentication helpers.
+"""
+import pytest
+import sys
+import os
+import time
+import json
+from unittest.mock import MagicMock, patch
+
+import httpx
+from flask import g
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+import jwt
+from jwt.algorithms import RSAAlgorithm
+
+from app import clerk_auth
+
+
+@pytest.fixture(scope='module')
+def rsa_keys():
+    """Generate an RSA key pair and its public JWK."""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption()
+    ).decode()
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+    public_jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    public_jwk['kid'] = 'test-kid'
+    return private_pem, public_pem, public_jwk
+
+
+def _make_token(private_pem, kid='test-kid', **claims):
+    payload = {'sub': 'user_123', 'exp': int(time.time()) + 60}
+    payload.update(claims)
+    return jwt.encode(payload, private_pem, algorithm='RS256', headers={'kid': kid})
+
+
+@pytest.fixture
+def jwks_session(rsa_keys):
+    """Mock the shared JWKS session and start with an empty JWKS cache."""
+    clerk_auth._JWKS_CACHE.clear()
+    session = MagicMock()
+    session.get.return_value.content = json.dumps({'keys': [rsa_keys[2]]}).encode()
+    with patch.object(clerk_auth, '_get_jwks_session', return_value=session):
+        yield session
+    clerk_auth._JWKS_CACHE.clear()
+
+
+class TestJwksVerification:
+    """Tests for JWKS-based token verification."""
+
+    def test_jwks_fetched_once(self, rsa_keys, jwks_session):
+        """Test that the JWKS is cached between verifications."""
+        token = _make_token(rsa_keys[0])
+
+        assert clerk_auth._verify_token_jwks(token)['sub'] == 'user_123'
+        assert clerk_auth._verify_token_jwks(token)['sub'] == 'user_123'
+        assert jwks_session.get.call_count == 1
+
+    def test_unknown_kid_refreshes_once(self, rsa_keys, jwks_session):
+        """Test that an unknown kid forces a refresh only after the minimum interval."""
+        clerk_auth._verify_token_jwks(_make_token(rsa_keys[0]))
+
+        assert clerk_auth._verify_token_jwks(_make_token(rsa_keys[0], kid='rotated')) is None
+        assert jwks_session.get.call_count == 1
+
+        keys, fetched_at = next(iter(clerk_auth._JWKS_CACHE.values()))
+        for url in clerk_auth._JWKS_CACHE:
+            clerk_auth._JWKS_CACHE[url] = (keys, fetched_at - clerk_auth.JWKS_MIN_REFRESH_SECONDS)
+
+        assert clerk_auth._verify_token_jwks(_make_token(rsa_keys[0], kid='rotated')) is None
+        assert jwks_session.get.call_count == 2
+
+
+class TestTokenCache:
+    """Tests for the verified-token cache."""
+
+    @pytest.fixture
+    def local_config(self, rsa_keys):
+        """Enable Clerk with a local verification key and an empty token cache."""
+        config = clerk_auth.ClerkConfig(secret_key='sk_test', jwt_verification_key=rsa_keys[1], enabled=True)
+        clerk_auth._TOKEN_CACHE.clear()
+        with patch.object(clerk_auth, 'get_clerk_config', return_value=config):
+            yield config
+        clerk_auth._TOKEN_CACHE.clear()
+
+    def test_verified_token_is_cached(self, rsa_keys, local_config):
+        """Test that a repeated token skips signature verification."""
+        token = _make_token(rsa_keys[0])
+
+        with patch.object(clerk_auth, '_verify_token_local', wraps=clerk_auth._verify_token_local) as verify:
+            assert clerk_auth.verify_clerk_token(token)['sub'] == 'user_123'
+            assert clerk_auth.verify_clerk_token(token)['sub'] == 'user_123'
+
+        assert verify.call_count == 1
+        assert token.encode() not in clerk_auth._TOKEN_CACHE
+
+    def test_invalid_token_not_cached(self, rsa_keys, local_config):
+        """Test that failed verifications are not cached."""
+        assert clerk_auth.verify_clerk_token('not-a-jwt') is None
+        assert len(clerk_auth._TOKEN_CACHE) == 0
+
+    def test_cache_entry_bounded_by_exp(self, rsa_keys, local_config):
+        """Test that cached payloads expire with the token."""
+        token = _make_token(rsa_keys[0], exp=int(time.time()) + 5)
+        clerk_auth.verify_clerk_token(token)
+
+        (_, expires_at), = clerk_auth._TOKEN_CACHE.values()
+        assert expires_at <= time.time() + 5
+
+
+class TestClerkConfig:
+    """Tests for Clerk configuration loading."""
+
+    def test_env_read_once(self, monkeypatch):
+        """Test that the environment is parsed once until the cache is cleared."""
+        monkeypatch.setenv('CLERK_SECRET_KEY', 'sk_test')
+        monkeypatch.setenv('CLERK_ENABLED', 'TRUE')
+        clerk_auth.get_clerk_config.cache_clear()
+        try:
+            with patch.object(clerk_auth.ClerkConfig, 'from_env', wraps=clerk_auth.ClerkConfig.from_env) as from_env:
+                assert clerk_auth.get_clerk_config().enabled is True
+                assert clerk_auth.get_clerk_config() is clerk_auth.get_clerk_config()
+            assert from_env.call_count == 1
+        finally:
+            clerk_auth.get_clerk_config.cache_clear()
+
+
+    def test_jwks_url_derived_once(self):
+        """Test that the JWKS URL is derived when the config is built."""
+        test_config = clerk_auth.ClerkConfig(publishable_key='pk_test_abc')
+        live_config = clerk_auth.ClerkConfig(publishable_key='pk_live_abc', api_url='https://api.example.com/v1')
+
+        assert test_config.jwks_url == 'https://clerk.clerk.dev/.well-known/jwks.json'
+        assert live_config.jwks_url == 'https://example.com/v1/.well-known/jwks.json'
+
+
+class TestClerkUserRoles:
+    """Tests for ClerkUser role checks."""
+
+    def test_user_has_no_instance_dict(self):
+        """Test that ClerkUser uses slots."""
+        user = clerk_auth.ClerkUser(id='u0', email='s@example.com')
+
+        assert not hasattr(user, '__dict__')
+
+    def test_admin_has_every_role(self):
+        """Test that admins pass every role check."""
+        user = clerk_auth.ClerkUser(id='u1', email='a@example.com', roles=['org:admin'])
+
+        assert user.is_admin and user.is_editor and user.is_auditor
+        assert user.has_role('auditor')
+        assert user.has_any_role(frozenset({'editor'}))
+
+    def test_editor_roles(self):
+        """Test that an editor is neither admin nor auditor."""
+        user = clerk_auth.ClerkUser(id='u2', email='e@example.com', roles=['editor'])
+
+        assert user.to_dict()['is_editor'] is True
+        assert user.to_dict()['is_admin'] is False
+        assert user.to_dict()['is_auditor'] is False
+        assert user.has_any_role(frozenset({'admin', 'editor'}))
+        assert not user.has_any_role(frozenset({'auditor'}))
+
+    def test_admin_check_resolved_once(self):
+        """Test that repeated role checks on one user read the config once."""
+        user = clerk_auth.ClerkUser(id='u3', email='v@example.com', roles=['viewer'])
+        config = clerk_auth.ClerkConfig()
+
+        with patch.object(clerk_auth, 'get_clerk_config', return_value=config) as get_config:
+            for _ in range(3):
+                assert not user.has_any_role(frozenset({'editor'}))
+
+        assert get_config.call_count == 1
+
+
+def _clerk_api(request):
+    """Mock Clerk Backend API: /users/<id> returns a user, unknown ids 404."""
+    if request.url.path.endswith('/users'):
+        limit = int(request.url.params['limit'])
+        offset = int(request.url.params['offset'])
+        total = 250
+        return httpx.Response(200, json={'data': [
+            {'id': f'user_{i}', 'email_addresses': []}
+            for i in range(offset, min(offset + limit, total))
+        ]})
+    user_id = request.url.path.rsplit('/', 1)[-1]
+    if user_id == 'missing':
+        return httpx.Response(404, json={'errors': []})
+    return httpx.Response(200, json={
+        'id': user_id,
+        'primary_email_address_id': 'em_2',
+        'email_addresses': [
+            {'id': 'em_1', 'email_address': f'{user_id}-old@example.com'},
+            {'id': 'em_2', 'email_address': f'{user_id}@example.com'}
+        ],
+        'public_metadata': {'roles': 'editor'},
+        'created_at': 1700000000000
+    })
+
+
+@pytest.fixture
+def clerk_client():
+    """ClerkClient whose HTTP clients talk to the mock API."""
+    config = clerk_auth.ClerkConfig(secret_key='sk_test_mock', api_url='https://api.clerk.test/v1', enabled=True)
+    original = clerk_auth._client_kwargs
+
+    def mocked_kwargs(cfg):
+        kwargs = original(cfg)
+        kwargs['transport'] = httpx.MockTransport(_clerk_api)
+        return kwargs
+
+    clerk_auth._http_clients.clear()
+    with patch.object(clerk_auth, '_client_kwargs', side_effect=mocked_kwargs):
+        yield clerk_auth.ClerkClient(config)
+    clerk_auth._http_clients.clear()
+
+
+class TestClerkClient:
+    """Tests for the Clerk Backend API client."""
+
+    def test_get_user(self, clerk_client):
+        """Test fetching and parsing a single user."""
+        user = clerk_client.get_user('user_1')
+
+        assert user.id == 'user_1'
+        assert user.email == 'user_1@example.com'
+        assert user.roles == ['editor']
+
+    def test_parse_user_falls_back_to_first_email(self, clerk_client):
+        """Test that the first address is used when no primary address matches."""
+        user = clerk_client._parse_user({
+            'id': 'user_x',
+            'primary_email_address_id': 'em_unknown',
+            'email_addresses': [
+                {'id': 'em_1', 'email_address': 'first@example.com'},
+                {'id': 'em_2', 'email_address': 'second@example.com'}
+            ]
+        })
+
+        assert user.email == 'first@example.com'
+        assert clerk_client._parse_user({'id': 'user_y'}).email == ''
+
+    def test_clients_share_connection_pool(self, clerk_client):
+        """Test that ClerkClient instances reuse one HTTP client per config."""
+        assert clerk_auth.ClerkClient(clerk_client.config)._client is clerk_client._client
+
+    def test_get_user_batch(self, clerk_client):
+        """Test fetching several users concurrently."""
+        users = clerk_client.get_user_batch(['user_1', 'missing', 'user_2'])
+
+        assert users['user_1'].email == 'user_1@example.com'
+        assert users['missing'] is None
+        assert users['user_2'].id == 'user_2'
+
+    def test_set_user_roles_bulk(self, clerk_client):
+        """Test that bulk role updates report success per user."""
+        results = clerk_client.set_user_roles_bulk({
+            'user_1': ['admin'],
+            'missing': ['editor'],
+            'user_2': ['viewer']
+        })
+
+        assert results == {'user_1': True, 'missing': False, 'user_2': True}
+
+    def test_list_users_endpoint(self, clerk_client):
+        """Test that /auth/users returns serialized users from the API."""
+        from flask import Flask
+
+        app = Flask(__name__)
+        app.register_blueprint(clerk_auth.clerk_bp, url_prefix='/api')
+        # Auth disabled so require_admin lets the request through
+        config = clerk_auth.ClerkConfig(secret_key='sk_test_mock', api_url='https://api.clerk.test/v1')
+        with patch.object(clerk_auth, 'get_clerk_config', return_value=config):
+            response = app.test_client().get('/api/auth/users?limit=5&offset=10')
+
+        data = response.get_json()
+        assert response.mimetype == 'application/json'
+        assert data['count'] == 5
+        assert [u['id'] for u in data['users']] == [f'user_{i}' for i in range(10, 15)]
+
+    def test_iter_users_paginates(self, clerk_client):
+        """Test that iter_users walks every page until a short page."""
+        users = list(clerk_client.iter_users(page_size=100))
+
+        assert len(users) == 250
+        assert users[-1].id == 'user_249'
+
+    def test_list_users_limit_and_offset(self, clerk_client):
+        """Test that list_users honours limit and offset."""
+        users = clerk_client.list_users(limit=20, offset=240)
+
+        assert [u.id for u in users] == [f'user_{i}' for i in range(240, 250)]
+
+
+class TestAuthDecorators:
+    """Tests for require_auth and require_role."""
+
+    @pytest.fixture
+    def app(self, rsa_keys):
+        """Flask app with the Clerk middleware installed as a before_request hook."""
+        from flask import Flask, jsonify
+
+        config = clerk_auth.ClerkConfig(secret_key='sk_test', jwt_verification_key=rsa_keys[1], enabled=True)
+        app = Flask(__name__)
+        app.before_request(clerk_auth.clerk_auth_middleware)
+
+        @app.route('/protected')
+        @clerk_auth.require_auth
+        def protected():
+            return jsonify({'user': clerk_auth.get_current_user().id})
+
+        @app.route('/admin')
+        @clerk_auth.require_role('admin')
+        def admin():
+            return jsonify({'admin': True})
+
+        clerk_auth._TOKEN_CACHE.clear()
+        clerk_auth._USER_CACHE.clear()
+        with patch.object(clerk_auth, 'get_clerk_config', return_value=config):
+            yield app
+        clerk_auth._TOKEN_CACHE.clear()
+        clerk_auth._USER_CACHE.clear()
+
+    def test_failed_auth_is_not_reverified(self, app):
+        """Test that a rejected token is verified once, not again by the decorator."""
+        with patch.object(clerk_auth, '_verify_clerk_token', return_value=None) as verify:
+            response = app.test_client().get('/protected', headers={'Authorization': 'Bearer bad'})
+
+        assert response.status_code == 401
+        assert response.get_json()['error']['code'] == 'UNAUTHORIZED'
+        assert verify.call_count == 1
+
+    def test_user_built_lazily(self, app, rsa_keys):
+        """Test that the middleware stores claims and the user is built on first access."""
+        token = _make_token(rsa_keys[0], org_id='org_1')
+        with app.test_request_context(headers={'Authorization': f'Bearer {token}'}):
+            clerk_auth.clerk_auth_middleware()
+
+            assert g.current_user is None
+            assert g.current_user_claims['org_id'] == 'org_1'
+
+            user = clerk_auth.get_current_user()
+            assert user.org_id == 'org_1'
+            assert clerk_auth.get_current_user() is user
+
+    def test_user_reused_across_requests(self, app, rsa_keys):
+        """Test that the same token maps to the cached user until evicted."""
+        token = _make_token(rsa_keys[0])
+        headers = {'Authorization': f'Bearer {token}'}
+        users = []
+        for _ in range(2):
+            with app.test_request_context(headers=headers):
+                clerk_auth.clerk_auth_middleware()
+                users.append(clerk_auth.get_current_user())
+        assert users[0] is users[1]
+
+        clerk_auth.evict_cached_user('user_123')
+        assert not clerk_auth._USER_CACHE and not clerk_auth._TOKEN_CACHE
+
+        with app.test_request_context(headers=headers):
+            clerk_auth.clerk_auth_middleware()
+            assert clerk_auth.get_current_user() is not users[0]
+
+    def test_require_auth_allows_valid_token(self, app, rsa_keys):
+        """Test that a valid token reaches the route."""
+        token = _make_token(rsa_keys[0])
+        response = app.test_client().get('/protected', headers={'Authorization': f'Bearer {token}'})
+
+        assert response.status_code == 200
+        assert response.get_json() == {'user': 'user_123'}
+
+    def test_require_role_forbidden(self, app, rsa_keys):
+        """Test that a user without the role gets 403."""
+        token = _make_token(rsa_keys[0], public_metadata={'roles': ['viewer']})
+        response = app.test_client().get('/admin', headers={'Authorization': f'Bearer {token}'})
+
+        assert response.status_code == 403
+        assert response.get_json()['error']['message'] == 'Required role: admin'
+
+    def test_single_role_claim_string(self, app, rsa_keys):
+        """Test that a roles claim given as a plain string is treated as one role."""
+        token = _make_token(rsa_keys[0], public_metadata={'roles': 'admin'})
+        response = app.test_client().get('/admin', headers={'Authorization': f'Bearer {token}'})
+
+        assert response.status_code == 200
+
+    def test_require_role_allows_admin(self, app, rsa_keys):
+        """Test that an admin passes the role check."""
+        token = _make_token(rsa_keys[0], public_metadata={'roles': ['admin']})
+        response = app.test_client().get('/admin', headers={'Authorization': f'Bearer {token}'})
+
+        assert response.status_code == 200
+
+
+class TestAuthStatus:
+    """Tests for the auth status endpoint."""
+
+    def test_anonymous_status_reuses_body(self):
+        """Test that the anonymous status is serialized once per configuration."""
+        from flask import Flask
+
+        config = clerk_auth.ClerkConfig(secret_key='sk_test', publishable_key='pk_test_abc', enabled=True)
+        app = Flask(__name__)
+        app.register_blueprint(clerk_auth.clerk_bp, url_prefix='/api')
+        clerk_auth._anonymous_status_body.cache_clear()
+
+        with patch.object(clerk_auth, 'get_clerk_config', return_value=config), \
+                patch.object(clerk_auth, 'get_current_user', return_value=None):
+            client = app.test_client()
+            first = client.get('/api/auth/status')
+            client.get('/api/auth/status')
+
+        assert first.get_json() == {'enabled': True, 'publishable_key': 'pk_test_abc', 'user': None}
+        assert clerk_auth._anonymous_status_body.cache_info().hits == 1
+
+    def test_status_revalidation_returns_304(self):
+        """Test that a matching If-None-Match gets an empty 304."""
+        from flask import Flask
+
+        config = clerk_auth.ClerkConfig(secret_key='sk_test', enabled=True)
+        app = Flask(__name__)
+        app.register_blueprint(clerk_auth.clerk_bp, url_prefix='/api')
+
+        with patch.object(clerk_auth, 'get_clerk_config', return_value=config), \
+                patch.object(clerk_auth, 'get_current_user', return_value=None):
+            client = app.test_client()
+            etag = client.get('/api/auth/status').headers['ETag']
+            response = client.get('/api/auth/status', headers={'If-None-Match': etag})
+
+        assert etag.startswith('W/')
+        assert response.status_code == 304
+        assert response.data == b''
+
+
+class TestWebhook:
+    """Tests for the Clerk webhook endpoint."""
+
+    SECRET = 'whsec_' + __import__('base64').b64encode(b'webhook-secret').decode()
+
+    @pytest.fixture
+    def client(self):
+        from flask import Flask
+
+        config = clerk_auth.ClerkConfig(webhook_secret=self.SECRET)
+        app = Flask(__name__)
+        app.register_blueprint(clerk_auth.clerk_bp, url_prefix='/api')
+        with patch.object(clerk_auth, 'get_clerk_config', return_value=config):
+            yield app.test_client()
+
+    def _headers(self, body: bytes, timestamp=None):
+        import base64
+        import hashlib
+        import hmac
+
+        timestamp = str(int(timestamp or time.time()))
+        key = base64.b64decode(self.SECRET.split('_', 1)[1])
+        signature = base64.b64encode(
+            hmac.new(key, b'msg_1.' + timestamp.encode() + b'.' + body, hashlib.sha256).digest()
+        ).decode()
+        return {'svix-id': 'msg_1', 'svix-timestamp': timestamp, 'svix-signature': f'v1,{signature}'}
+
+    def test_signed_event_is_dispatched(self, client):
+        """Test that a correctly signed event reaches its handler."""
+        body = json.dumps({'type': 'user.updated', 'data': {'id': 'user_1'}}).encode()
+        with patch.object(clerk_auth, 'evict_cached_user') as evict:
+            response = client.post('/api/auth/webhook', data=body, headers=self._headers(body),
+                                   content_type='application/json')
+
+        assert response.status_code == 200
+        evict.assert_called_once_with('user_1')
+
+    def test_invalid_signature_rejected(self, client):
+        """Test that tampered or stale deliveries are rejected."""
+        body = json.dumps({'type': 'user.deleted', 'data': {'id': 'user_1'}}).encode()
+        tampered = client.post('/api/auth/webhook', data=body + b' ', headers=self._headers(body),
+                               content_type='application/json')
+        stale = client.post('/api/auth/webhook', data=body, headers=self._headers(body, time.time() - 3600),
+                            content_type='application/json')
+
+        assert tampered.status_code == 401
+        assert stale.status_code == 401
+
+    def test_tenant_work_runs_in_background(self, client):
+        """Test that membership events hand tenant usage recording to the worker."""
+        body = json.dumps({'type': 'organizationMembership.created',
+                           'data': {'organization': {'id': 'org_1'}}}).encode()
+        with patch.object(clerk_auth, '_submit_webhook_task') as submit:
+            response = client.post('/api/auth/webhook', data=body, headers=self._headers(body),
+                                   content_type='application/json')
+
+        assert response.status_code == 200
+        submit.assert_called_once_with(clerk_auth._record_active_user, 'org_1')
@@ -0,0 +1,65 @@
+"""
+Unit tests for JSON and CSV response compression.
+"""
+import pytest
+import sys
+import os
+import gzip
+
+from flask import Flask, Response, jsonify
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+pytest.importorskip('flask_compress')
+
+from app.compression import init_compression
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    init_compression(app)
+
+    @app.route('/large')
+    def large():
+        return jsonify([{'equipment_id': f'EQ{i:04d}', 'risk_level': 'low'} for i in range(200)])
+
+    @app.route('/small')
+    def small():
+        return jsonify({'status': 'ok'})
+
+    @app.route('/export')
+    def export():
+        def generate():
+            yield 'equipment_id,risk_level\n'
+            for i in range(200):
+                yield f'EQ{i:04d},low\n'
+        return Response(generate(), mimetype='text/csv')
+
+    return app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+class TestCompression:
+
+    def test_large_json_is_gzipped(self, client):
+        response = client.get('/large', headers={'Accept-Encoding': 'gzip'})
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert b'EQ0199' in gzip.decompress(response.data)
+
+    def test_small_json_is_not_compressed(self, client):
+        response = client.get('/small', headers={'Accept-Encoding': 'gzip'})
+        assert 'Content-Encoding' not in response.headers
+
+    def test_no_compression_without_accept_encoding(self, client):
+        response = client.get('/large')
+        assert 'Content-Encoding' not in response.headers
+
+    def test_streamed_csv_is_gzipped(self, client):
+        response = client.get('/export', headers={'Accept-Encoding': 'gzip'})
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(response.data).decode().splitlines()[-1] == 'EQ0199,low'
@@ -0,0 +1,75 @@
+"""
+Unit tests for CORS handling.
+"""
+import sys
+import os
+
+from flask import Flask, jsonify
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.cors import register_cors
+
+
+def _make_app(origins):
+    app = Flask(__name__)
+    register_cors(app, origins)
+    calls = []
+
+    @app.before_request
+    def auth():
+        calls.append('auth')
+
+    @app.route('/api/items', methods=['GET', 'POST'])
+    def items():
+        return jsonify([])
+
+    @app.route('/health')
+    def health():
+        return jsonify({'status': 'ok'})
+
+    return app, calls
+
+
+class TestCors:
+    """Tests for origin matching and preflight handling."""
+
+    def test_wildcard_origin(self):
+        """Test that API responses allow any origin by default."""
+        app, _ = _make_app('*')
+        response = app.test_client().get('/api/items', headers={'Origin': 'https://a.example.com'})
+        assert response.headers['Access-Control-Allow-Origin'] == '*'
+
+    def test_listed_origin_is_echoed(self):
+        """Test that only configured origins are echoed back."""
+        app, _ = _make_app('https://a.example.com, https://b.example.com')
+        client = app.test_client()
+
+        allowed = client.get('/api/items', headers={'Origin': 'https://b.example.com'})
+        denied = client.get('/api/items', headers={'Origin': 'https://evil.example.com'})
+
+        assert allowed.headers['Access-Control-Allow-Origin'] == 'https://b.example.com'
+        assert 'Origin' in allowed.headers['Vary']
+        assert 'Access-Control-Allow-Origin' not in denied.headers
+
+    def test_non_api_paths_untouched(self):
+        """Test that routes outside /api get no CORS headers."""
+        app, _ = _make_app('*')
+        response = app.test_client().get('/health', headers={'Origin': 'https://a.example.com'})
+        assert 'Access-Control-Allow-Origin' not in response.headers
+
+    def test_preflight_short_circuits(self):
+        """Test that preflight is answered before other request hooks."""
+        app, calls = _make_app('*')
+        response = app.test_client().options('/api/items', headers={
+            'Origin': 'https://a.example.com',
+            'Access-Control-Request-Method': 'POST',
+            'Access-Control-Request-Headers': 'Authorization, Content-Type',
+        })
+
+        assert response.status_code == 204
+        assert response.headers['Access-Control-Allow-Origin'] == '*'
+        assert 'POST' in response.headers['Access-Control-Allow-Methods']
+        assert response.headers['Access-Control-Allow-Headers'] == 'Authorization, Content-Type'
+        assert int(response.headers['Access-Control-Max-Age']) > 0
+        assert calls == []
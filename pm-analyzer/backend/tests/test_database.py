@@ -35,6 +35,42 @@ class TestDatabaseModule:
         assert os.path.exists(SCHEMA_PATH)
         assert os.path.exists(SCHEMA_PG_PATH)
 
+    def test_pg_connection_string_from_vcap(self, monkeypatch):
+        """Test that bound PostgreSQL credentials come from the parsed VCAP_SERVICES."""
+        import json
+        from app import btp_config
+        from app.database import _detect_database_type, _get_pg_connection_string
+
+        monkeypatch.delenv('DATABASE_TYPE', raising=False)
+        monkeypatch.delenv('DATABASE_URL', raising=False)
+        monkeypatch.setenv('VCAP_SERVICES', json.dumps({
+            'postgresql-db': [{'credentials': {'uri': 'postgresql://u:p@db:5432/pm'}}]
+        }))
+        btp_config.reset_btp_cache()
+        try:
+            assert _detect_database_type() == 'postgresql'
+            assert _get_pg_connection_string() == 'postgresql://u:p@db:5432/pm'
+        finally:
+            monkeypatch.delenv('VCAP_SERVICES')
+            btp_config.reset_btp_cache()
+
+    def test_worklist_order_uses_index(self):
+        """Test that the notification summary order is served by an index."""
+        import sqlite3
+        from app.database import SCHEMA_PATH
+
+        conn = sqlite3.connect(':memory:')
+        with open(SCHEMA_PATH) as f:
+            conn.executescript(f.read())
+        plan = ' '.join(row[3] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT QMNUM FROM QMEL ORDER BY ERDAT DESC, MZEIT DESC LIMIT 50"
+        ))
+
+        assert 'idx_qmel_erdat_mzeit' in plan
+        assert 'TEMP B-TREE' not in plan
+        # The composite index replaces the ERDAT-only one it prefixes
+        assert conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'idx_qmel_erdat'").fetchone() is None
+
 
 class TestSQLiteConnection:
     """Tests for SQLite connection within Flask context."""
@@ -66,6 +102,27 @@ class TestSQLiteConnection:
             from flask import g
             assert getattr(g, '_database', None) is None
 
+    def test_connection_reused_across_requests(self, app):
+        """Test the SQLite connection is kept per thread between requests."""
+        from app.database import get_db
+        with app.app_context():
+            db1 = get_db()
+        with app.app_context():
+            db2 = get_db()
+        assert db1 is db2
+
+    def test_close_db_rolls_back_uncommitted(self, app):
+        """Test uncommitted work does not leak into the next request."""
+        from app.database import get_db
+        with app.app_context():
+            db = get_db()
+            db.execute("CREATE TABLE IF NOT EXISTS rollback_probe (id INTEGER)")
+            db.commit()
+            db.execute("INSERT INTO rollback_probe VALUES (1)")
+        with app.app_context():
+            row = get_db().execute("SELECT COUNT(*) AS n FROM rollback_probe").fetchone()
+            assert row['n'] == 0
+
     def test_init_db(self, app):
         """Test init_db creates tables."""
         from app.database import init_db, get_db
@@ -99,6 +156,37 @@ class TestStandaloneConnection:
             row = cursor.fetchone()
             assert row['test'] == 1
 
+    def test_db_connection_reused_per_thread(self):
+        """Test SQLite blocks reuse one thread connection and nested blocks get their own."""
+        from app.database import get_db_connection, DATABASE_TYPE
+        if DATABASE_TYPE != 'sqlite':
+            pytest.skip('SQLite only')
+        with get_db_connection() as first:
+            with get_db_connection() as nested:
+                assert nested is not first
+        with get_db_connection() as second:
+            assert second is first
+            assert second.execute("SELECT 1 as test").fetchone()['test'] == 1
+
+    def test_missing_table_error_detection(self):
+        """Test only undefined-table errors are treated as a missing table."""
+        from app.database import is_missing_table_error, PG_UNDEFINED_TABLE
+
+        conn = sqlite3.connect(':memory:')
+        with pytest.raises(sqlite3.OperationalError) as missing:
+            conn.execute("SELECT * FROM nonexistent")
+        assert is_missing_table_error(missing.value)
+
+        assert not is_missing_table_error(sqlite3.OperationalError('database is locked'))
+        assert not is_missing_table_error(sqlite3.IntegrityError('UNIQUE constraint failed'))
+
+        class FakePgError(Exception):
+            def __init__(self, pgcode):
+                self.pgcode = pgcode
+
+        assert is_missing_table_error(FakePgError(PG_UNDEFINED_TABLE))
+        assert not is_missing_table_error(FakePgError('40P01'))  # deadlock_detected
+
 
 class TestDictRow:
     """Tests for the DictRow wrapper."""
@@ -114,8 +202,8 @@ class TestDictRow:
                 return self.name
 
         desc = [FakeDesc('col1'), FakeDesc('col2')]
-        # DictRow takes a tuple and description
-        row = DictRow(('val1', 'val2'), desc)
+        # DictRow can be built from a tuple and a cursor description
+        row = DictRow.from_description(('val1', 'val2'), desc)
         assert row['col1'] == 'val1'
         assert row['col2'] == 'val2'
 
@@ -130,7 +218,7 @@ class TestDictRow:
                 return self.name
 
         desc = [FakeDesc('col1'), FakeDesc('col2')]
-        row = DictRow(('val1', 'val2'), desc)
+        row = DictRow.from_description(('val1', 'val2'), desc)
         assert row[0] == 'val1'
         assert row[1] == 'val2'
 
@@ -145,7 +233,7 @@ class TestDictRow:
                 return self.name
 
         desc = [FakeDesc('a'), FakeDesc('b')]
-        row = DictRow(('1', '2'), desc)
+        row = DictRow.from_description(('1', '2'), desc)
         assert row.keys() == ['a', 'b']
 
     def test_dict_row_contains(self):
@@ -159,7 +247,7 @@ class TestDictRow:
                 return self.name
 
         desc = [FakeDesc('col1')]
-        row = DictRow(('val1',), desc)
+        row = DictRow.from_description(('val1',), desc)
         assert 'col1' in row
         assert 'col2' not in row
 
@@ -174,7 +262,7 @@ class TestDictRow:
                 return self.name
 
         desc = [FakeDesc('a'), FakeDesc('b'), FakeDesc('c')]
-        row = DictRow(('1', '2', '3'), desc)
+        row = DictRow.from_description(('1', '2', '3'), desc)
         assert len(row) == 3
 
     def test_dict_row_get(self):
@@ -188,6 +276,137 @@ class TestDictRow:
                 return self.name
 
         desc = [FakeDesc('col1')]
-        row = DictRow(('val1',), desc)
+        row = DictRow.from_description(('val1',), desc)
         assert row.get('col1') == 'val1'
         assert row.get('missing', 'default') == 'default'
+
+    def test_dict_row_iter_and_values(self):
+        """Test iteration and values() follow column order."""
+        from app.database import DictRow
+
+        class FakeDesc:
+            def __init__(self, name):
+                self.name = name
+            def __getitem__(self, idx):
+                return self.name
+
+        desc = [FakeDesc('a'), FakeDesc('b'), FakeDesc('c')]
+        row = DictRow.from_description(('1', '2', '3'), desc)
+        assert list(row) == ['1', '2', '3']
+        assert row.values() == ['1', '2', '3']
+        assert row[-1] == '3'
+
+
+class TestBulkInsert:
+    """Tests for chunked bulk inserts."""
+
+    def test_bulk_insert_sqlite_chunks(self):
+        """Test rows are inserted in executemany chunks within one transaction."""
+        import sqlite3
+        from unittest.mock import MagicMock
+        from app.database import bulk_insert
+
+        conn = sqlite3.connect(':memory:')
+        conn.execute("CREATE TABLE t (id INTEGER, name TEXT)")
+        spy = MagicMock(wraps=conn)
+
+        count = bulk_insert(spy, "INSERT INTO t (id, name) VALUES (?, ?)",
+                            ((i, f'n{i}') for i in range(5)), chunk_size=2)
+        conn.commit()
+
+        assert count == 5
+        assert spy.executemany.call_count == 3
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 5
+
+    def test_values_clause_rewritten_for_execute_values(self):
+        """Test the PostgreSQL multi-row form of an INSERT statement."""
+        from app.database import _to_pg_values_query
+
+        assert _to_pg_values_query("INSERT INTO t (a, b)\n VALUES (?, ?)") == "INSERT INTO t (a, b)\n VALUES %s"
+        assert _to_pg_values_query("INSERT INTO t SELECT * FROM u") is None
+
+
+class TestPgDictCursor:
+    """Tests for the PostgreSQL cursor wrapper."""
+
+    class FakeCursor:
+        description = (('id',), ('name',))
+
+        def __init__(self):
+            self.queries = []
+
+        def execute(self, query, params=None):
+            self.queries.append(query)
+
+        def fetchall(self):
+            return [(1, 'a'), (2, 'b')]
+
+        def __iter__(self):
+            return iter(self.fetchall())
+
+        def close(self):
+            self.closed = True
+
+    def test_rows_share_column_index(self):
+        """Test rows of one result set share the parsed column metadata."""
+        from app.database import PgDictCursor
+
+        raw = self.FakeCursor()
+        rows = PgDictCursor(raw).execute("SELECT id, name FROM t WHERE id = ?", (1,)).fetchall()
+
+        assert raw.queries == ["SELECT id, name FROM t WHERE id = %s"]
+        assert [row['name'] for row in rows] == ['a', 'b']
+        assert rows[0]._col_index is rows[1]._col_index
+        assert rows[1].items() == [('id', 2), ('name', 'b')]
+
+    def test_iter_rows_uses_server_side_cursor(self):
+        """Test iter_rows streams PostgreSQL rows through a named cursor."""
+        from app.database import PgConnectionWrapper, iter_rows, STREAM_ITERSIZE
+
+        raw = self.FakeCursor()
+        opened = {}
+
+        class FakeConn:
+            autocommit = True
+
+            def cursor(self, name=None):
+                opened['name'] = name
+                return raw
+
+        rows = iter_rows(PgConnectionWrapper(FakeConn(), pool=None), "SELECT id, name FROM t")
+
+        assert [row['id'] for row in rows] == [1, 2]
+        assert opened['name'].startswith('stream_')
+        assert raw.itersize == STREAM_ITERSIZE
+        assert raw.closed
+
+    def test_read_only_statements_skip_transaction(self):
+        """Test that SELECTs run in autocommit and a write opens a transaction."""
+        from unittest.mock import MagicMock
+        from app.database import PgConnectionWrapper
+
+        raw_conn = MagicMock(autocommit=True)
+        db = PgConnectionWrapper(raw_conn, pool=None)
+
+        db.execute("SELECT * FROM QMEL WHERE QMNUM = ?", ('1',))
+        db.commit()
+        assert raw_conn.autocommit is True
+        raw_conn.commit.assert_not_called()
+
+        db.execute("UPDATE QMEL SET QMTXT = ? WHERE QMNUM = ?", ('x', '1'))
+        assert raw_conn.autocommit is False
+        db.commit()
+        raw_conn.commit.assert_called_once()
+        assert raw_conn.autocommit is True
+
+    def test_locking_select_opens_transaction(self):
+        """Test that SELECT ... FOR UPDATE and CTEs are treated as writes."""
+        from app.database import _is_read_query
+
+        assert _is_read_query("  select 1")
+        assert _is_read_query("SHOW search_path")
+        assert _is_read_query("\n  show server_version")
+        assert not _is_read_query("SELECTED_ROWS")
+        assert not _is_read_query("")
+        assert not _is_read_query("SELECT * FROM t FOR UPDATE")
+        assert not _is_read_query("WITH x AS (DELETE FROM t RETURNING *) SELECT * FROM x")
@@ -0,0 +1,77 @@
+"""
+Unit tests for the orjson JSON provider.
+"""
+import pytest
+import sys
+import os
+import json
+from datetime import datetime
+
+from flask import Flask, jsonify, request
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+pytest.importorskip('orjson')
+
+from app.json_provider import OrjsonProvider, init_json_provider
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    init_json_provider(app)
+
+    @app.route('/echo', methods=['POST'])
+    def echo():
+        return jsonify(request.get_json())
+
+    return app
+
+
+class TestOrjsonProvider:
+    """Tests for compatibility with Flask's default provider."""
+
+    def test_provider_installed(self, app):
+        """Test that the app uses the orjson provider."""
+        assert isinstance(app.json, OrjsonProvider)
+
+    def test_matches_default_output(self, app):
+        """Test that dates and key order match the stdlib provider."""
+        payload = {'b': 1, 'a': datetime(2024, 1, 2, 3, 4, 5), 'c': 'Prüfung'}
+        with app.app_context():
+            assert json.loads(app.json.dumps(payload)) == json.loads(Flask(__name__).json.dumps(payload))
+            assert app.json.dumps(payload).index('"a"') < app.json.dumps(payload).index('"b"')
+
+    def test_dataclass_matches_default_output(self, app):
+        """Test that dataclasses are encoded like the stdlib provider does."""
+        from app.services.data_quality_service import QualityTrend
+
+        trend = QualityTrend(period='2024-W01', average_score=80.0, notification_count=2,
+                             completeness_avg=90.0, accuracy_avg=70.0, top_issues=['missing'])
+        with app.app_context():
+            assert json.loads(app.json.dumps([trend])) == json.loads(Flask(__name__).json.dumps([trend]))
+
+    def test_pydantic_model_encoded(self, app):
+        """Test that pydantic models are encoded from their model_dump()."""
+        from app.models import AnalysisResponse, ProblemDetail
+
+        result = AnalysisResponse(score=80, summary='ok', problems=[
+            ProblemDetail(description='Missing equipment', severity='Major')
+        ])
+        with app.app_context():
+            assert json.loads(app.json.dumps({'result': result})) == {'result': result.model_dump()}
+
+    def test_large_int_falls_back(self, app):
+        """Test that values orjson rejects are encoded by the stdlib."""
+        assert app.json.dumps({'n': 2 ** 70}) == '{"n":%d}' % 2 ** 70
+
+    def test_request_round_trip(self, app):
+        """Test that request bodies are parsed and responses encoded."""
+        response = app.test_client().post('/echo', json={'value': [1, 2, 3]})
+        assert response.status_code == 200
+        assert response.get_json() == {'value': [1, 2, 3]}
+
+    def test_invalid_body_is_bad_request(self, app):
+        """Test that malformed JSON still yields a 400."""
+        response = app.test_client().post('/echo', data='{bad', content_type='application/json')
+        assert response.status_code == 400
@@ -4,6 +4,7 @@ Integration tests for Quality Dashboard and Reliability Dashboard API endpoints.
 import pytest
 import json
 import os
+import re
 
 os.environ['DATABASE_TYPE'] = 'sqlite'
 os.environ['AUTH_ENABLED'] = 'false'
@@ -47,6 +48,123 @@ class TestQualityDashboardEndpoints:
         response = client.get('/api/quality/export')
         assert response.status_code == 200
 
+    def test_quality_dashboard_scores_each_notification_once(self, client):
+        """Test the dashboard reuses one score per notification across its metrics."""
+        from unittest.mock import patch
+        from app.main import _clear_summary_cache, _clear_notifications_cache
+        from app.services import data_quality_service
+
+        _clear_summary_cache()
+        _clear_notifications_cache()
+        notifications = [
+            {'NotificationId': '1', 'CreationDate': '2024-01-02'},
+            {'NotificationId': '2', 'CreationDate': '2024-01-10'},
+        ]
+        with patch('app.main.get_all_notifications_summary', return_value=notifications), \
+                patch('app.main.cached_notification_quality',
+                      wraps=data_quality_service.cached_notification_quality) as scorer, \
+                patch.object(data_quality_service, 'cached_notification_quality') as inner:
+            response = client.get('/api/quality/dashboard?include_samples=true')
+        assert response.status_code == 200
+        assert scorer.call_count == 2
+        inner.assert_not_called()
+        data = json.loads(response.data)
+        assert len(data['trends']) == 2
+        assert [s['notification_id'] for s in data['sample_scores']] == ['1', '2']
+        assert sum(data['summary']['score_distribution'].values()) == 2
+
+    def test_quality_dashboard_samples_opt_in(self, client):
+        """Test sample scores are only serialized when requested."""
+        from unittest.mock import patch
+        from app.main import _clear_summary_cache, _clear_notifications_cache
+
+        _clear_summary_cache()
+        _clear_notifications_cache()
+        notifications = [{'NotificationId': '1', 'CreationDate': '2024-01-02'}]
+        with patch('app.main.get_all_notifications_summary', return_value=notifications):
+            default = json.loads(client.get('/api/quality/dashboard').data)
+            samples = json.loads(client.get('/api/quality/dashboard?include_samples=true').data)
+        assert default['sample_scores'] == []
+        assert default['summary']['score_distribution'] == samples['summary']['score_distribution']
+        assert [s['notification_id'] for s in samples['sample_scores']] == ['1']
+
+    def test_quality_dashboard_response_cached(self, client):
+        """Test repeat dashboard requests reuse the serialized response until data changes."""
+        from unittest.mock import patch
+        from app.main import _clear_summary_cache, _clear_notifications_cache
+        from app.services.data_service import invalidate_notifications_cache
+
+        _clear_summary_cache()
+        _clear_notifications_cache()
+        with patch('app.main._build_quality_dashboard', return_value={'summary': {}}) as build:
+            first = client.get('/api/quality/dashboard')
+            second = client.get('/api/quality/dashboard', headers={'If-None-Match': first.headers['ETag']})
+            assert build.call_count == 1
+            assert second.status_code == 304
+
+            invalidate_notifications_cache()
+            client.get('/api/quality/dashboard')
+            assert build.call_count == 2
+
+    def test_quality_batch_and_trend_responses_cached(self, client):
+        """Test batch and trend statistics are computed once per data version."""
+        from unittest.mock import patch
+        from app.main import _clear_summary_cache, _clear_notifications_cache
+        from app.services.data_service import invalidate_notifications_cache
+
+        _clear_summary_cache()
+        _clear_notifications_cache()
+        notifications = [{'NotificationId': '1', 'CreationDate': '2024-01-02'}]
+        with patch('app.main.get_all_notifications_summary', return_value=notifications), \
+                patch('app.main.calculate_batch_quality', return_value={'count': 1}) as batch, \
+                patch('app.main.calculate_quality_trend', return_value=[]) as trend:
+            for _ in range(2):
+                assert client.get('/api/quality/batch').status_code == 200
+                assert client.get('/api/quality/trend?period=monthly').status_code == 200
+            assert batch.call_count == 1
+            assert trend.call_count == 1
+
+            client.get('/api/quality/trend?period=weekly')
+            assert trend.call_count == 2
+
+            invalidate_notifications_cache()
+            client.get('/api/quality/batch')
+            assert batch.call_count == 2
+
+    def test_quality_score_cached_by_content(self):
+        """Test identical notifications reuse a score and changed ones are rescored."""
+        from unittest.mock import patch
+        from app.services import data_quality_service
+
+        notification = {'NotificationId': 'CACHE00001', 'Description': 'Pump leak'}
+        with patch.object(data_quality_service, 'calculate_notification_quality',
+                          wraps=data_quality_service.calculate_notification_quality) as scorer:
+            first = data_quality_service.cached_notification_quality(notification)
+            second = data_quality_service.cached_notification_quality(dict(notification))
+            assert first is second
+            assert scorer.call_count == 1
+
+            data_quality_service.cached_notification_quality({**notification, 'Description': 'Pump leak fixed'})
+            assert scorer.call_count == 2
+
+    def test_quality_export_csv_streamed(self, client):
+        """Test the CSV export is streamed with one line per notification."""
+        from unittest.mock import patch
+        from app.main import _clear_summary_cache
+
+        _clear_summary_cache()
+        notifications = [{'NotificationId': '1'}, {'NotificationId': '2'}]
+        with patch('app.main.get_all_notifications_summary', return_value=notifications):
+            response = client.get('/api/quality/export')
+        assert response.status_code == 200
+        assert response.is_streamed
+        assert re.search(r'quality_report_\d{8}_\d{6}\.csv', response.headers['Content-Disposition'])
+        lines = response.get_data(as_text=True).strip().splitlines()
+        assert lines[0].startswith('notification_id,overall_score')
+        assert lines[0].endswith('alcoa_available,issue_count,recommendation_count')
+        assert len(lines) == 3
+        assert all(len(line.split(',')) == len(lines[0].split(',')) for line in lines)
+
 
 class TestReliabilityDashboardEndpoints:
     """Tests for reliability engineering endpoints."""
@@ -68,6 +186,208 @@ class TestReliabilityDashboardEndpoints:
         response = client.get('/api/reliability/fmea')
         assert response.status_code == 200
 
+    def test_reliability_equipment_all_metrics(self, client):
+        """Test the combined endpoint matches the per-metric endpoints."""
+        response = client.get('/api/reliability/equipment/EQ001/all')
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        for metric in ('mtbf', 'mttr', 'availability', 'score', 'predictive', 'weibull'):
+            single = json.loads(client.get(f'/api/reliability/equipment/EQ001/{metric}').data)
+            assert data[metric] == single
+
+    def test_reliability_dashboard_attention_required(self, client):
+        """Test only at-risk equipment is flagged, capped at ten entries."""
+        from unittest.mock import patch
+        from app.main import ReliabilityEngineeringService, _clear_notifications_cache
+
+        _clear_notifications_cache()
+        equipment = [
+            {'equipment_id': f'EQ{i:03d}', 'risk_level': risk,
+             'failure_probability': probability}
+            for i, (risk, probability) in enumerate(
+                [('low', 0.1), ('high', 0.2), ('low', 0.9)] * 8)
+        ]
+        with patch.object(ReliabilityEngineeringService, 'get_equipment_summary', return_value={
+                'total_equipment': len(equipment), 'average_reliability_score': 0,
+                'average_availability': 0, 'critical_risk_count': 0, 'high_risk_count': 0,
+                'equipment_summaries': equipment}):
+            response = client.get('/api/reliability/dashboard')
+        assert response.status_code == 200
+        attention = json.loads(response.data)['attention_required']
+        expected = [eq for eq in equipment if eq['risk_level'] != 'low' or eq['failure_probability'] > 0.5]
+        assert attention == expected[:10]
+
+    def test_reliability_dashboard_response_cached(self, client):
+        """Test repeat reliability dashboard requests get a 304 for a matching ETag."""
+        from unittest.mock import patch
+        from app.main import _clear_notifications_cache
+        from app.services.data_service import invalidate_notifications_cache
+
+        _clear_notifications_cache()
+        with patch('app.main._build_reliability_dashboard', return_value={'summary': {}}) as build:
+            first = client.get('/api/reliability/dashboard?period_days=90')
+            second = client.get('/api/reliability/dashboard?period_days=90',
+                                headers={'If-None-Match': first.headers['ETag']})
+            assert build.call_count == 1
+            assert second.status_code == 304
+
+            client.get('/api/reliability/dashboard?period_days=30')
+            assert build.call_count == 2
+
+            invalidate_notifications_cache()
+            client.get('/api/reliability/dashboard?period_days=90')
+            assert build.call_count == 3
+
+    def test_reliability_all_and_fmea_responses_cached(self, client):
+        """Test combined metrics and FMEA are computed once per data version."""
+        from unittest.mock import patch
+        from app.main import _clear_notifications_cache
+        from app.services.data_service import invalidate_notifications_cache
+
+        _clear_notifications_cache()
+        with patch('app.main._build_equipment_all_metrics', return_value={}) as all_metrics, \
+                patch('app.main._build_fmea_analysis', return_value={'fmea_items': []}) as fmea:
+            for _ in range(2):
+                assert client.get('/api/reliability/equipment/EQ001/all').status_code == 200
+                assert client.get('/api/reliability/fmea?limit=5').status_code == 200
+            client.get('/api/reliability/equipment/EQ002/all')
+            assert all_metrics.call_count == 2
+            assert fmea.call_count == 1
+
+            invalidate_notifications_cache()
+            client.get('/api/reliability/fmea?limit=5')
+            assert fmea.call_count == 2
+
+    def test_cached_responses_see_writes_from_other_workers(self, client):
+        """Test a data version bump committed elsewhere invalidates cached responses."""
+        from unittest.mock import patch
+        from app.database import get_db_connection
+        from app.main import _clear_notifications_cache
+
+        _clear_notifications_cache()
+        with patch('app.main._build_fmea_analysis', return_value={'fmea_items': []}) as fmea:
+            client.get('/api/reliability/fmea?limit=5')
+            # Simulates a notification write handled by a different worker process
+            with get_db_connection() as conn:
+                conn.execute("UPDATE data_version SET version = version + 1 WHERE name = 'notifications'")
+            client.get('/api/reliability/fmea?limit=5')
+            assert fmea.call_count == 2
+
+    def test_reliability_export_csv_streamed(self, client):
+        """Test the reliability CSV export is streamed with a fixed header."""
+        response = client.get('/api/reliability/export')
+        assert response.status_code == 200
+        assert response.is_streamed
+        text = response.get_data(as_text=True)
+        assert '\r' not in text
+        lines = text.split('\n')
+        assert lines[0] == ('equipment_id,reliability_score,availability_percent,'
+                            'risk_level,failure_probability,urgency,top_recommendation')
+
+    def test_reliability_invalid_period_is_bad_request(self, client):
+        """Test malformed integer query parameters return 400 instead of 500."""
+        for url in ('/api/reliability/equipment/EQ001/mtbf?period_days=abc',
+                    '/api/reliability/fmea?period_days=0',
+                    '/api/quality/batch?limit=-5'):
+            response = client.get(url)
+            assert response.status_code == 400
+            assert json.loads(response.data)['error']['code'] == 'BAD_REQUEST'
+
+    def test_reliability_period_days_clamped(self, client):
+        """Test oversized periods are clamped instead of overflowing the date maths."""
+        from app.main import MAX_PERIOD_DAYS
+
+        response = client.get('/api/reliability/equipment/EQ001/mtbf?period_days=999999999999')
+        assert response.status_code == 200
+        assert json.loads(response.data)['calculation_period_days'] == MAX_PERIOD_DAYS
+
+    def test_reliability_failures_loaded_once_per_list(self):
+        """Test failure events are only rebuilt when a different list is passed."""
+        from unittest.mock import patch
+        from app.services.reliability_engineering_service import ReliabilityEngineeringService
+
+        service = ReliabilityEngineeringService()
+        notifications = [{'NotificationId': '1', 'EquipmentNumber': 'EQ1'}]
+        with patch.object(service, '_determine_severity', wraps=service._determine_severity) as severity:
+            first = service.for_notifications(notifications)
+            assert service.for_notifications(notifications) is first
+            assert severity.call_count == 1
+
+            service.for_notifications(list(notifications))
+            assert severity.call_count == 2
+        assert first.failure_events[0].equipment_id == 'EQ1'
+        assert list(first.failures_by_equipment) == ['EQ1']
+
+    def test_reliability_snapshots_kept_per_list(self):
+        """Test alternating lists (e.g. languages) keep separate data without rebuilding."""
+        from unittest.mock import patch
+        from app.services.reliability_engineering_service import ReliabilityEngineeringService
+
+        service = ReliabilityEngineeringService()
+        english = [{'NotificationId': '1', 'EquipmentNumber': 'EQ-EN'}]
+        german = [{'NotificationId': '2', 'EquipmentNumber': 'EQ-DE'}]
+        with patch.object(service, '_determine_severity', wraps=service._determine_severity) as severity:
+            en_snapshot = service.for_notifications(english)
+            de_snapshot = service.for_notifications(german)
+            for _ in range(3):
+                assert service.for_notifications(english) is en_snapshot
+                assert service.for_notifications(german) is de_snapshot
+            assert severity.call_count == 2
+        # A snapshot handed to one request is not reloaded by another
+        assert list(en_snapshot.failures_by_equipment) == ['EQ-EN']
+        assert list(de_snapshot.failures_by_equipment) == ['EQ-DE']
+
+    def test_reliability_concurrent_load_rebuilds_once(self):
+        """Test threads passing the same new list share one rebuild."""
+        import threading
+        import time
+        from unittest.mock import patch
+        from app.services.reliability_engineering_service import ReliabilityEngineeringService
+
+        service = ReliabilityEngineeringService()
+        notifications = [{'NotificationId': '1', 'EquipmentNumber': 'EQ1'}]
+        original = service._determine_severity
+
+        def slow_severity(notif):
+            time.sleep(0.05)
+            return original(notif)
+
+        with patch.object(service, '_determine_severity', side_effect=slow_severity) as severity:
+            threads = [threading.Thread(target=service.for_notifications, args=(notifications,))
+                       for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert severity.call_count == 1
+
+    def test_reliability_summary_risk_counts(self):
+        """Test summary risk counts and FMEA occurrence totals match the per-item data."""
+        from datetime import datetime, timedelta
+        from app.services.reliability_engineering_service import ReliabilityEngineeringService
+
+        today = datetime.now()
+        notifications = [
+            {'NotificationId': str(i), 'EquipmentNumber': f'EQ{i % 3}',
+             'CreationDate': (today - timedelta(days=i * 5)).strftime('%Y-%m-%d'),
+             'Priority': str(1 + i % 4), 'DamageCode': ('LEAK', 'WEAR', 'UNKNOWN')[i % 3]}
+            for i in range(12)
+        ]
+        service = ReliabilityEngineeringService()
+        service.load_notifications_as_failures(notifications)
+
+        summary = service.get_equipment_summary(365)
+        levels = [eq['risk_level'] for eq in summary['equipment_summaries']]
+        assert summary['critical_risk_count'] == levels.count('critical')
+        assert summary['high_risk_count'] == levels.count('high')
+
+        # Occurrence rates are relative to every failure in the period, including UNKNOWN modes
+        fmea = service.perform_fmea_analysis(365)
+        assert sorted(item.failure_mode for item in fmea) == ['LEAK', 'WEAR']
+        for item in fmea:
+            assert item.occurrence_count == 4
+            assert item.occurrence == service._map_occurrence_to_rating(4 / 12, 4)
+
     def test_reliability_export_csv(self, client, db_with_data):
         """Test reliability CSV export."""
         response = client.get('/api/reliability/export')
@@ -93,6 +413,32 @@ class TestAuditEndpoints:
         assert response.status_code == 200
 
 
+    def test_audit_export_csv_rows(self, client):
+        """Test the audit CSV export writes one row per changed field."""
+        from datetime import datetime
+        from unittest.mock import patch
+        from app.main import get_change_document_service
+        from app.services.change_document_service import ChangeHistoryEntry
+
+        entry = ChangeHistoryEntry(
+            change_number='0000000001', timestamp=datetime(2024, 1, 2, 3, 4, 5),
+            user='alice', object_type='QMEL', object_id='10000001', change_type='U',
+            fields_changed=[
+                {'table': 'QMEL', 'field': 'PRIOK', 'old_value': '2', 'new_value': '1'},
+                {'table': 'QMEL', 'field': 'QMTXT', 'old_value': 'a,b', 'new_value': 'c'}
+            ]
+        )
+        service = get_change_document_service()
+        with patch.object(service, 'get_change_history', return_value=[entry]):
+            response = client.get('/api/audit/export')
+        assert response.status_code == 200
+        assert response.get_data(as_text=True).splitlines() == [
+            'change_number,timestamp,user,object_type,object_id,change_type,table,field,old_value,new_value',
+            '0000000001,2024-01-02T03:04:05,alice,QMEL,10000001,U,QMEL,PRIOK,2,1',
+            '0000000001,2024-01-02T03:04:05,alice,QMEL,10000001,U,QMEL,QMTXT,"a,b",c'
+        ]
+
+
 class TestAlertEndpoints:
     """Tests for alert management endpoints."""
 
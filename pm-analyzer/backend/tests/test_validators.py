@@ -77,6 +77,11 @@ class TestValidateLanguage:
         assert is_valid is False
         assert 'must be one of' in error.lower()
 
+    def test_invalid_language_message_is_stable(self):
+        """Test the error lists the allowed languages in a fixed order."""
+        is_valid, error = validate_language('fr')
+        assert error.endswith(', '.join(sorted(ALLOWED_LANGUAGES)))
+
 
 class TestValidateTextField:
     """Tests for validate_text_field function."""
@@ -126,29 +126,12 @@ sap.ui.define([
             BusyIndicator.show(0);
 
             try {
-                // Fetch detailed equipment metrics in parallel
-                var [mtbfResponse, mttrResponse, availabilityResponse, predictiveResponse, weibullResponse] = await Promise.all([
-                    fetch("/api/reliability/equipment/" + encodeURIComponent(sEquipmentId) + "/mtbf?period_days=" + sPeriod),
-                    fetch("/api/reliability/equipment/" + encodeURIComponent(sEquipmentId) + "/mttr?period_days=" + sPeriod),
-                    fetch("/api/reliability/equipment/" + encodeURIComponent(sEquipmentId) + "/availability?period_days=" + sPeriod),
-                    fetch("/api/reliability/equipment/" + encodeURIComponent(sEquipmentId) + "/predictive?period_days=" + sPeriod),
-                    fetch("/api/reliability/equipment/" + encodeURIComponent(sEquipmentId) + "/weibull?period_days=" + sPeriod)
-                ]);
-
-                var mtbfData = await mtbfResponse.json();
-                var mttrData = await mttrResponse.json();
-                var availabilityData = await availabilityResponse.json();
-                var predictiveData = await predictiveResponse.json();
-                var weibullData = await weibullResponse.json();
+                // Fetch all equipment metrics in one request
+                var response = await fetch("/api/reliability/equipment/" + encodeURIComponent(sEquipmentId) + "/all?period_days=" + sPeriod);
+                var data = await response.json();
 
                 // Create and show dialog with equipment details
-                this._createEquipmentDialog(sEquipmentId, {
-                    mtbf: mtbfData,
-                    mttr: mttrData,
-                    availability: availabilityData,
-                    predictive: predictiveData,
-                    weibull: weibullData
-                });
+                this._createEquipmentDialog(sEquipmentId, data);
 
             } catch (error) {
                 MessageBox.error("Failed to load equipment details: " + error.message);